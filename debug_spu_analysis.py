@@ -3,14 +3,16 @@ Debug script to analyze SPU data from Friends and Ellen DVDs.
 This will help us understand why SPU extraction fails for Friends but works for Ellen.
 """
 from pathlib import Path
+import mmap
 import sys
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from dvdmenu_extract.util.libdvdread_spu import (
-    iter_spu_packets, 
     decode_spu_bitmap, 
     bitmap_connected_components,
+    count_non_zero_pixels,
     parse_spu_control,
+    reassemble_spu_packets,
 )
 from dvdmenu_extract.util.libdvdread_compat import read_u16
 
@@ -22,48 +24,21 @@ def analyze_vob_spu(vob_path: Path, name: str):
     print(f"Size: {vob_path.stat().st_size:,} bytes")
     print(f"{'='*80}\n")
     
-    # Read VOB data
-    with vob_path.open("rb") as f:
-        vob_data = f.read()
-    
-    print(f"Read {len(vob_data):,} bytes from VOB\n")
-    
-    # Reassemble SPU packets
-    def reassemble_spu_packets(vob_data: bytes):
-        """Reassemble fragmented SPU packets."""
-        buffers = {}
-        expected_sizes = {}
-        
-        for substream_id, payload in iter_spu_packets(vob_data):
-            if substream_id not in buffers:
-                buffers[substream_id] = bytearray()
-            
-            buffers[substream_id].extend(payload)
-            buffer = buffers[substream_id]
-            
-            if (substream_id not in expected_sizes or expected_sizes[substream_id] == 0) and len(buffer) >= 2:
-                size = read_u16(buffer, 0)
-                expected_sizes[substream_id] = size if size > 0 else 0
-            
-            expected = expected_sizes.get(substream_id, 0)
-            
-            while expected > 0 and len(buffer) >= expected:
-                packet = bytes(buffer[:expected])
-                buffers[substream_id] = bytearray(buffer[expected:])
-                buffer = buffers[substream_id]
-                
-                yield (substream_id, packet)
-                
-                if len(buffer) >= 2:
-                    expected_sizes[substream_id] = read_u16(buffer, 0)
-                else:
-                    expected_sizes[substream_id] = 0
-                
-                expected = expected_sizes.get(substream_id, 0)
-    
-    # Analyze packets
+    # Memory-map the VOB so pages are faulted in on demand instead of
+    # copying the whole file into one bytes object.
+    with vob_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as vob_data:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            vob_data.madvise(mmap.MADV_SEQUENTIAL)
+        print(f"Mapped {len(vob_data):,} bytes from VOB\n")
+        _analyze_spu_stream(vob_data)
+
+
+def _analyze_spu_stream(vob_data) -> None:
+    """Reassemble and report every SPU packet in a (mapped) VOB buffer."""
     packet_count = 0
     total_buttons = 0
+    # Bitmaps are not kept across packets, so decode into one reused buffer.
+    scratch_rows: list[bytearray] = []
     
     for substream_id, packet in reassemble_spu_packets(vob_data):
         packet_count += 1
@@ -98,7 +73,7 @@ def analyze_vob_spu(vob_path: Path, name: str):
             print(f"  Is menu: {control.is_menu}")
             
             # Decode bitmap
-            bitmap_result = decode_spu_bitmap(packet, control)
+            bitmap_result = decode_spu_bitmap(packet, control, out=scratch_rows)
             if not bitmap_result:
                 print(f"  ERROR: Failed to decode SPU bitmap\n")
                 continue
@@ -106,8 +81,8 @@ def analyze_vob_spu(vob_path: Path, name: str):
             width, height = bitmap_result.width, bitmap_result.height
             print(f"  Bitmap decoded: {width}x{height}")
             
-            # Count non-zero pixels (bitmap_result.pixels is list[list[int]])
-            non_zero = sum(1 for row in bitmap_result.pixels for p in row if p != 0)
+            # Count non-zero pixels
+            non_zero = count_non_zero_pixels(bitmap_result)
             total_pixels = width * height
             print(f"  Non-zero pixels: {non_zero:,} ({non_zero/total_pixels*100:.1f}%)")
             
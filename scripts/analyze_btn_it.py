@@ -5,123 +5,240 @@ This script scans VOB files for NAV packs and extracts complete button
 information including navigation links and VM commands.
 """
 
+import mmap
+import re
+import struct
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+NAV_PACK_SIZE = 2048
+NAV_PACK_MARKER = b"\x00\x00\x01\xbf"
+NAV_PACK_MARKER_RE = re.compile(re.escape(NAV_PACK_MARKER))
+# find_nav_packs slices every pack at its marker, so PCI data always starts
+# after the 4-byte marker, 2-byte length and 1-byte substream id.
+PCI_START = 4 + 2 + 1
+# PCI highlight header: HLI_SS (0x60), BTN_MD (0x6E), BTN_SN (0x70), BTN_NS (0x71)
+PCI_HLI_HEADER = struct.Struct(">H12xHBB")
+BTN_IT_ENTRY_SIZE = 18
+BTN_IT_ENTRY_COUNT = 36
 
-from dvdmenu_extract.util.libdvdread_compat import read_u16
+
+@dataclass(slots=True, frozen=True)
+class BtnEntry:
+    """One decoded BTN_IT slot; zero links/commands mean "not set"."""
+    index: int
+    x1: int
+    y1: int
+    x2: int
+    y2: int
+    up: int
+    down: int
+    left: int
+    right: int
+    cmd_up: int
+    cmd_down: int
+    cmd_left: int
+    cmd_right: int
+
+    @property
+    def rect(self) -> tuple[int, int, int, int] | None:
+        if self.x2 > self.x1 and self.y2 > self.y1:
+            return (self.x1, self.y1, self.x2, self.y2)
+        return None
+
+    @property
+    def nav_links(self) -> dict[str, int | None]:
+        return {
+            "up": self.up or None,
+            "down": self.down or None,
+            "left": self.left or None,
+            "right": self.right or None,
+        }
+
+    @property
+    def vm_commands(self) -> dict[str, int | None]:
+        return {
+            "up": self.cmd_up or None,
+            "down": self.cmd_down or None,
+            "left": self.cmd_left or None,
+            "right": self.cmd_right or None,
+        }
 
 
 def find_nav_packs(vob_path: Path) -> list[bytes]:
-    """Find all NAV packs in a VOB file."""
+    """Find all NAV packs in a VOB file.
+
+    The VOB is memory-mapped rather than read whole, so only the 2 KiB packs
+    that are sliced out get materialized.
+    """
     nav_packs = []
-    with open(vob_path, "rb") as f:
-        data = f.read()
-    
-    # Search for NAV pack marker (0x000001bf)
-    offset = 0
-    while True:
-        marker = data.find(b"\x00\x00\x01\xbf", offset)
-        if marker < 0:
-            break
+    if vob_path.stat().st_size == 0:
+        return nav_packs
+    with open(vob_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            data.madvise(mmap.MADV_SEQUENTIAL)
         
-        # NAV packs are 2048 bytes
-        if marker + 2048 <= len(data):
-            nav_packs.append(data[marker:marker + 2048])
-        offset = marker + 1
+        # Search for NAV pack marker (0x000001bf) in a single regex pass.
+        # A sector holds at most one NAV pack, so the second marker in the
+        # sector of one we already took (the DSI packet) is skipped.
+        next_offset = 0
+        for match in NAV_PACK_MARKER_RE.finditer(data):
+            marker = match.start()
+            if marker < next_offset:
+                continue
+            if marker + NAV_PACK_SIZE > len(data):
+                break
+            nav_packs.append(data[marker:marker + NAV_PACK_SIZE])
+            # Skip the rest of this sector only: a marker that is really
+            # payload of a video/audio pack must not hide a NAV pack that
+            # starts in the next sector.
+            next_offset = (marker // NAV_PACK_SIZE + 1) * NAV_PACK_SIZE
     
     return nav_packs
 
 
-def parse_btn_it_entry(entry: bytes) -> dict:
-    """Parse a single BTN_IT entry (18 bytes)."""
-    if len(entry) < 18:
-        return {}
-    
+def parse_btn_it_table(btn_it: bytes) -> list[BtnEntry]:
+    """Parse all BTN_IT entries (36 x 18 bytes) column by column.
+
+    Each of the 18 byte columns is pulled out with one strided slice, so the
+    bit arithmetic runs over whole columns instead of re-indexing every entry.
+    Only slots that carry a rect, nav link or VM command are returned.
+    """
+    cols = [btn_it[c::BTN_IT_ENTRY_SIZE] for c in range(BTN_IT_ENTRY_SIZE)]
+    if len(cols[-1]) < BTN_IT_ENTRY_COUNT:
+        return []
+
     # Bytes 0-5: Button rectangle
-    b0, b1, b2, b3, b4, b5 = entry[0:6]
-    x1 = ((b0 & 0x3F) << 4) | (b1 >> 4)
-    x2 = ((b1 & 0x03) << 8) | b2
-    y1 = ((b3 & 0x3F) << 4) | (b4 >> 4)
-    y2 = ((b4 & 0x03) << 8) | b5
-    
+    x1s = [((b0 & 0x3F) << 4) | (b1 >> 4) for b0, b1 in zip(cols[0], cols[1])]
+    x2s = [((b1 & 0x03) << 8) | b2 for b1, b2 in zip(cols[1], cols[2])]
+    y1s = [((b3 & 0x3F) << 4) | (b4 >> 4) for b3, b4 in zip(cols[3], cols[4])]
+    y2s = [((b4 & 0x03) << 8) | b5 for b4, b5 in zip(cols[4], cols[5])]
+
     # Bytes 6-9: Navigation links (button indices 1-36)
-    up = entry[6] & 0x3F
-    down = entry[7] & 0x3F
-    left = entry[8] & 0x3F
-    right = entry[9] & 0x3F
-    
+    ups, downs, lefts, rights = ([b & 0x3F for b in cols[c]] for c in range(6, 10))
+
     # Bytes 10-17: VM commands for each navigation direction
     # Each command is 2 bytes (8 bytes total for up/down/left/right)
-    cmd_up = (entry[10] << 8) | entry[11]
-    cmd_down = (entry[12] << 8) | entry[13]
-    cmd_left = (entry[14] << 8) | entry[15]
-    cmd_right = (entry[16] << 8) | entry[17]
-    
-    return {
-        "rect": (x1, y1, x2, y2) if x2 > x1 and y2 > y1 else None,
-        "nav_links": {
-            "up": up if up > 0 else None,
-            "down": down if down > 0 else None,
-            "left": left if left > 0 else None,
-            "right": right if right > 0 else None,
-        },
-        "vm_commands": {
-            "up": f"0x{cmd_up:04X}" if cmd_up != 0 else None,
-            "down": f"0x{cmd_down:04X}" if cmd_down != 0 else None,
-            "left": f"0x{cmd_left:04X}" if cmd_left != 0 else None,
-            "right": f"0x{cmd_right:04X}" if cmd_right != 0 else None,
-        },
-    }
+    cmd_ups, cmd_downs, cmd_lefts, cmd_rights = (
+        [(hi << 8) | lo for hi, lo in zip(cols[c], cols[c + 1])]
+        for c in range(10, 18, 2)
+    )
+
+    buttons = []
+    for i, fields in enumerate(
+        zip(x1s, y1s, x2s, y2s, ups, downs, lefts, rights,
+            cmd_ups, cmd_downs, cmd_lefts, cmd_rights),
+        start=1,
+    ):
+        x1, y1, x2, y2 = fields[:4]
+        # Include button if it has rect, nav links, OR VM commands
+        if (x2 > x1 and y2 > y1) or any(fields[4:]):
+            buttons.append(BtnEntry(i, *fields))
+    return buttons
 
 
-def analyze_nav_pack(nav_pack: bytes) -> dict | None:
+def analyze_nav_pack(nav_pack: bytes, pci_start: int = PCI_START) -> dict | None:
     """Analyze BTN_IT table in a NAV pack."""
-    # Find PCI packet within NAV pack
-    marker = nav_pack.find(b"\x00\x00\x01\xbf")
-    if marker < 0:
-        return None
-    
-    pci_start = marker + 4 + 2 + 1
-    if pci_start + 0x0bb + (36 * 18) > len(nav_pack):
+    assert nav_pack[:4] == NAV_PACK_MARKER, "NAV pack must start at its marker"
+    if pci_start + 0x0bb + (BTN_IT_ENTRY_COUNT * BTN_IT_ENTRY_SIZE) > len(nav_pack):
         return None
     
     # Parse button metadata
-    hli_ss = read_u16(nav_pack, pci_start + 0x60)  # Highlight status
-    btn_md = read_u16(nav_pack, pci_start + 0x6E)  # Button mode
-    btn_sn = nav_pack[pci_start + 0x70]  # Start button number
-    btn_ns = nav_pack[pci_start + 0x71]  # Number of buttons
+    # Highlight status, button mode, start button number, number of buttons
+    hli_ss, btn_md, btn_sn, btn_ns = PCI_HLI_HEADER.unpack_from(nav_pack, pci_start + 0x60)
     
     if btn_ns == 0:
         return None
     
     # Parse BTN_IT table (36 entries × 18 bytes each)
     btn_it_start = pci_start + 0x0bb
-    buttons = []
-    
-    for i in range(36):
-        entry = nav_pack[btn_it_start + (i * 18) : btn_it_start + ((i + 1) * 18)]
-        btn_data = parse_btn_it_entry(entry)
-        # Include button if it has rect, nav links, OR VM commands
-        has_data = (
-            btn_data.get("rect") or 
-            any(btn_data.get("nav_links", {}).values()) or
-            any(btn_data.get("vm_commands", {}).values())
-        )
-        if has_data:
-            btn_data["index"] = i + 1
-            buttons.append(btn_data)
+    buttons = parse_btn_it_table(
+        nav_pack[btn_it_start : btn_it_start + BTN_IT_ENTRY_COUNT * BTN_IT_ENTRY_SIZE]
+    )
     
     return {
-        "hli_ss": f"0x{hli_ss:04X}",
-        "btn_md": f"0x{btn_md:04X}",
+        "hli_ss": hli_ss,
+        "btn_md": btn_md,
         "btn_sn": btn_sn,
         "btn_ns": btn_ns,
         "buttons": buttons,
     }
 
 
+def analyze_vob(vob_path: Path) -> str:
+    """Analyze one VOB and return its report text.
+
+    VOBs are independent, so main() runs this in worker processes and
+    writes each report once it is done.
+    """
+    lines = []
+    emit = lines.append
+    emit(f"\n{'='*70}")
+    emit(f"Analyzing: {vob_path.name}")
+    emit(f"{'='*70}\n")
+    
+    nav_packs = find_nav_packs(vob_path)
+    emit(f"Found {len(nav_packs)} NAV packs")
+    
+    button_tables = []
+    for i, nav_pack in enumerate(nav_packs):
+        result = analyze_nav_pack(nav_pack)
+        if result and result["buttons"]:
+            button_tables.append((i, result))
+    
+    if not button_tables:
+        emit("No button tables found in this VOB\n")
+        return "\n".join(lines) + "\n"
+    
+    emit(f"Found {len(button_tables)} NAV packs with button data\n")
+    
+    # Show details of all unique button configurations
+    seen_configs = set()
+    for nav_idx, data in button_tables:  # Show all
+        config_key = (data["btn_ns"], tuple(
+            (b.index, b.rect, (b.up, b.down, b.left, b.right))
+            for b in data["buttons"]
+        ))
+        if config_key in seen_configs:
+            continue
+        seen_configs.add(config_key)
+        
+        emit(f"NAV Pack #{nav_idx}:")
+        emit(f"  HLI_SS: 0x{data['hli_ss']:04X} (highlight status)")
+        emit(f"  BTN_MD: 0x{data['btn_md']:04X} (button mode)")
+        emit(f"  Start Button: {data['btn_sn']}, Count: {data['btn_ns']}")
+        emit(f"  Total Button Entries: {len(data['buttons'])}\n")
+        
+        # Group buttons by whether they have rects
+        with_rects = [b for b in data["buttons"] if b.rect]
+        without_rects = [b for b in data["buttons"] if not b.rect]
+        
+        if with_rects:
+            emit(f"  Buttons with Rectangles ({len(with_rects)}):")
+            for btn in with_rects:
+                x1, y1, x2, y2 = btn.rect
+                emit(f"    Button {btn.index}: ({x1}, {y1}, {x2}, {y2}) [{x2-x1}x{y2-y1}]")
+                emit(f"      Nav: {btn.nav_links}")
+                vm_cmds = {k: f"0x{v:04X}" for k, v in btn.vm_commands.items() if v}
+                if vm_cmds:
+                    emit(f"      VM: {vm_cmds}")
+            emit("")
+        
+        if without_rects:
+            emit(f"  Buttons without Rectangles ({len(without_rects)}):")
+            for btn in without_rects:
+                emit(f"    Button {btn.index}:")
+                emit(f"      Nav: {btn.nav_links}")
+                vm_cmds = {k: f"0x{v:04X}" for k, v in btn.vm_commands.items() if v}
+                if vm_cmds:
+                    emit(f"      VM: {vm_cmds}")
+            emit("")
+    
+    return "\n".join(lines) + "\n"
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: analyze_btn_it.py <VIDEO_TS_DIR>")
@@ -135,67 +252,10 @@ def main():
     # Check all VOB files
     vob_files = sorted(video_ts.glob("*.VOB"))
     
-    for vob_path in vob_files:
-        print(f"\n{'='*70}")
-        print(f"Analyzing: {vob_path.name}")
-        print(f"{'='*70}\n")
-        
-        nav_packs = find_nav_packs(vob_path)
-        print(f"Found {len(nav_packs)} NAV packs")
-        
-        button_tables = []
-        for i, nav_pack in enumerate(nav_packs):
-            result = analyze_nav_pack(nav_pack)
-            if result and result["buttons"]:
-                button_tables.append((i, result))
-        
-        if not button_tables:
-            print("No button tables found in this VOB\n")
-            continue
-        
-        print(f"Found {len(button_tables)} NAV packs with button data\n")
-        
-        # Show details of all unique button configurations
-        seen_configs = set()
-        for nav_idx, data in button_tables:  # Show all
-            config_key = (data["btn_ns"], tuple(
-                (b["index"], b["rect"], tuple(b["nav_links"].items()))
-                for b in data["buttons"]
-            ))
-            if config_key in seen_configs:
-                continue
-            seen_configs.add(config_key)
-            
-            print(f"NAV Pack #{nav_idx}:")
-            print(f"  HLI_SS: {data['hli_ss']} (highlight status)")
-            print(f"  BTN_MD: {data['btn_md']} (button mode)")
-            print(f"  Start Button: {data['btn_sn']}, Count: {data['btn_ns']}")
-            print(f"  Total Button Entries: {len(data['buttons'])}\n")
-            
-            # Group buttons by whether they have rects
-            with_rects = [b for b in data["buttons"] if b["rect"]]
-            without_rects = [b for b in data["buttons"] if not b["rect"]]
-            
-            if with_rects:
-                print(f"  Buttons with Rectangles ({len(with_rects)}):")
-                for btn in with_rects:
-                    x1, y1, x2, y2 = btn["rect"]
-                    print(f"    Button {btn['index']}: ({x1}, {y1}, {x2}, {y2}) [{x2-x1}x{y2-y1}]")
-                    print(f"      Nav: {btn['nav_links']}")
-                    vm_cmds = {k: v for k, v in btn["vm_commands"].items() if v}
-                    if vm_cmds:
-                        print(f"      VM: {vm_cmds}")
-                print()
-            
-            if without_rects:
-                print(f"  Buttons without Rectangles ({len(without_rects)}):")
-                for btn in without_rects:
-                    print(f"    Button {btn['index']}:")
-                    print(f"      Nav: {btn['nav_links']}")
-                    vm_cmds = {k: v for k, v in btn["vm_commands"].items() if v}
-                    if vm_cmds:
-                        print(f"      VM: {vm_cmds}")
-                print()
+    # Analyze VOBs in parallel; map() keeps the reports in file order
+    with ProcessPoolExecutor() as executor:
+        for report in executor.map(analyze_vob, vob_files):
+            sys.stdout.write(report)
 
 
 if __name__ == "__main__":
@@ -1,47 +1,111 @@
 #!/usr/bin/env python3
 """Comprehensive BTN_IT analysis showing all 36 button slots."""
 
+import mmap
+import re
+import struct
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+NAV_PACK_SIZE = 2048
+NAV_PACK_MARKER = b"\x00\x00\x01\xbf"
+NAV_PACK_MARKER_RE = re.compile(re.escape(NAV_PACK_MARKER))
+# find_nav_packs slices every pack at its marker, so PCI data always starts
+# after the 4-byte marker, 2-byte length and 1-byte substream id.
+PCI_START = 4 + 2 + 1
+# PCI highlight header: HLI_SS (0x60), BTN_MD (0x6E), BTN_SN (0x70), BTN_NS (0x71)
+PCI_HLI_HEADER = struct.Struct(">H12xHBB")
+BTN_NS_OFFSET = PCI_START + 0x71
+BTN_IT_ENTRY_SIZE = 18
+BTN_IT_ENTRY_COUNT = 36
+# HLI header through the end of BTN_IT
+HLI_BLOCK = slice(
+    PCI_START + 0x60, PCI_START + 0x0bb + BTN_IT_ENTRY_COUNT * BTN_IT_ENTRY_SIZE
+)
 
-from dvdmenu_extract.util.libdvdread_compat import read_u16
+
+@dataclass(slots=True, frozen=True)
+class BtnEntry:
+    """One decoded BTN_IT slot; zero links/commands mean "not set"."""
+    index: int
+    x1: int
+    y1: int
+    x2: int
+    y2: int
+    up: int
+    down: int
+    left: int
+    right: int
+    cmd_up: int
+    cmd_down: int
+    cmd_left: int
+    cmd_right: int
+    active: bool
+
+    @property
+    def rect(self) -> tuple[int, int, int, int] | None:
+        if self.x2 > self.x1 and self.y2 > self.y1:
+            return (self.x1, self.y1, self.x2, self.y2)
+        return None
+
+    @property
+    def nav(self) -> dict[str, int | None]:
+        return {
+            "up": self.up or None,
+            "down": self.down or None,
+            "left": self.left or None,
+            "right": self.right or None,
+        }
+
+    @property
+    def vm(self) -> dict[str, int | None]:
+        return {
+            "up": self.cmd_up or None,
+            "down": self.cmd_down or None,
+            "left": self.cmd_left or None,
+            "right": self.cmd_right or None,
+        }
 
 
 def find_nav_packs(vob_path: Path) -> list[bytes]:
-    """Find all NAV packs in a VOB file."""
+    """Find all NAV packs in a VOB file.
+
+    The VOB is memory-mapped rather than read whole, so only the 2 KiB packs
+    that are sliced out get materialized.
+    """
     nav_packs = []
-    with open(vob_path, "rb") as f:
-        data = f.read()
-    
-    offset = 0
-    while True:
-        marker = data.find(b"\x00\x00\x01\xbf", offset)
-        if marker < 0:
-            break
-        if marker + 2048 <= len(data):
-            nav_packs.append(data[marker:marker + 2048])
-        offset = marker + 1
+    if vob_path.stat().st_size == 0:
+        return nav_packs
+    with open(vob_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            data.madvise(mmap.MADV_SEQUENTIAL)
+        
+        next_offset = 0
+        for match in NAV_PACK_MARKER_RE.finditer(data):
+            marker = match.start()
+            if marker < next_offset:
+                continue
+            if marker + NAV_PACK_SIZE > len(data):
+                break
+            nav_packs.append(data[marker:marker + NAV_PACK_SIZE])
+            # Skip the rest of this sector only: a marker that is really
+            # payload of a video/audio pack must not hide a NAV pack that
+            # starts in the next sector.
+            next_offset = (marker // NAV_PACK_SIZE + 1) * NAV_PACK_SIZE
     
     return nav_packs
 
 
-def analyze_full_btn_it(nav_pack: bytes) -> dict | None:
+def analyze_full_btn_it(nav_pack: bytes, pci_start: int = PCI_START) -> dict | None:
     """Analyze complete BTN_IT table showing all 36 slots."""
-    marker = nav_pack.find(b"\x00\x00\x01\xbf")
-    if marker < 0:
-        return None
-    
-    pci_start = marker + 4 + 2 + 1
-    if pci_start + 0x0bb + (36 * 18) > len(nav_pack):
+    assert nav_pack[:4] == NAV_PACK_MARKER, "NAV pack must start at its marker"
+    if pci_start + 0x0bb + (BTN_IT_ENTRY_COUNT * BTN_IT_ENTRY_SIZE) > len(nav_pack):
         return None
     
     # Parse button metadata
-    hli_ss = read_u16(nav_pack, pci_start + 0x60)
-    btn_md = read_u16(nav_pack, pci_start + 0x6E)
-    btn_sn = nav_pack[pci_start + 0x70]  # Start button number (1-based)
-    btn_ns = nav_pack[pci_start + 0x71]  # Number of buttons
+    # btn_sn: start button number (1-based), btn_ns: number of buttons
+    hli_ss, btn_md, btn_sn, btn_ns = PCI_HLI_HEADER.unpack_from(nav_pack, pci_start + 0x60)
     
     if btn_ns == 0:
         return None
@@ -50,67 +114,51 @@ def analyze_full_btn_it(nav_pack: bytes) -> dict | None:
     start_idx = btn_sn if btn_sn > 0 else 1
     active_indices = set(range(start_idx, min(start_idx + btn_ns, 37)))
     
-    # Parse all 36 BTN_IT entries
+    # Parse all 36 BTN_IT entries, one strided slice per byte column
     btn_it_start = pci_start + 0x0bb
-    all_buttons = []
-    
-    for i in range(36):
-        entry_start = btn_it_start + (i * 18)
-        entry = nav_pack[entry_start : entry_start + 18]
-        
-        if len(entry) < 18:
-            continue
-        
-        # Parse rectangle
-        b0, b1, b2, b3, b4, b5 = entry[0:6]
-        x1 = ((b0 & 0x3F) << 4) | (b1 >> 4)
-        x2 = ((b1 & 0x03) << 8) | b2
-        y1 = ((b3 & 0x3F) << 4) | (b4 >> 4)
-        y2 = ((b4 & 0x03) << 8) | b5
-        rect = (x1, y1, x2, y2) if (x2 > x1 and y2 > y1) else None
-        
-        # Parse navigation links
-        up = entry[6] & 0x3F
-        down = entry[7] & 0x3F
-        left = entry[8] & 0x3F
-        right = entry[9] & 0x3F
-        
-        # Parse VM commands
-        cmd_up = (entry[10] << 8) | entry[11]
-        cmd_down = (entry[12] << 8) | entry[13]
-        cmd_left = (entry[14] << 8) | entry[15]
-        cmd_right = (entry[16] << 8) | entry[17]
-        
-        # Determine if this slot has any data
-        has_data = (
-            rect or
-            up > 0 or down > 0 or left > 0 or right > 0 or
-            cmd_up > 0 or cmd_down > 0 or cmd_left > 0 or cmd_right > 0
-        )
-        
-        if has_data:
-            btn_idx = i + 1
-            all_buttons.append({
-                "index": btn_idx,
-                "active": btn_idx in active_indices,
-                "rect": rect,
-                "nav": {"up": up or None, "down": down or None, "left": left or None, "right": right or None},
-                "vm": {
-                    "up": f"0x{cmd_up:04X}" if cmd_up else None,
-                    "down": f"0x{cmd_down:04X}" if cmd_down else None,
-                    "left": f"0x{cmd_left:04X}" if cmd_left else None,
-                    "right": f"0x{cmd_right:04X}" if cmd_right else None,
-                },
-            })
-    
-    return {
-        "hli_ss": f"0x{hli_ss:04X}",
-        "btn_md": f"0x{btn_md:04X}",
+    btn_it = nav_pack[btn_it_start : btn_it_start + BTN_IT_ENTRY_COUNT * BTN_IT_ENTRY_SIZE]
+    result = {
+        "hli_ss": hli_ss,
+        "btn_md": btn_md,
         "btn_sn": btn_sn,
         "btn_ns": btn_ns,
         "active_range": f"{start_idx}-{start_idx + btn_ns - 1}" if btn_ns > 0 else "none",
-        "buttons": all_buttons,
+        "buttons": [],
     }
+    # An all-zero table has no slots with data; skip the column parse
+    if btn_it.count(0) == len(btn_it):
+        return result
+    
+    cols = [btn_it[c::BTN_IT_ENTRY_SIZE] for c in range(BTN_IT_ENTRY_SIZE)]
+    
+    # Parse rectangles
+    x1s = [((b0 & 0x3F) << 4) | (b1 >> 4) for b0, b1 in zip(cols[0], cols[1])]
+    x2s = [((b1 & 0x03) << 8) | b2 for b1, b2 in zip(cols[1], cols[2])]
+    y1s = [((b3 & 0x3F) << 4) | (b4 >> 4) for b3, b4 in zip(cols[3], cols[4])]
+    y2s = [((b4 & 0x03) << 8) | b5 for b4, b5 in zip(cols[4], cols[5])]
+    
+    # Parse navigation links
+    ups, downs, lefts, rights = ([b & 0x3F for b in cols[c]] for c in range(6, 10))
+    
+    # Parse VM commands
+    cmd_ups, cmd_downs, cmd_lefts, cmd_rights = (
+        [(hi << 8) | lo for hi, lo in zip(cols[c], cols[c + 1])]
+        for c in range(10, 18, 2)
+    )
+    
+    all_buttons = result["buttons"]
+    for i, fields in enumerate(
+        zip(x1s, y1s, x2s, y2s, ups, downs, lefts, rights,
+            cmd_ups, cmd_downs, cmd_lefts, cmd_rights),
+        start=1,
+    ):
+        x1, y1, x2, y2 = fields[:4]
+        # Determine if this slot has any data
+        has_data = (x2 > x1 and y2 > y1) or any(fields[4:])
+        if has_data:
+            all_buttons.append(BtnEntry(i, *fields, active=i in active_indices))
+    
+    return result
 
 
 def main():
@@ -130,7 +178,18 @@ def main():
     
     # Analyze unique button configurations
     seen_configs = set()
+    # Consecutive NAV packs of one menu page repeat the same highlight info,
+    # so each distinct HLI header + BTN_IT block is only parsed once.
+    seen_hli_blocks = set()
     for nav_idx, nav_pack in enumerate(nav_packs):
+        # Most NAV packs carry no buttons; test BTN_NS before slicing anything
+        if nav_pack[BTN_NS_OFFSET] == 0:
+            continue
+        hli_block = nav_pack[HLI_BLOCK]
+        if hli_block in seen_hli_blocks:
+            continue
+        seen_hli_blocks.add(hli_block)
+        
         result = analyze_full_btn_it(nav_pack)
         if not result or not result["buttons"]:
             continue
@@ -139,57 +198,62 @@ def main():
         config_sig = (
             result["btn_ns"],
             result["active_range"],
-            tuple((b["index"], b["active"], b["rect"] is not None) for b in result["buttons"])
+            tuple((b.index, b.active, b.rect is not None) for b in result["buttons"])
         )
         
         if config_sig in seen_configs:
             continue
         seen_configs.add(config_sig)
         
-        print(f"{'='*70}")
-        print(f"NAV Pack #{nav_idx} - Button Configuration")
-        print(f"{'='*70}")
-        print(f"HLI_SS: {result['hli_ss']}, BTN_MD: {result['btn_md']}")
-        print(f"Active Buttons: {result['btn_ns']} (indices {result['active_range']})")
-        print(f"Total Non-Empty Slots: {len(result['buttons'])}\n")
+        lines = []
+        emit = lines.append
+        emit(f"{'='*70}")
+        emit(f"NAV Pack #{nav_idx} - Button Configuration")
+        emit(f"{'='*70}")
+        emit(f"HLI_SS: 0x{result['hli_ss']:04X}, BTN_MD: 0x{result['btn_md']:04X}")
+        emit(f"Active Buttons: {result['btn_ns']} (indices {result['active_range']})")
+        emit(f"Total Non-Empty Slots: {len(result['buttons'])}\n")
         
         # Group by active status
-        active_btns = [b for b in result["buttons"] if b["active"]]
-        inactive_btns = [b for b in result["buttons"] if not b["active"]]
+        active_btns = [b for b in result["buttons"] if b.active]
+        inactive_btns = [b for b in result["buttons"] if not b.active]
         
         if active_btns:
-            print(f"ACTIVE BUTTONS ({len(active_btns)}):")
-            print("-" * 70)
+            emit(f"ACTIVE BUTTONS ({len(active_btns)}):")
+            emit("-" * 70)
             for btn in active_btns:
-                print(f"  Button {btn['index']}:")
-                if btn["rect"]:
-                    x1, y1, x2, y2 = btn["rect"]
-                    print(f"    Rect: ({x1:3d}, {y1:3d}, {x2:3d}, {y2:3d}) size: {x2-x1}x{y2-y1}")
+                emit(f"  Button {btn.index}:")
+                if btn.rect:
+                    x1, y1, x2, y2 = btn.rect
+                    emit(f"    Rect: ({x1:3d}, {y1:3d}, {x2:3d}, {y2:3d}) size: {x2-x1}x{y2-y1}")
                 else:
-                    print(f"    Rect: (none)")
-                nav_str = ", ".join(f"{k}->{v}" for k, v in btn["nav"].items() if v)
-                print(f"    Nav:  {nav_str or '(none)'}")
-                vm_str = ", ".join(f"{k}={v}" for k, v in btn["vm"].items() if v)
+                    emit(f"    Rect: (none)")
+                nav_str = ", ".join(f"{k}->{v}" for k, v in btn.nav.items() if v)
+                emit(f"    Nav:  {nav_str or '(none)'}")
+                vm_str = ", ".join(f"{k}=0x{v:04X}" for k, v in btn.vm.items() if v)
                 if vm_str:
-                    print(f"    VM:   {vm_str}")
-                print()
+                    emit(f"    VM:   {vm_str}")
+                emit("")
         
         if inactive_btns:
-            print(f"INACTIVE/NAVIGATION BUTTONS ({len(inactive_btns)}):")
-            print("-" * 70)
+            emit(f"INACTIVE/NAVIGATION BUTTONS ({len(inactive_btns)}):")
+            emit("-" * 70)
             for btn in inactive_btns:
-                print(f"  Button {btn['index']}: ", end="")
-                if btn["rect"]:
-                    x1, y1, x2, y2 = btn["rect"]
-                    print(f"rect=({x1},{y1},{x2},{y2})", end=" ")
-                nav_str = ", ".join(f"{k}->{v}" for k, v in btn["nav"].items() if v)
+                line = f"  Button {btn.index}: "
+                if btn.rect:
+                    x1, y1, x2, y2 = btn.rect
+                    line += f"rect=({x1},{y1},{x2},{y2}) "
+                nav_str = ", ".join(f"{k}->{v}" for k, v in btn.nav.items() if v)
                 if nav_str:
-                    print(f"nav={nav_str}", end=" ")
-                vm_str = ", ".join(f"{k}={v}" for k, v in btn["vm"].items() if v)
+                    line += f"nav={nav_str} "
+                vm_str = ", ".join(f"{k}=0x{v:04X}" for k, v in btn.vm.items() if v)
                 if vm_str:
-                    print(f"vm={vm_str}", end=" ")
-                print()
-            print()
+                    line += f"vm={vm_str} "
+                emit(line)
+            emit("")
+        
+        # One write per configuration instead of a print per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -9,6 +9,9 @@ from dvdmenu_extract.util.assertx import ValidationError, assert_in_out_dir
 from dvdmenu_extract.util.process import ProcessResult, run_process
 from dvdmenu_extract.util.io import write_json
 
+_TRACK_RE = re.compile(r"Track\s+(\d+)\s*:\s*(AVSEQ\d+\.MPG)")
+_ENTRY_RE = re.compile(r"Entry\s+point\s*:\s*track\s+(\d+)\s+([0-9:]+)")
+
 
 @dataclass
 class VcdImagerCliBackend:
@@ -22,7 +25,9 @@ class VcdImagerCliBackend:
         entry_points: list[SvcdEntryPoint] = []
 
         for line in text.splitlines():
-            track_match = re.search(r"Track\s+(\d+)\s*:\s*(AVSEQ\d+\.MPG)", line)
+            if "Track" not in line and "Entry" not in line:
+                continue
+            track_match = _TRACK_RE.search(line)
             if track_match:
                 tracks.append(
                     SvcdTrack(
@@ -31,9 +36,7 @@ class VcdImagerCliBackend:
                     )
                 )
                 continue
-            entry_match = re.search(
-                r"Entry\s+point\s*:\s*track\s+(\d+)\s+([0-9:]+)", line
-            )
+            entry_match = _ENTRY_RE.search(line)
             if entry_match:
                 entry_points.append(
                     SvcdEntryPoint(
@@ -50,12 +53,13 @@ class VcdImagerCliBackend:
         result = self.run_vcd_info(input_path)
         raw_dir = out_dir / "raw"
         raw_dir.mkdir(parents=True, exist_ok=True)
-        stdout_path = raw_dir / "vcd-info.stdout.txt"
-        stderr_path = raw_dir / "vcd-info.stderr.txt"
-        assert_in_out_dir(stdout_path, out_dir)
-        assert_in_out_dir(stderr_path, out_dir)
-        stdout_path.write_text(result.stdout, encoding="utf-8")
-        stderr_path.write_text(result.stderr, encoding="utf-8")
+        for name, content in (
+            ("vcd-info.stdout.txt", result.stdout),
+            ("vcd-info.stderr.txt", result.stderr),
+        ):
+            raw_path = raw_dir / name
+            assert_in_out_dir(raw_path, out_dir)
+            raw_path.write_bytes(content.encode("utf-8"))
 
         svcd_nav = self.parse_vcd_info(result.stdout)
         write_json(out_dir / "svcd_nav.json", svcd_nav)
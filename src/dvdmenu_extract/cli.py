@@ -12,6 +12,11 @@ from dvdmenu_extract.util.logging import IndentFilter
 
 app = typer.Typer(add_completion=False)
 
+# Shared across invocations so repeated in-process calls (tests, batch runs)
+# reuse one formatter/filter instead of stacking new ones on each handler.
+_LOG_FORMATTER = logging.Formatter("%(levelname)s %(indent)s%(message)s")
+_INDENT_FILTER = IndentFilter()
+
 
 @app.command()
 def main(
@@ -44,13 +49,12 @@ def main(
         None, "--ocr-reference", dir_okay=False
     ),
 ) -> None:
-    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     root_logger = logging.getLogger()
+    if not root_logger.handlers:
+        logging.basicConfig(level=logging.INFO)
     for handler in root_logger.handlers:
-        handler.addFilter(IndentFilter())
-        handler.setFormatter(
-            logging.Formatter("%(levelname)s %(indent)s%(message)s")
-        )
+        handler.addFilter(_INDENT_FILTER)
+        handler.setFormatter(_LOG_FORMATTER)
     if list_stages:
         typer.echo("\n".join(STAGES))
         raise typer.Exit(code=0)
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from pydantic import ConfigDict
+
+# Shared by every model. Schemas are built on first validation rather than
+# at import, so models a run never touches cost nothing.
+BASE_CONFIG = ConfigDict(extra="forbid", defer_build=True)
+
+# Leaf value objects that stages never assign into after parsing.
+FROZEN_CONFIG = ConfigDict(BASE_CONFIG, frozen=True)
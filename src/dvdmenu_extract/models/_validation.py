@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterable
+from sys import intern
+from typing import Annotated, TypeVar
+
+from pydantic import AfterValidator
+
+T = TypeVar("T")
+
+# Ids are hashed and compared across models (uniqueness checks, manifest
+# cross-references, stage joins); interning lets equal ids share one object
+# so dict/set lookups succeed on the identity check.
+InternedStr = Annotated[str, AfterValidator(intern)]
+
+
+def first_duplicate(
+    items: Iterable[T], key: Callable[[T], Hashable]
+) -> Hashable | None:
+    """Return the first key seen twice in items, or None if all are unique.
+
+    Stops at the first collision instead of materializing a list and a set.
+    """
+    seen: set[Hashable] = set()
+    add = seen.add
+    for item in items:
+        value = key(item)
+        if value in seen:
+            return value
+        add(value)
+    return None
+
+
+def assert_unique(
+    items: Iterable[T], key: Callable[[T], Hashable], message: str
+) -> None:
+    """Raise ValueError(message) naming the first duplicated key, if any."""
+    duplicate = first_duplicate(items, key)
+    if duplicate is not None:
+        raise ValueError(f"{message}: {duplicate!r}")
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from enum import StrEnum
+from enum import IntFlag, StrEnum
 
 
 class DiscFormat(StrEnum):
@@ -8,3 +8,44 @@ class DiscFormat(StrEnum):
     VCD = "VCD"
     SVCD = "SVCD"
     UNKNOWN = "UNKNOWN"
+
+
+class StageOutcome(StrEnum):
+    OK = "ok"
+    CACHED = "cached"
+
+
+class ControlFile(IntFlag):
+    """(S)VCD control files present on the disc, stored as one bitmask.
+
+    INFO and ENTRIES are mandatory whenever a disc directory is inspected,
+    so an empty set means the files were not inspected at all; it
+    serializes as an empty object.
+
+    The JSON form is normalized rather than preserved: a non-empty set is
+    always written with all four keys, and an object with no true value
+    reads back as the empty set. The only shapes the tool itself writes,
+    {} and the full four-key object, round-trip unchanged.
+    """
+
+    INFO = 1
+    ENTRIES = 2
+    PSD = 4
+    LOT = 8
+
+    @classmethod
+    def from_dict(cls, present: dict[str, bool]) -> "ControlFile":
+        flags = cls(0)
+        for name, is_present in present.items():
+            member = cls.__members__.get(name.upper())
+            if member is None:
+                raise ValueError(f"unknown control file: {name!r}")
+            if is_present:
+                flags |= member
+        return flags
+
+    def as_dict(self) -> dict[str, bool]:
+        if not self:
+            return {}
+        members = type(self).__members__
+        return {name.lower(): member in self for name, member in members.items()}
@@ -1,19 +1,20 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, Field, model_validator
 
+from dvdmenu_extract.models._config import BASE_CONFIG
 from dvdmenu_extract.models.enums import DiscFormat
 
 
 class VideoTsFileEntry(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     name: str
     size_bytes: int
 
 
 class VideoTsReport(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     file_count: int
     total_bytes: int
@@ -25,14 +26,14 @@ class VideoTsReport(BaseModel):
 
 
 class DiscFileEntry(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     path: str
     size_bytes: int
 
 
 class DiscReport(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     disc_format: DiscFormat
     file_count: int
@@ -49,7 +50,7 @@ class DiscReport(BaseModel):
 
 
 class IngestModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     input_path: str
     video_ts_path: str
@@ -61,8 +62,6 @@ class IngestModel(BaseModel):
 
     @model_validator(mode="after")
     def _validate(self) -> "IngestModel":
-        if self.disc_type_guess not in DiscFormat:
-            raise ValueError("disc_type_guess must be a valid DiscFormat")
         if self.has_video_ts and self.disc_type_guess != "DVD":
             raise ValueError("has_video_ts implies disc_type_guess=DVD")
         if self.has_video_ts and self.video_ts_report is None:
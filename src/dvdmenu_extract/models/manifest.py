@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from operator import attrgetter
 
+from pydantic import BaseModel, Field, model_validator
+
+from dvdmenu_extract.models._config import BASE_CONFIG
+from dvdmenu_extract.models._validation import InternedStr, assert_unique
+from dvdmenu_extract.models.enums import StageOutcome
 from dvdmenu_extract.models.ingest import IngestModel
 from dvdmenu_extract.models.menu import MenuImagesModel, MenuMapModel
 from dvdmenu_extract.models.menu_validation import MenuValidationModel
@@ -11,30 +16,32 @@ from dvdmenu_extract.models.ocr import OcrModel
 from dvdmenu_extract.models.segments import SegmentsModel
 from dvdmenu_extract.models.verify import VerifyModel
 
+_ENTRY_ID = attrgetter("entry_id")
+
 
 class ExtractEntryModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
-    entry_id: str
+    entry_id: InternedStr
     output_path: str
     status: str
 
 
 class ExtractModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     outputs: list[ExtractEntryModel]
 
     @model_validator(mode="after")
     def _validate(self) -> "ExtractModel":
-        entry_ids = [entry.entry_id for entry in self.outputs]
-        if len(entry_ids) != len(set(entry_ids)):
-            raise ValueError("entry_id must be unique in extract outputs")
+        assert_unique(
+            self.outputs, _ENTRY_ID, "entry_id must be unique in extract outputs"
+        )
         return self
 
 
 class ManifestModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     inputs: dict[str, str]
     ingest: IngestModel
@@ -47,15 +54,13 @@ class ManifestModel(BaseModel):
     segments: SegmentsModel
     extract: ExtractModel
     verify: VerifyModel
-    stage_status: dict[str, str] = Field(default_factory=dict)
+    stage_status: dict[str, StageOutcome] = Field(default_factory=dict)
 
     @model_validator(mode="after")
     def _validate(self) -> "ManifestModel":
-        entry_ids = {entry.entry_id for entry in self.ocr.results}
-        for entry in self.segments.segments:
-            if entry.entry_id not in entry_ids:
-                raise ValueError("segments reference missing OCR entry_id")
-        for entry in self.extract.outputs:
-            if entry.entry_id not in entry_ids:
-                raise ValueError("extract reference missing OCR entry_id")
+        entry_ids = set(map(_ENTRY_ID, self.ocr.results))
+        if any(entry.entry_id not in entry_ids for entry in self.segments.segments):
+            raise ValueError("segments reference missing OCR entry_id")
+        if any(entry.entry_id not in entry_ids for entry in self.extract.outputs):
+            raise ValueError("extract reference missing OCR entry_id")
         return self
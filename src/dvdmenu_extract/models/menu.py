@@ -1,29 +1,34 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from collections.abc import Callable
+from operator import attrgetter
+from typing import Literal
 
+from pydantic import BaseModel, Field, model_validator
 
-class RectModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+from dvdmenu_extract.models._config import BASE_CONFIG
+from dvdmenu_extract.models._validation import InternedStr, assert_unique
 
-    x: int
-    y: int
-    w: int
-    h: int
+_ENTRY_ID = attrgetter("entry_id")
 
-    @model_validator(mode="after")
-    def _validate(self) -> "RectModel":
-        if min(self.x, self.y, self.w, self.h) < 0:
-            raise ValueError("rect values must be non-negative")
-        if self.w == 0 or self.h == 0:
-            raise ValueError("rect w/h must be non-zero")
-        return self
+TargetKind = Literal["dvd_cell", "dvd_pgc", "time_range", "track", "segment_item"]
+
+
+class RectModel(BaseModel):
+    model_config = BASE_CONFIG
+
+    # Bounds are field constraints so pydantic-core checks them without a
+    # Python-level validator call per rect.
+    x: int = Field(..., ge=0)
+    y: int = Field(..., ge=0)
+    w: int = Field(..., gt=0)
+    h: int = Field(..., gt=0)
 
 
 class MenuTargetModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
-    kind: str
+    kind: TargetKind
     title_id: int | None = None
     pgc_id: int | None = None
     cell_id: int | None = None
@@ -34,48 +39,59 @@ class MenuTargetModel(BaseModel):
 
     @model_validator(mode="after")
     def _validate(self) -> "MenuTargetModel":
-        if self.kind not in {
-            "dvd_cell",
-            "dvd_pgc",
-            "time_range",
-            "track",
-            "segment_item",
-        }:
-            raise ValueError(
-                "target kind must be dvd_cell, dvd_pgc, time_range, track, or segment_item"
-            )
-        if self.kind == "dvd_cell":
-            if self.title_id is None or self.pgc_id is None or self.cell_id is None:
-                raise ValueError("dvd_cell requires title_id/pgc_id/cell_id")
-            if min(self.title_id, self.pgc_id, self.cell_id) <= 0:
-                raise ValueError("dvd_cell ids must be positive")
-        if self.kind == "dvd_pgc":
-            if self.title_id is None or self.pgc_id is None:
-                raise ValueError("dvd_pgc requires title_id/pgc_id")
-            if min(self.title_id, self.pgc_id) <= 0:
-                raise ValueError("dvd_pgc ids must be positive")
-        if self.kind == "time_range":
-            if (
-                self.track_no is None
-                or self.start_time is None
-                or self.end_time is None
-            ):
-                raise ValueError("time_range requires track_no/start_time/end_time")
-            if self.track_no <= 0:
-                raise ValueError("time_range track_no must be positive")
-            if self.start_time < 0 or self.end_time <= self.start_time:
-                raise ValueError("time_range times must be non-negative and increasing")
-        if self.kind == "track":
-            if self.track_no is None or self.track_no <= 0:
-                raise ValueError("track requires positive track_no")
-        if self.kind == "segment_item":
-            if self.item_no is None or self.item_no <= 0:
-                raise ValueError("segment_item requires positive item_no")
+        # kind is a Literal, so pydantic-core has already rejected unknown kinds
+        _TARGET_KIND_CHECKS[self.kind](self)
         return self
 
 
+def _check_dvd_cell(target: MenuTargetModel) -> None:
+    if target.title_id is None or target.pgc_id is None or target.cell_id is None:
+        raise ValueError("dvd_cell requires title_id/pgc_id/cell_id")
+    if min(target.title_id, target.pgc_id, target.cell_id) <= 0:
+        raise ValueError("dvd_cell ids must be positive")
+
+
+def _check_dvd_pgc(target: MenuTargetModel) -> None:
+    if target.title_id is None or target.pgc_id is None:
+        raise ValueError("dvd_pgc requires title_id/pgc_id")
+    if min(target.title_id, target.pgc_id) <= 0:
+        raise ValueError("dvd_pgc ids must be positive")
+
+
+def _check_time_range(target: MenuTargetModel) -> None:
+    if (
+        target.track_no is None
+        or target.start_time is None
+        or target.end_time is None
+    ):
+        raise ValueError("time_range requires track_no/start_time/end_time")
+    if target.track_no <= 0:
+        raise ValueError("time_range track_no must be positive")
+    if target.start_time < 0 or target.end_time <= target.start_time:
+        raise ValueError("time_range times must be non-negative and increasing")
+
+
+def _check_track(target: MenuTargetModel) -> None:
+    if target.track_no is None or target.track_no <= 0:
+        raise ValueError("track requires positive track_no")
+
+
+def _check_segment_item(target: MenuTargetModel) -> None:
+    if target.item_no is None or target.item_no <= 0:
+        raise ValueError("segment_item requires positive item_no")
+
+
+_TARGET_KIND_CHECKS: dict[TargetKind, Callable[[MenuTargetModel], None]] = {
+    "dvd_cell": _check_dvd_cell,
+    "dvd_pgc": _check_dvd_pgc,
+    "time_range": _check_time_range,
+    "track": _check_track,
+    "segment_item": _check_segment_item,
+}
+
+
 class VisualRegionModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     kind: str
     source_path: str | None = None
@@ -83,38 +99,36 @@ class VisualRegionModel(BaseModel):
 
 
 class MenuEntryModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
-    entry_id: str
+    entry_id: InternedStr
     rect: RectModel | None = None
     selection_rect: RectModel | None = None
     highlight_rect: RectModel | None = None
     target: MenuTargetModel
-    menu_id: str | None = None
+    menu_id: InternedStr | None = None
     visuals: list[VisualRegionModel] = Field(default_factory=list)
     playback_order: int | None = None
 
 
 class MenuMapModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     entries: list[MenuEntryModel]
 
     @model_validator(mode="after")
     def _validate(self) -> "MenuMapModel":
-        entry_ids = [entry.entry_id for entry in self.entries]
-        if len(entry_ids) != len(set(entry_ids)):
-            raise ValueError("entry_id must be unique")
+        assert_unique(self.entries, _ENTRY_ID, "entry_id must be unique")
         return self
 
 
 class MenuImageEntry(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
-    entry_id: str
+    entry_id: InternedStr
     image_path: str
     mask_path: str | None = None
-    menu_id: str | None = None
+    menu_id: InternedStr | None = None
     selection_rect: RectModel | None = None
     highlight_rect: RectModel | None = None
     target: MenuTargetModel | None = None
@@ -122,13 +136,11 @@ class MenuImageEntry(BaseModel):
 
 
 class MenuImagesModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     images: list[MenuImageEntry]
 
     @model_validator(mode="after")
     def _validate(self) -> "MenuImagesModel":
-        entry_ids = [entry.entry_id for entry in self.images]
-        if len(entry_ids) != len(set(entry_ids)):
-            raise ValueError("entry_id must be unique in menu images")
+        assert_unique(self.images, _ENTRY_ID, "entry_id must be unique in menu images")
         return self
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
+
+from dvdmenu_extract.models._config import BASE_CONFIG
 
 
 class MenuValidationIssue(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     code: str
     message: str
 
 
 class MenuValidationMenuCount(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     menu_id: str
     menu_entry_count: int
@@ -19,14 +21,14 @@ class MenuValidationMenuCount(BaseModel):
 
 
 class MenuValidationTargetKindCount(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     kind: str
     count: int
 
 
 class MenuValidationModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     ok: bool
     disc_format: str
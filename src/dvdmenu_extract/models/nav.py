@@ -1,15 +1,25 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from operator import attrgetter
+from typing import NoReturn
 
+from pydantic import BaseModel, Field, model_validator
+
+from dvdmenu_extract.models._config import BASE_CONFIG
+from dvdmenu_extract.models._validation import InternedStr, assert_unique
 from dvdmenu_extract.models.enums import DiscFormat
 from dvdmenu_extract.models.menu import RectModel
 from dvdmenu_extract.models.svcd_nav import SvcdNavModel
 from dvdmenu_extract.models.vcd_nav import VcdNavModel
 
+_CELL_ID = attrgetter("cell_id")
+_PGC_ID = attrgetter("pgc_id")
+_TITLE_ID = attrgetter("title_id")
+_BUTTON_ID = attrgetter("button_id")
+
 
 class DvdCellModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     cell_id: int
     start_time: float
@@ -20,79 +30,77 @@ class DvdCellModel(BaseModel):
 
     @model_validator(mode="after")
     def _validate(self) -> "DvdCellModel":
-        if self.cell_id <= 0:
-            raise ValueError("cell_id must be positive")
-        if self.start_time < 0 or self.end_time < 0:
-            raise ValueError("cell times must be non-negative")
-        if self.end_time <= self.start_time:
-            raise ValueError("cell end_time must be greater than start_time")
-        if (self.first_sector is None) != (self.last_sector is None):
-            raise ValueError("first_sector and last_sector must be provided together")
-        if self.first_sector is not None:
-            if self.first_sector < 0 or self.last_sector < 0:
-                raise ValueError("sector values must be non-negative")
-            if self.last_sector < self.first_sector:
-                raise ValueError("last_sector must be >= first_sector")
-        if self.vob_id is not None and self.vob_id <= 0:
-            raise ValueError("vob_id must be positive when provided")
+        # One combined predicate for the common (valid) case; working out
+        # which rule failed is left to _raise_cell_error. A negative end_time
+        # or last_sector is already caught by the ordering comparisons.
+        first, last = self.first_sector, self.last_sector
+        if (
+            self.cell_id <= 0
+            or self.start_time < 0
+            or self.end_time <= self.start_time
+            or (first is None) != (last is None)
+            or (first is not None and (first < 0 or last < first))
+            or (self.vob_id is not None and self.vob_id <= 0)
+        ):
+            _raise_cell_error(self)
         return self
 
 
+def _raise_cell_error(cell: DvdCellModel) -> NoReturn:
+    if cell.cell_id <= 0:
+        raise ValueError("cell_id must be positive")
+    if cell.start_time < 0 or cell.end_time < 0:
+        raise ValueError("cell times must be non-negative")
+    if cell.end_time <= cell.start_time:
+        raise ValueError("cell end_time must be greater than start_time")
+    if (cell.first_sector is None) != (cell.last_sector is None):
+        raise ValueError("first_sector and last_sector must be provided together")
+    if cell.first_sector is not None:
+        if cell.first_sector < 0 or cell.last_sector < 0:
+            raise ValueError("sector values must be non-negative")
+        if cell.last_sector < cell.first_sector:
+            raise ValueError("last_sector must be >= first_sector")
+    raise ValueError("vob_id must be positive when provided")
+
+
 class DvdPgcModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
-    pgc_id: int
+    pgc_id: int = Field(..., gt=0)
     cells: list[DvdCellModel]
 
     @model_validator(mode="after")
     def _validate(self) -> "DvdPgcModel":
-        if self.pgc_id <= 0:
-            raise ValueError("pgc_id must be positive")
-        cell_ids = [cell.cell_id for cell in self.cells]
-        if len(cell_ids) != len(set(cell_ids)):
-            raise ValueError("cell_id must be unique within pgc")
+        assert_unique(self.cells, _CELL_ID, "cell_id must be unique within pgc")
         return self
 
 
 class DvdTitleModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
-    title_id: int
+    title_id: int = Field(..., gt=0)
     pgcs: list[DvdPgcModel]
 
     @model_validator(mode="after")
     def _validate(self) -> "DvdTitleModel":
-        if self.title_id <= 0:
-            raise ValueError("title_id must be positive")
-        pgc_ids = [pgc.pgc_id for pgc in self.pgcs]
-        if len(pgc_ids) != len(set(pgc_ids)):
-            raise ValueError("pgc_id must be unique within title")
+        assert_unique(self.pgcs, _PGC_ID, "pgc_id must be unique within title")
         return self
 
 
 class DvdMenuButtonModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
-    button_id: str
-    menu_id: str
-    title_id: int
-    pgc_id: int
+    # All checks are field constraints, enforced by pydantic-core.
+    button_id: InternedStr = Field(..., min_length=1)
+    menu_id: InternedStr = Field(..., min_length=1)
+    title_id: int = Field(..., gt=0)
+    pgc_id: int = Field(..., gt=0)
     selection_rect: RectModel | None = None
     highlight_rect: RectModel | None = None
 
-    @model_validator(mode="after")
-    def _validate(self) -> "DvdMenuButtonModel":
-        if not self.button_id:
-            raise ValueError("button_id must be non-empty")
-        if not self.menu_id:
-            raise ValueError("menu_id must be non-empty")
-        if self.title_id <= 0 or self.pgc_id <= 0:
-            raise ValueError("title_id/pgc_id must be positive")
-        return self
-
 
 class DvdNavigationModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     titles: list[DvdTitleModel]
     menu_domains: list[str] = Field(default_factory=list)
@@ -100,21 +108,17 @@ class DvdNavigationModel(BaseModel):
 
     @model_validator(mode="after")
     def _validate(self) -> "DvdNavigationModel":
-        title_ids = [title.title_id for title in self.titles]
-        if len(title_ids) != len(set(title_ids)):
-            raise ValueError("title_id must be unique")
-        button_ids = [button.button_id for button in self.menu_buttons]
-        if len(button_ids) != len(set(button_ids)):
-            raise ValueError("button_id must be unique")
+        assert_unique(self.titles, _TITLE_ID, "title_id must be unique")
+        assert_unique(self.menu_buttons, _BUTTON_ID, "button_id must be unique")
         return self
 
 
-class SvcdNavigationModel(SvcdNavModel):
-    model_config = ConfigDict(extra="forbid")
+# Same schema as SvcdNavModel; an alias avoids building a second validator.
+SvcdNavigationModel = SvcdNavModel
 
 
 class NavigationModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     disc_format: DiscFormat
     dvd: DvdNavigationModel | None = None
@@ -123,8 +127,6 @@ class NavigationModel(BaseModel):
 
     @model_validator(mode="after")
     def _validate(self) -> "NavigationModel":
-        if self.disc_format not in DiscFormat:
-            raise ValueError("disc_format must be a valid DiscFormat")
         if self.disc_format == "DVD" and self.dvd is None:
             raise ValueError("dvd field required for disc_format=DVD")
         if self.disc_format != "DVD" and self.dvd is not None:
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel
 
+from dvdmenu_extract.models._config import BASE_CONFIG
 from dvdmenu_extract.models.enums import DiscFormat
 
 
 class NavSummaryModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     disc_format: DiscFormat
     tracks: int
@@ -1,45 +1,77 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from operator import attrgetter
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
+
+from dvdmenu_extract.models._config import BASE_CONFIG, FROZEN_CONFIG
+from dvdmenu_extract.models._validation import InternedStr, assert_unique
+
+_ENTRY_ID = attrgetter("entry_id")
+_SOURCE_FLAGS = ("background_attempted", "spu_text_nonempty")
+
+
+def _declare_source_flags(schema: dict[str, Any]) -> None:
+    # The flags are computed fields, so only the serialization schema lists
+    # them; ocr.json always carries them, so the validation schema accepts
+    # them too (as optional bools, checked against source on input).
+    properties = schema.setdefault("properties", {})
+    for name in _SOURCE_FLAGS:
+        properties.setdefault(
+            name, {"title": name.replace("_", " ").title(), "type": "boolean"}
+        )
 
 
 class OcrEntryModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(FROZEN_CONFIG, json_schema_extra=_declare_source_flags)
 
-    entry_id: str
+    entry_id: InternedStr
     raw_text: str
     cleaned_label: str
     confidence: float = Field(..., ge=0.0, le=1.0)
-    source: str
-    background_attempted: bool
-    spu_text_nonempty: bool
+    source: Literal["spu", "background"]
 
-    @model_validator(mode="after")
-    def _validate(self) -> "OcrEntryModel":
-        if self.source not in {"spu", "background"}:
-            raise ValueError("source must be 'spu' or 'background'")
-        valid_combo = (self.spu_text_nonempty and not self.background_attempted) or (
-            (not self.spu_text_nonempty) and self.background_attempted
-        )
-        if not valid_combo:
+    @model_validator(mode="before")
+    @classmethod
+    def _check_source_flags(cls, data: Any) -> Any:
+        # ocr.json carries the flags derived from source for its readers;
+        # on input they are accepted only when they agree with source.
+        if not isinstance(data, dict):
+            return data
+        if all(name not in data for name in _SOURCE_FLAGS):
+            return data
+        data = dict(data)
+        spu_text_nonempty = data.pop("spu_text_nonempty", None)
+        background_attempted = data.pop("background_attempted", None)
+        source = data.get("source")
+        if spu_text_nonempty is not None and spu_text_nonempty != (source == "spu"):
+            raise ValueError("spu_text_nonempty must be true exactly when source=spu")
+        if background_attempted is not None and background_attempted != (
+            source == "background"
+        ):
             raise ValueError(
-                "Exactly one of: spu_text_nonempty or background_attempted must be true"
+                "background_attempted must be true exactly when source=background"
             )
-        if self.source == "spu" and not self.spu_text_nonempty:
-            raise ValueError("source=spu requires spu_text_nonempty")
-        if self.source == "background" and not self.background_attempted:
-            raise ValueError("source=background requires background_attempted")
-        return self
+        return data
+
+    @computed_field
+    @property
+    def background_attempted(self) -> bool:
+        return self.source == "background"
+
+    @computed_field
+    @property
+    def spu_text_nonempty(self) -> bool:
+        return self.source == "spu"
 
 
 class OcrModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     results: list[OcrEntryModel]
 
     @model_validator(mode="after")
     def _validate(self) -> "OcrModel":
-        entry_ids = [entry.entry_id for entry in self.results]
-        if len(entry_ids) != len(set(entry_ids)):
-            raise ValueError("entry_id must be unique in ocr results")
+        assert_unique(self.results, _ENTRY_ID, "entry_id must be unique in ocr results")
         return self
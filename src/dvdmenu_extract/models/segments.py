@@ -1,12 +1,19 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from operator import attrgetter
+
+from pydantic import BaseModel, Field, model_validator
+
+from dvdmenu_extract.models._config import BASE_CONFIG, FROZEN_CONFIG
+from dvdmenu_extract.models._validation import InternedStr, assert_unique
+
+_ENTRY_ID = attrgetter("entry_id")
 
 
 class SegmentEntryModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = FROZEN_CONFIG
 
-    entry_id: str
+    entry_id: InternedStr
     start_time: float = Field(..., ge=0.0)
     end_time: float = Field(..., ge=0.0)
     playback_order: int | None = None
@@ -19,13 +26,11 @@ class SegmentEntryModel(BaseModel):
 
 
 class SegmentsModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     segments: list[SegmentEntryModel]
 
     @model_validator(mode="after")
     def _validate(self) -> "SegmentsModel":
-        entry_ids = [entry.entry_id for entry in self.segments]
-        if len(entry_ids) != len(set(entry_ids)):
-            raise ValueError("entry_id must be unique in segments")
+        assert_unique(self.segments, _ENTRY_ID, "entry_id must be unique in segments")
         return self
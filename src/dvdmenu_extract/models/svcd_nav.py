@@ -1,34 +1,48 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing import Annotated, Any
+
+from pydantic import BaseModel, BeforeValidator, Field, PlainSerializer, WithJsonSchema
+
+from dvdmenu_extract.models._config import BASE_CONFIG, FROZEN_CONFIG
+from dvdmenu_extract.models.enums import ControlFile
+
+
+def _control_files_from_json(value: Any) -> Any:
+    return ControlFile.from_dict(value) if isinstance(value, dict) else value
+
+
+# Held as a ControlFile bitmask in memory; read and written as the
+# {"info": true, ...} object the JSON artifacts have always used (in the
+# normalized shape described on ControlFile).
+ControlFiles = Annotated[
+    ControlFile,
+    BeforeValidator(_control_files_from_json),
+    PlainSerializer(ControlFile.as_dict, return_type=dict[str, bool]),
+    WithJsonSchema({"type": "object", "additionalProperties": {"type": "boolean"}}),
+]
 
 
 class SvcdTrack(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = FROZEN_CONFIG
 
-    track_no: int
+    track_no: int = Field(..., gt=0)
     file_name: str
     size_bytes: int | None = None
 
-    @model_validator(mode="after")
-    def _validate(self) -> "SvcdTrack":
-        if self.track_no <= 0:
-            raise ValueError("track_no must be positive")
-        return self
-
 
 class SvcdEntryPoint(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = FROZEN_CONFIG
 
     track_no: int
     timecode: str
 
 
 class SvcdNavModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     version: str = "v1"
     source: str = "directory"
-    control_files: dict[str, bool] = Field(default_factory=dict)
+    control_files: ControlFiles = ControlFile(0)
     tracks: list[SvcdTrack]
     entry_points: list[SvcdEntryPoint] = Field(default_factory=list)
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
 
-from dvdmenu_extract.models.svcd_nav import SvcdEntryPoint, SvcdTrack
+from dvdmenu_extract.models._config import BASE_CONFIG
+from dvdmenu_extract.models.enums import ControlFile
+from dvdmenu_extract.models.svcd_nav import ControlFiles, SvcdEntryPoint, SvcdTrack
 
 
 class VcdNavModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     version: str = "v1"
     source: str = "directory"
-    control_files: dict[str, bool] = Field(default_factory=dict)
+    control_files: ControlFiles = ControlFile(0)
     tracks: list[SvcdTrack]
     entry_points: list[SvcdEntryPoint] = Field(default_factory=list)
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, Field
+
+from dvdmenu_extract.models._config import BASE_CONFIG, FROZEN_CONFIG
+from dvdmenu_extract.models._validation import InternedStr
 
 
 class VerifyEntryModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = FROZEN_CONFIG
 
-    entry_id: str
+    entry_id: InternedStr
     expected_duration: float
     actual_duration: float | None = None
     delta: float | None = None
@@ -15,15 +18,9 @@ class VerifyEntryModel(BaseModel):
 
 
 class VerifyModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = BASE_CONFIG
 
     ok: bool
     skipped: bool
-    tolerance_sec: float
+    tolerance_sec: float = Field(..., ge=0.0)
     results: list[VerifyEntryModel] = Field(default_factory=list)
-
-    @model_validator(mode="after")
-    def _validate(self) -> "VerifyModel":
-        if self.tolerance_sec < 0:
-            raise ValueError("tolerance_sec must be non-negative")
-        return self
@@ -2,35 +2,30 @@ from __future__ import annotations
 
 import logging
 import time
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from pydantic import BaseModel
+
+from dvdmenu_extract.models.enums import StageOutcome
 from dvdmenu_extract.models.ingest import IngestModel
-from dvdmenu_extract.models.manifest import ExtractModel, ManifestModel
-from dvdmenu_extract.models.menu import MenuImagesModel, MenuMapModel
-from dvdmenu_extract.models.menu_validation import MenuValidationModel
-from dvdmenu_extract.models.nav import NavigationModel
-from dvdmenu_extract.models.ocr import OcrModel
-from dvdmenu_extract.models.segments import SegmentsModel
-from dvdmenu_extract.models.verify import VerifyModel
-from dvdmenu_extract.stages import (
-    extract as extract_stage,
-    finalize as finalize_stage,
-    ingest as ingest_stage,
-    menu_images as menu_images_stage,
-    menu_map as menu_map_stage,
-    menu_validation as menu_validation_stage,
-    nav_parse as nav_parse_stage,
-    ocr as ocr_stage,
-    segments as segments_stage,
-    timing as timing_stage,
-    verify_extract as verify_extract_stage,
-)
 from dvdmenu_extract.util.assertx import ValidationError, assert_file_exists
 from dvdmenu_extract.util.export import export_json_artifacts
-from dvdmenu_extract.util.io import StageMeta, read_json, utc_now_iso, write_stage_meta
+from dvdmenu_extract.util.io import (
+    StageMeta,
+    artifact_stamp,
+    read_json,
+    read_stage_cache_stamp,
+    utc_now_iso,
+    write_stage_meta,
+)
 from dvdmenu_extract.util.logging import log_indent
 
+if TYPE_CHECKING:
+    from dvdmenu_extract.models.manifest import ManifestModel
+
 LOGGER = logging.getLogger(__name__)
 
 STAGES = [
@@ -47,38 +42,41 @@ STAGES = [
     "finalize",
 ]
 
-STAGE_OUTPUTS = {
-    "ingest": ["ingest.json", "video_ts_report.json", "disc_report.json"],
-    "nav_parse": [
+# Position of each stage in STAGES; also serves as the membership test.
+STAGE_INDEX = {name: index for index, name in enumerate(STAGES)}
+
+STAGE_OUTPUTS: dict[str, tuple[str, ...]] = {
+    "ingest": ("ingest.json", "video_ts_report.json", "disc_report.json"),
+    "nav_parse": (
         "nav.json",
         "nav_summary.json",
         "svcd_nav.json",
         "vcd_nav.json",
         "raw/vcd-info.stdout.txt",
         "raw/vcd-info.stderr.txt",
-    ],
-    "menu_map": ["menu_map.json"],
-    "menu_validation": ["menu_validation.json"],
-    "timing": ["timing.json", "timing_meta.json"],
-    "menu_images": ["menu_images.json"],
-    "ocr": ["ocr.json"],
-    "segments": ["segments.json"],
-    "extract": ["extract.json"],
-    "verify_extract": ["verify.json"],
-    "finalize": ["manifest.json"],
+    ),
+    "menu_map": ("menu_map.json",),
+    "menu_validation": ("menu_validation.json",),
+    "timing": ("timing.json", "timing_meta.json"),
+    "menu_images": ("menu_images.json",),
+    "ocr": ("ocr.json",),
+    "segments": ("segments.json",),
+    "extract": ("extract.json",),
+    "verify_extract": ("verify.json",),
+    "finalize": ("manifest.json",),
 }
 
-STAGE_INPUTS = {
-    "nav_parse": ["ingest.json"],
-    "menu_map": ["nav.json"],
-    "menu_validation": ["nav.json", "menu_map.json"],
-    "timing": ["nav.json", "ingest.json", "menu_map.json"],
-    "segments": ["menu_map.json", "timing.json"],
-    "extract": ["segments.json", "ingest.json", "menu_map.json", "nav.json"],
-    "verify_extract": ["segments.json", "extract.json"],
-    "menu_images": ["menu_map.json"],
-    "ocr": ["menu_images.json"],
-    "finalize": [
+STAGE_INPUTS: dict[str, tuple[str, ...]] = {
+    "nav_parse": ("ingest.json",),
+    "menu_map": ("nav.json",),
+    "menu_validation": ("nav.json", "menu_map.json"),
+    "timing": ("nav.json", "ingest.json", "menu_map.json"),
+    "segments": ("menu_map.json", "timing.json"),
+    "extract": ("segments.json", "ingest.json", "menu_map.json", "nav.json"),
+    "verify_extract": ("segments.json", "extract.json"),
+    "menu_images": ("menu_map.json",),
+    "ocr": ("menu_images.json",),
+    "finalize": (
         "ingest.json",
         "nav.json",
         "nav_summary.json",
@@ -90,7 +88,7 @@ STAGE_INPUTS = {
         "segments.json",
         "extract.json",
         "verify.json",
-    ],
+    ),
 }
 
 
@@ -128,16 +126,260 @@ class PipelineOptions:
         self.ocr_reference_path = ocr_reference_path
 
 
+def _run_ingest(
+    stage_root: Path,
+    options: PipelineOptions,
+    input_path: Path,
+    ingest: IngestModel | None,
+) -> None:
+    from dvdmenu_extract.stages import ingest as ingest_stage
+
+    ingest_stage.run(input_path, stage_root)
+
+
+def _run_nav_parse(
+    stage_root: Path,
+    options: PipelineOptions,
+    input_path: Path,
+    ingest: IngestModel | None,
+) -> None:
+    from dvdmenu_extract.stages import nav_parse as nav_parse_stage
+
+    nav_parse_stage.run(
+        stage_root / "ingest.json",
+        stage_root,
+        allow_dvd_ifo_fallback=options.allow_dvd_ifo_fallback,
+        debug_spu=options.debug_spu,
+    )
+
+
+def _run_menu_map(
+    stage_root: Path,
+    options: PipelineOptions,
+    input_path: Path,
+    ingest: IngestModel | None,
+) -> None:
+    from dvdmenu_extract.stages import menu_map as menu_map_stage
+
+    menu_map_stage.run(stage_root / "nav.json", stage_root)
+
+
+def _run_menu_validation(
+    stage_root: Path,
+    options: PipelineOptions,
+    input_path: Path,
+    ingest: IngestModel | None,
+) -> None:
+    from dvdmenu_extract.stages import menu_validation as menu_validation_stage
+
+    menu_validation_stage.run(
+        stage_root / "nav.json",
+        stage_root / "menu_map.json",
+        stage_root,
+    )
+
+
+def _run_timing(
+    stage_root: Path,
+    options: PipelineOptions,
+    input_path: Path,
+    ingest: IngestModel | None,
+) -> None:
+    from dvdmenu_extract.stages import timing as timing_stage
+
+    timing_stage.run(
+        stage_root / "nav.json",
+        stage_root / "ingest.json",
+        stage_root / "menu_map.json",
+        stage_root,
+        options.use_real_timing,
+    )
+
+
+def _run_segments(
+    stage_root: Path,
+    options: PipelineOptions,
+    input_path: Path,
+    ingest: IngestModel | None,
+) -> None:
+    from dvdmenu_extract.stages import segments as segments_stage
+
+    segments_stage.run(
+        stage_root / "menu_map.json",
+        stage_root / "timing.json",
+        stage_root,
+    )
+
+
+def _run_menu_images(
+    stage_root: Path,
+    options: PipelineOptions,
+    input_path: Path,
+    ingest: IngestModel | None,
+) -> None:
+    from dvdmenu_extract.stages import menu_images as menu_images_stage
+
+    if ingest is None:
+        ingest = read_json(stage_root / "ingest.json", IngestModel)
+    video_ts_path = Path(ingest.video_ts_path) if ingest.has_video_ts else None
+    reference_dir = None
+    if options.use_reference_images and video_ts_path is not None:
+        candidate = video_ts_path.parent / "Reference"
+        if candidate.is_dir():
+            reference_dir = candidate
+    menu_images_stage.run(
+        stage_root / "menu_map.json",
+        stage_root,
+        video_ts_path=video_ts_path,
+        use_real_ffmpeg=options.use_real_ffmpeg,
+        reference_dir=reference_dir,
+        use_reference_guidance=options.use_reference_guidance,
+    )
+
+
+def _run_ocr(
+    stage_root: Path,
+    options: PipelineOptions,
+    input_path: Path,
+    ingest: IngestModel | None,
+) -> None:
+    from dvdmenu_extract.stages import ocr as ocr_stage
+
+    ocr_stage.run(
+        stage_root / "menu_images.json",
+        stage_root,
+        options.ocr_lang,
+        options.use_real_ocr,
+        Path(options.ocr_reference_path) if options.ocr_reference_path else None,
+    )
+
+
+def _run_extract(
+    stage_root: Path,
+    options: PipelineOptions,
+    input_path: Path,
+    ingest: IngestModel | None,
+) -> None:
+    from dvdmenu_extract.stages import extract as extract_stage
+
+    extract_stage.run(
+        stage_root / "segments.json",
+        stage_root / "ingest.json",
+        stage_root / "menu_map.json",
+        stage_root,
+        options.use_real_ffmpeg,
+        options.repair,
+    )
+
+
+def _run_verify_extract(
+    stage_root: Path,
+    options: PipelineOptions,
+    input_path: Path,
+    ingest: IngestModel | None,
+) -> None:
+    from dvdmenu_extract.stages import verify_extract as verify_extract_stage
+
+    verify_extract_stage.run(
+        stage_root / "segments.json",
+        stage_root / "extract.json",
+        stage_root,
+    )
+
+
+StageRunner = Callable[[Path, PipelineOptions, Path, IngestModel | None], None]
+ModelLoader = Callable[[], type[BaseModel]]
+
+
+def _ingest_model() -> type[BaseModel]:
+    return IngestModel
+
+
+def _nav_model() -> type[BaseModel]:
+    from dvdmenu_extract.models.nav import NavigationModel
+
+    return NavigationModel
+
+
+def _menu_map_model() -> type[BaseModel]:
+    from dvdmenu_extract.models.menu import MenuMapModel
+
+    return MenuMapModel
+
+
+def _menu_validation_model() -> type[BaseModel]:
+    from dvdmenu_extract.models.menu_validation import MenuValidationModel
+
+    return MenuValidationModel
+
+
+def _segments_model() -> type[BaseModel]:
+    from dvdmenu_extract.models.segments import SegmentsModel
+
+    return SegmentsModel
+
+
+def _menu_images_model() -> type[BaseModel]:
+    from dvdmenu_extract.models.menu import MenuImagesModel
+
+    return MenuImagesModel
+
+
+def _ocr_model() -> type[BaseModel]:
+    from dvdmenu_extract.models.ocr import OcrModel
+
+    return OcrModel
+
+
+def _extract_model() -> type[BaseModel]:
+    from dvdmenu_extract.models.manifest import ExtractModel
+
+    return ExtractModel
+
+
+def _verify_model() -> type[BaseModel]:
+    from dvdmenu_extract.models.verify import VerifyModel
+
+    return VerifyModel
+
+
+# Cached output checked for reuse, the loader of the model it is validated
+# against, and the runner, for every stage except finalize (which always
+# runs). Models and stage modules are imported only when a stage needs them,
+# so a single-stage run does not load the whole pipeline.
+STAGE_SPECS: dict[str, tuple[str, ModelLoader, StageRunner]] = {
+    "ingest": ("ingest.json", _ingest_model, _run_ingest),
+    "nav_parse": ("nav.json", _nav_model, _run_nav_parse),
+    "menu_map": ("menu_map.json", _menu_map_model, _run_menu_map),
+    "menu_validation": (
+        "menu_validation.json",
+        _menu_validation_model,
+        _run_menu_validation,
+    ),
+    "timing": ("timing.json", _segments_model, _run_timing),
+    "segments": ("segments.json", _segments_model, _run_segments),
+    "menu_images": ("menu_images.json", _menu_images_model, _run_menu_images),
+    "ocr": ("ocr.json", _ocr_model, _run_ocr),
+    "extract": ("extract.json", _extract_model, _run_extract),
+    "verify_extract": ("verify.json", _verify_model, _run_verify_extract),
+}
+
+
 def _stage_root(out_dir: Path, input_path: Path, options: PipelineOptions) -> Path:
     if options.json_root_dir:
         return input_path / "dvdmenu_extract_json"
     return out_dir
 
 
-def _assert_required_inputs(out_dir: Path, stage: str) -> None:
-    for rel_path in STAGE_INPUTS.get(stage, []):
+def _assert_required_inputs(
+    out_dir: Path, stage: str, verified_paths: set[Path]
+) -> None:
+    for rel_path in STAGE_INPUTS.get(stage, ()):
         path = out_dir / rel_path
+        if path in verified_paths:
+            continue
         assert_file_exists(path, f"Missing required upstream artifact: {path}")
+        verified_paths.add(path)
 
 
 def _write_meta(
@@ -147,6 +389,7 @@ def _write_meta(
     started_at: str,
     inputs: list[str],
     outputs: list[str],
+    cache_stamp: list[int] | None = None,
 ) -> None:
     finished = time.time()
     meta = StageMeta(
@@ -156,6 +399,29 @@ def _write_meta(
         duration_ms=int((finished - start_time) * 1000),
         inputs=inputs,
         outputs=outputs,
+        cache_stamp=cache_stamp,
+    )
+    write_stage_meta(out_dir, meta)
+
+
+def _write_cached_meta(
+    out_dir: Path,
+    stage: str,
+    inputs: list[str],
+    outputs: list[str],
+    cache_stamp: list[int] | None,
+) -> None:
+    # A cache hit does no work, so it is recorded as a zero-length stage
+    # without timing it.
+    now = utc_now_iso()
+    meta = StageMeta(
+        stage=stage,
+        started_at=now,
+        finished_at=now,
+        duration_ms=0,
+        inputs=inputs,
+        outputs=outputs,
+        cache_stamp=cache_stamp,
     )
     write_stage_meta(out_dir, meta)
 
@@ -169,11 +435,11 @@ def run_pipeline(
     from_stage: str | None = None,
 ) -> ManifestModel | None:
     LOGGER.info("Starting at %s", datetime.now().strftime("%Y-%m-%d %H:%M"))
-    if stage and stage not in STAGES:
+    if stage and stage not in STAGE_INDEX:
         raise ValidationError(f"Unknown stage: {stage}")
-    if until and until not in STAGES:
+    if until and until not in STAGE_INDEX:
         raise ValidationError(f"Unknown stage: {until}")
-    if from_stage and from_stage not in STAGES:
+    if from_stage and from_stage not in STAGE_INDEX:
         raise ValidationError(f"Unknown stage: {from_stage}")
     if stage and until:
         raise ValidationError("Use stage or until, not both")
@@ -185,22 +451,34 @@ def run_pipeline(
     out_dir.mkdir(parents=True, exist_ok=True)
     stage_root = _stage_root(out_dir, input_path, options)
     stage_root.mkdir(parents=True, exist_ok=True)
-    stage_status: dict[str, str] = {}
+    stage_status: dict[str, StageOutcome] = {}
 
     if stage:
         selected = [stage]
     elif until:
-        selected = STAGES[: STAGES.index(until) + 1]
+        selected = STAGES[: STAGE_INDEX[until] + 1]
     elif from_stage:
-        selected = STAGES[STAGES.index(from_stage) :]
+        selected = STAGES[STAGE_INDEX[from_stage] :]
     else:
         selected = STAGES
 
     manifest: ManifestModel | None = None
+    # ingest.json is only written by the first stage and artifacts are never
+    # removed mid-run, so both are checked once and reused by later stages.
+    ingest: IngestModel | None = None
+    verified_paths: set[Path] = set()
+    stage_outputs = {
+        name: [str(stage_root / rel_path) for rel_path in rel_paths]
+        for name, rel_paths in STAGE_OUTPUTS.items()
+    }
+    stage_inputs = {
+        name: [str(stage_root / rel_path) for rel_path in rel_paths]
+        for name, rel_paths in STAGE_INPUTS.items()
+    }
     for stage_name in selected:
         LOGGER.info("Stage start: %s", stage_name)
         with log_indent():
-            if stage_name != "ingest" and input_path is not None:
+            if stage_name != "ingest" and input_path is not None and ingest is None:
                 ingest_path = stage_root / "ingest.json"
                 if ingest_path.is_file():
                     ingest = read_json(ingest_path, IngestModel)
@@ -208,149 +486,52 @@ def run_pipeline(
                         raise ValidationError(
                             "ingest.json input_path does not match current input_path"
                         )
-            _assert_required_inputs(stage_root, stage_name)
-            outputs = [str(stage_root / name) for name in STAGE_OUTPUTS[stage_name]]
-            inputs = [
-                str(stage_root / name)
-                for name in STAGE_INPUTS.get(stage_name, [])
-            ]
-            start_time = time.time()
-            started_at = utc_now_iso()
-
-            if stage_name == "ingest":
-                if not options.force and (stage_root / "ingest.json").is_file():
-                    read_json(stage_root / "ingest.json", IngestModel)
-                    stage_status[stage_name] = "cached"
-                else:
-                    ingest_stage.run(input_path, stage_root)
-                    stage_status[stage_name] = "ok"
-            elif stage_name == "nav_parse":
-                if not options.force and (stage_root / "nav.json").is_file():
-                    read_json(stage_root / "nav.json", NavigationModel)
-                    stage_status[stage_name] = "cached"
-                else:
-                    nav_parse_stage.run(
-                        stage_root / "ingest.json",
-                        stage_root,
-                        allow_dvd_ifo_fallback=options.allow_dvd_ifo_fallback,
-                        debug_spu=options.debug_spu,
-                    )
-                    stage_status[stage_name] = "ok"
-            elif stage_name == "menu_map":
-                if not options.force and (stage_root / "menu_map.json").is_file():
-                    read_json(stage_root / "menu_map.json", MenuMapModel)
-                    stage_status[stage_name] = "cached"
-                else:
-                    menu_map_stage.run(stage_root / "nav.json", stage_root)
-                    stage_status[stage_name] = "ok"
-            elif stage_name == "menu_validation":
-                if not options.force and (stage_root / "menu_validation.json").is_file():
-                    read_json(stage_root / "menu_validation.json", MenuValidationModel)
-                    stage_status[stage_name] = "cached"
-                else:
-                    menu_validation_stage.run(
-                        stage_root / "nav.json",
-                        stage_root / "menu_map.json",
-                        stage_root,
-                    )
-                    stage_status[stage_name] = "ok"
-            if stage_name == "menu_images":
-                if not options.force and (stage_root / "menu_images.json").is_file():
-                    read_json(stage_root / "menu_images.json", MenuImagesModel)
-                    stage_status[stage_name] = "cached"
-                else:
-                    ingest_path = stage_root / "ingest.json"
-                    ingest = read_json(ingest_path, IngestModel)
-                    video_ts_path = (
-                        Path(ingest.video_ts_path) if ingest.has_video_ts else None
-                    )
-                    reference_dir = None
-                    if options.use_reference_images and video_ts_path is not None:
-                        candidate = video_ts_path.parent / "Reference"
-                        if candidate.is_dir():
-                            reference_dir = candidate
-                    menu_images_stage.run(
-                        stage_root / "menu_map.json",
-                        stage_root,
-                        video_ts_path=video_ts_path,
-                        use_real_ffmpeg=options.use_real_ffmpeg,
-                        reference_dir=reference_dir,
-                        use_reference_guidance=options.use_reference_guidance,
-                    )
-                    stage_status[stage_name] = "ok"
-            elif stage_name == "segments":
-                if not options.force and (stage_root / "segments.json").is_file():
-                    read_json(stage_root / "segments.json", SegmentsModel)
-                    stage_status[stage_name] = "cached"
-                else:
-                    segments_stage.run(
-                        stage_root / "menu_map.json",
-                        stage_root / "timing.json",
-                        stage_root,
-                    )
-                    stage_status[stage_name] = "ok"
-            elif stage_name == "timing":
-                if not options.force and (stage_root / "timing.json").is_file():
-                    read_json(stage_root / "timing.json", SegmentsModel)
-                    stage_status[stage_name] = "cached"
-                else:
-                    timing_stage.run(
-                        stage_root / "nav.json",
-                        stage_root / "ingest.json",
-                        stage_root / "menu_map.json",
-                        stage_root,
-                        options.use_real_timing,
-                    )
-                    stage_status[stage_name] = "ok"
-            elif stage_name == "extract":
-                if not options.force and (stage_root / "extract.json").is_file():
-                    read_json(stage_root / "extract.json", ExtractModel)
-                    stage_status[stage_name] = "cached"
-                else:
-                    extract_stage.run(
-                        stage_root / "segments.json",
-                        stage_root / "ingest.json",
-                        stage_root / "menu_map.json",
-                        stage_root,
-                        options.use_real_ffmpeg,
-                        options.repair,
-                    )
-                    stage_status[stage_name] = "ok"
-            elif stage_name == "verify_extract":
-                if not options.force and (stage_root / "verify.json").is_file():
-                    read_json(stage_root / "verify.json", VerifyModel)
-                    stage_status[stage_name] = "cached"
-                else:
-                    verify_extract_stage.run(
-                        stage_root / "segments.json",
-                        stage_root / "extract.json",
+            _assert_required_inputs(stage_root, stage_name, verified_paths)
+            outputs = stage_outputs[stage_name]
+            inputs = stage_inputs.get(stage_name, [])
+            cache_hit = False
+            cache_stamp: list[int] | None = None
+            if stage_name in STAGE_SPECS and not options.force:
+                cached_name, load_model, _ = STAGE_SPECS[stage_name]
+                cached_path = stage_root / cached_name
+                if cached_path.is_file():
+                    # Full validation only when the artifact or its model's
+                    # schema changed since the run that wrote or last
+                    # validated it.
+                    model_type = load_model()
+                    cache_stamp = artifact_stamp(cached_path, model_type)
+                    if read_stage_cache_stamp(stage_root, stage_name) != cache_stamp:
+                        read_json(cached_path, model_type)
+                    cache_hit = True
+
+            if cache_hit:
+                stage_status[stage_name] = StageOutcome.CACHED
+                _write_cached_meta(stage_root, stage_name, inputs, outputs, cache_stamp)
+            else:
+                start_time = time.time()
+                started_at = utc_now_iso()
+                stage_status[stage_name] = StageOutcome.OK
+                if stage_name == "finalize":
+                    from dvdmenu_extract.stages import finalize as finalize_stage
+
+                    manifest = finalize_stage.run(
                         stage_root,
+                        stage_status,
+                        overwrite_outputs=options.overwrite_outputs,
                     )
-                    stage_status[stage_name] = "ok"
-            elif stage_name == "ocr":
-                if not options.force and (stage_root / "ocr.json").is_file():
-                    read_json(stage_root / "ocr.json", OcrModel)
-                    stage_status[stage_name] = "cached"
                 else:
-                    ocr_stage.run(
-                        stage_root / "menu_images.json",
-                        stage_root,
-                        options.ocr_lang,
-                        options.use_real_ocr,
-                        Path(options.ocr_reference_path)
-                        if options.ocr_reference_path
-                        else None,
-                    )
-                    stage_status[stage_name] = "ok"
-            elif stage_name == "finalize":
-                stage_status[stage_name] = "ok"
-                manifest = finalize_stage.run(
+                    cached_name, load_model, runner = STAGE_SPECS[stage_name]
+                    runner(stage_root, options, input_path, ingest)
+                    cache_stamp = artifact_stamp(stage_root / cached_name, load_model())
+                _write_meta(
                     stage_root,
-                    stage_status,
-                    overwrite_outputs=options.overwrite_outputs,
+                    stage_name,
+                    start_time,
+                    started_at,
+                    inputs,
+                    outputs,
+                    cache_stamp,
                 )
-
-            _write_meta(stage_root, stage_name, start_time, started_at, inputs, outputs)
             if options.json_out_root:
                 export_json_artifacts(stage_root, input_path)
         LOGGER.info("Stage end: %s", stage_name)
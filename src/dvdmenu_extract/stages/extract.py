@@ -6,10 +6,22 @@ Generates episode files from segment boundaries. In stub mode, this creates
 empty placeholders named by entry_id to keep extraction independent of OCR.
 """
 
+from bisect import bisect_right
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from contextvars import copy_context
 from dataclasses import dataclass
+from functools import partial
+import errno
+import json
+import os
+import re
+import stat
 import subprocess
 import logging
 from pathlib import Path
+from typing import BinaryIO
 
 from dvdmenu_extract.models.ingest import IngestModel
 from dvdmenu_extract.models.menu import MenuMapModel
@@ -17,7 +29,7 @@ from dvdmenu_extract.models.manifest import ExtractEntryModel, ExtractModel
 from dvdmenu_extract.models.segments import SegmentEntryModel, SegmentsModel
 from dvdmenu_extract.models.nav import NavigationModel
 from dvdmenu_extract.util.assertx import ValidationError, assert_in_out_dir
-from dvdmenu_extract.util.io import read_json, write_json
+from dvdmenu_extract.util.io import file_stamp, read_json, write_json, write_raw_json
 from dvdmenu_extract.util.media import get_duration_seconds
 
 
@@ -37,12 +49,26 @@ def _compute_offsets(durations: list[float]) -> list[float]:
     return offsets
 
 
-def _build_entry_source(paths: list[Path], duration_cache: dict[Path, float]) -> EntrySource:
+def _build_entry_source(
+    paths: list[Path],
+    duration_cache: dict[str, float],
+    cached_durations: dict[str, float],
+) -> EntrySource:
+    """Probe each path's duration, reusing cached_durations from earlier runs.
+
+    Every duration used is recorded in duration_cache, so only the entries
+    for current sources are written back.
+    """
     durations: list[float] = []
     for path in paths:
-        if path not in duration_cache:
-            duration_cache[path] = get_duration_seconds(path)
-        durations.append(duration_cache[path])
+        key = _duration_cache_key(path)
+        duration = duration_cache.get(key)
+        if duration is None:
+            duration = cached_durations.get(key)
+        if duration is None:
+            duration = get_duration_seconds(path)
+        duration_cache[key] = duration
+        durations.append(duration)
     return EntrySource(
         paths=paths,
         durations=durations,
@@ -50,15 +76,37 @@ def _build_entry_source(paths: list[Path], duration_cache: dict[Path, float]) ->
     )
 
 
+def _duration_cache_key(path: Path) -> str:
+    # A rewritten file gets a new mtime/size and therefore a fresh probe.
+    try:
+        mtime_ns, size = file_stamp(path)
+    except OSError:
+        raise ValidationError(f"Missing source file for extraction: {path}")
+    return f"{path}:{mtime_ns}:{size}"
+
+
+def _load_duration_cache(path: Path) -> dict[str, float]:
+    """Read ffprobe durations kept from earlier runs; a bad cache is ignored."""
+    try:
+        payload = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    return {
+        key: float(value)
+        for key, value in payload.items()
+        if isinstance(value, (int, float)) and value > 0
+    }
+
+
 def _build_entry_source_by_size(
-    paths: list[Path], total_duration: float
+    paths: list[Path], total_duration: float, sizes: dict[Path, int]
 ) -> EntrySource:
-    total_bytes = sum(path.stat().st_size for path in paths)
+    total_bytes = sum(sizes[path] for path in paths)
     if total_bytes <= 0 or total_duration <= 0:
         raise ValidationError("Cannot derive duration mapping from file sizes")
-    durations = [
-        total_duration * (path.stat().st_size / total_bytes) for path in paths
-    ]
+    durations = [total_duration * (sizes[path] / total_bytes) for path in paths]
     return EntrySource(
         paths=paths,
         durations=durations,
@@ -71,6 +119,7 @@ def _build_entry_source_by_sectors(
     total_duration: float,
     sector_min: int,
     sector_max: int,
+    sizes: dict[Path, int],
 ) -> EntrySource:
     sector_size = 2048
     total_sectors = sector_max - sector_min + 1
@@ -83,7 +132,7 @@ def _build_entry_source_by_sectors(
     current_sector = 0
 
     for path in paths:
-        sector_count = path.stat().st_size // sector_size
+        sector_count = sizes[path] // sector_size
         file_start = current_sector
         file_end = current_sector + sector_count - 1
         current_sector += sector_count
@@ -104,12 +153,14 @@ def _build_entry_source_by_sectors(
     return EntrySource(paths=paths, durations=durations, offsets=offsets)
 
 
-def _build_vob_sector_map(paths: list[Path]) -> list[tuple[Path, int, int]]:
+def _build_vob_sector_map(
+    paths: list[Path], sizes: dict[Path, int]
+) -> list[tuple[Path, int, int]]:
     sector_size = 2048
     mappings: list[tuple[Path, int, int]] = []
     current_sector = 0
     for path in paths:
-        sector_count = path.stat().st_size // sector_size
+        sector_count = sizes[path] // sector_size
         start = current_sector
         end = current_sector + sector_count - 1
         mappings.append((path, start, end))
@@ -118,65 +169,192 @@ def _build_vob_sector_map(paths: list[Path]) -> list[tuple[Path, int, int]]:
 
 
 def _collect_entry_sector_ranges(
-    entry_id: str, menu_entries: dict[str, object], nav: NavigationModel
+    entry_id: str,
+    menu_entries: dict[str, object],
+    pgc_ranges: dict[tuple[int, int], list[tuple[int, int]]],
+    cell_ranges: dict[tuple[int, int, int], tuple[int, int]],
 ) -> list[tuple[int, int]] | None:
+    """Look up an entry's cell sector ranges in the maps built by run().
+
+    Both maps only hold PGCs/cells whose sectors are fully known.
+    """
     entry = menu_entries.get(entry_id)
-    if entry is None or nav.dvd is None:
+    if entry is None:
         return None
     target = entry.target
     if target.kind not in {"dvd_pgc", "dvd_cell"}:
         return None
-    title = next((t for t in nav.dvd.titles if t.title_id == target.title_id), None)
-    if title is None:
-        return None
     if target.kind == "dvd_pgc":
-        pgc = next((p for p in title.pgcs if p.pgc_id == target.pgc_id), None)
-        if pgc is None:
-            return None
-        ranges: list[tuple[int, int]] = []
-        for cell in pgc.cells:
-            if cell.first_sector is None or cell.last_sector is None:
-                return None
-            ranges.append((cell.first_sector, cell.last_sector))
-        return ranges
-    pgc = next((p for p in title.pgcs if p.pgc_id == target.pgc_id), None)
-    if pgc is None:
-        return None
-    cell = next((c for c in pgc.cells if c.cell_id == target.cell_id), None)
-    if cell is None or cell.first_sector is None or cell.last_sector is None:
+        return pgc_ranges.get((target.title_id, target.pgc_id))
+    cell_range = cell_ranges.get((target.title_id, target.pgc_id, target.cell_id))
+    if cell_range is None:
         return None
-    return [(cell.first_sector, cell.last_sector)]
+    return [cell_range]
+
+
+def _copy_byte_range(
+    in_handle: BinaryIO, out_handle: BinaryIO, offset: int, length: int
+) -> None:
+    """Append length bytes of in_handle, starting at offset, to out_handle.
+
+    out_handle may be a regular file or a pipe. The payload stays in the
+    kernel where the platform allows it: os.copy_file_range between files,
+    os.sendfile into a pipe. Whatever they refuse (e.g. across filesystems on
+    older kernels) falls back to a read/write loop for the rest of the range.
+    """
+    chunk_size = 4 * 1024 * 1024
+    if _KERNEL_COPIERS:
+        out_handle.flush()
+        in_fd = in_handle.fileno()
+        out_fd = out_handle.fileno()
+        for kernel_copy in _KERNEL_COPIERS:
+            try:
+                while length > 0:
+                    copied = kernel_copy(
+                        in_fd, out_fd, offset, min(chunk_size, length)
+                    )
+                    if copied == 0:
+                        return
+                    offset += copied
+                    length -= copied
+                return
+            except OSError as exc:
+                if exc.errno not in _KERNEL_COPY_UNSUPPORTED:
+                    raise
+    in_handle.seek(offset)
+    # One reusable buffer instead of a fresh bytes object per chunk.
+    view = memoryview(bytearray(min(chunk_size, length)))
+    while length > 0:
+        read = in_handle.readinto(view[: min(chunk_size, length)])
+        if not read:
+            return
+        # Unbuffered pipe writes may be partial.
+        pending = view[:read]
+        while pending:
+            pending = pending[out_handle.write(pending) :]
+        length -= read
+
+
+_KERNEL_COPIERS: list[Callable[[int, int, int, int], int]] = []
+if hasattr(os, "copy_file_range"):
+    _KERNEL_COPIERS.append(
+        lambda in_fd, out_fd, offset, count: os.copy_file_range(
+            in_fd, out_fd, count, offset_src=offset
+        )
+    )
+if hasattr(os, "sendfile"):
+    _KERNEL_COPIERS.append(
+        lambda in_fd, out_fd, offset, count: os.sendfile(out_fd, in_fd, offset, count)
+    )
+
+_KERNEL_COPY_UNSUPPORTED = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSOCK,
+}
+
+# Second "_"-separated field of a title VOB name, e.g. VTS_01_1.VOB -> 01.
+_VOB_TITLE_RE = re.compile(r"[^_]*_(\d+)(?:_|$)")
+
+# Kept under logs/ and without a .json suffix: it holds host paths and is
+# not an artifact, so export_json_artifacts must not pick it up.
+_DURATION_CACHE_NAME = "ffprobe_durations.cache"
+
+# Titles extracted at once. More parallel readers of the same disk only
+# compete for it, so this stays small.
+_FFMPEG_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def _coalesce_sector_ranges(
+    sector_ranges: list[tuple[int, int]],
+) -> list[tuple[int, int]]:
+    """Drop empty ranges and join each range to the previous one it continues.
+
+    Playback order is kept: cells are not sorted or deduplicated, only
+    back-to-back cells (the common case within a PGC) become one copy.
+    """
+    merged: list[tuple[int, int]] = []
+    for range_start, range_end in sector_ranges:
+        if range_end < range_start:
+            continue
+        if merged and merged[-1][1] + 1 == range_start:
+            merged[-1] = (merged[-1][0], range_end)
+        else:
+            merged.append((range_start, range_end))
+    return merged
 
 
 def _write_sector_ranges(
-    output_path: Path,
-    vob_paths: list[Path],
+    out_handle: BinaryIO,
+    mappings: list[tuple[Path, int, int]],
     sector_ranges: list[tuple[int, int]],
 ) -> None:
     sector_size = 2048
-    mappings = _build_vob_sector_map(vob_paths)
-    chunk_size = 4 * 1024 * 1024
-    with output_path.open("wb") as out_handle:
-        for range_start, range_end in sector_ranges:
-            if range_end < range_start:
-                continue
-            for path, file_start, file_end in mappings:
+    with ExitStack() as stack:
+        # Each VOB is opened once, however many ranges it contributes to.
+        in_handles: dict[Path, BinaryIO] = {}
+        # mappings are contiguous and ordered by sector, so the first VOB a
+        # range touches can be found by bisecting their start sectors.
+        file_starts = [file_start for _, file_start, _ in mappings]
+        for range_start, range_end in _coalesce_sector_ranges(sector_ranges):
+            first = max(bisect_right(file_starts, range_start) - 1, 0)
+            for path, file_start, file_end in mappings[first:]:
+                if file_start > range_end:
+                    break
                 overlap_start = max(range_start, file_start)
                 overlap_end = min(range_end, file_end)
                 if overlap_end < overlap_start:
                     continue
-                offset_sectors = overlap_start - file_start
-                length_sectors = overlap_end - overlap_start + 1
-                bytes_to_read = length_sectors * sector_size
-                with path.open("rb") as in_handle:
-                    in_handle.seek(offset_sectors * sector_size)
-                    remaining = bytes_to_read
-                    while remaining > 0:
-                        chunk = in_handle.read(min(chunk_size, remaining))
-                        if not chunk:
-                            break
-                        out_handle.write(chunk)
-                        remaining -= len(chunk)
+                in_handle = in_handles.get(path)
+                if in_handle is None:
+                    in_handle = stack.enter_context(path.open("rb"))
+                    in_handles[path] = in_handle
+                    # Only widens the kernel's readahead window. A region is
+                    # often a whole title (GBs), so no WILLNEED for all of it,
+                    # and no DONTNEED either: titles extracted in parallel
+                    # can share VOBs and may still be reading these pages.
+                    _advise(in_handle, 0, 0, "SEQUENTIAL")
+                offset = (overlap_start - file_start) * sector_size
+                length = (overlap_end - overlap_start + 1) * sector_size
+                _copy_byte_range(in_handle, out_handle, offset, length)
+
+
+def _single_vob_span(
+    mappings: list[tuple[Path, int, int]],
+    sector_ranges: list[tuple[int, int]],
+) -> tuple[Path, int, int] | None:
+    """Return (vob, start byte, end byte) when the ranges are one run in one VOB."""
+    merged = _coalesce_sector_ranges(sector_ranges)
+    if len(merged) != 1:
+        return None
+    range_start, range_end = merged[0]
+    sector_size = 2048
+    file_starts = [file_start for _, file_start, _ in mappings]
+    path, file_start, file_end = mappings[
+        max(bisect_right(file_starts, range_start) - 1, 0)
+    ]
+    if range_start < file_start or range_end > file_end:
+        return None
+    return (
+        path,
+        (range_start - file_start) * sector_size,
+        (range_end - file_start + 1) * sector_size,
+    )
+
+
+def _advise(handle: BinaryIO, offset: int, length: int, advice: str) -> None:
+    """Pass a POSIX_FADV_<advice> hint for handle where the platform has it."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(
+            handle.fileno(), offset, length, getattr(os, f"POSIX_FADV_{advice}")
+        )
+    except OSError:
+        # Only a hint; some filesystems refuse it.
+        pass
 
 
 def _build_slices(
@@ -206,20 +384,66 @@ def _build_slices(
     return slices
 
 
-def _run_ffmpeg_command(command: list[str], log_messages: list[str]) -> subprocess.CompletedProcess:
+def _run_ffmpeg_command(
+    command: list[str], log_handle: BinaryIO
+) -> subprocess.CompletedProcess:
+    """Run ffmpeg with its stderr written straight to log_handle.
+
+    ffmpeg's progress output can run to megabytes on long jobs, so it is never
+    held in memory; stdout carries nothing in copy mode.
+    """
+    _log_ffmpeg_command(command, log_handle)
     completed = subprocess.run(
         command,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=log_handle,
+    )
+    _log_ffmpeg_exit(completed.returncode, log_handle)
+    return completed
+
+
+def _run_ffmpeg_piped(
+    command: list[str],
+    log_handle: BinaryIO,
+    feed: Callable[[BinaryIO], None],
+) -> subprocess.CompletedProcess:
+    """Run an ffmpeg command reading pipe:0 while feed writes its stdin."""
+    _log_ffmpeg_command(command, log_handle)
+    proc = subprocess.Popen(
+        command,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=log_handle,
+        bufsize=0,
     )
-    log_messages.append(f"ffmpeg command: {' '.join(command)}")
-    log_messages.append(f"exit_code: {completed.returncode}")
-    log_messages.append(f"stdout:\n{completed.stdout}")
-    log_messages.append(f"stderr:\n{completed.stderr}")
+    try:
+        feed(proc.stdin)
+    except BrokenPipeError:
+        # ffmpeg stopped reading; its exit code and stderr say why.
+        pass
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+    completed = subprocess.CompletedProcess(command, proc.wait())
+    _log_ffmpeg_exit(completed.returncode, log_handle)
     return completed
 
 
-def _build_ffmpeg_input_flags(repair: str) -> list[str]:
+def _log_ffmpeg_command(command: list[str], log_handle: BinaryIO) -> None:
+    log_handle.write(f"ffmpeg command: {' '.join(command)}\n".encode("utf-8"))
+
+
+def _log_ffmpeg_exit(returncode: int, log_handle: BinaryIO) -> None:
+    log_handle.write(f"exit_code: {returncode}\n".encode("utf-8"))
+
+
+def _build_ffmpeg_input_flags(repair: str) -> tuple[str, ...]:
     """Build ffmpeg input flags based on repair mode.
     
     Args:
@@ -252,21 +476,167 @@ def _build_ffmpeg_input_flags(repair: str) -> list[str]:
             "-max_error_rate", "1.0",
         ])
     
-    return flags
-
-
-def _build_ffmpeg_output_flags() -> list[str]:
-    """Build ffmpeg output flags for DVD extraction."""
-    return [
-        "-map", "0:v",  # Map all video streams
-        "-map", "0:a",  # Map all audio streams  
-        "-map", "0:s?",  # Map all subtitle streams (optional, may not exist)
-        "-map_metadata", "0",
-        "-map_chapters", "0",
-        "-c", "copy",
-        "-start_at_zero",
-        "-max_interleave_delta", "0",
+    return tuple(flags)
+
+
+# Input flags per repair mode, built once rather than per ffmpeg command.
+_FFMPEG_INPUT_FLAGS = {
+    repair: _build_ffmpeg_input_flags(repair)
+    for repair in ("off", "safe", "aggressive")
+}
+
+# Output flags for DVD extraction.
+_FFMPEG_OUTPUT_FLAGS = (
+    "-map", "0:v",  # Map all video streams
+    "-map", "0:a",  # Map all audio streams
+    "-map", "0:s?",  # Map all subtitle streams (optional, may not exist)
+    "-map_metadata", "0",
+    "-map_chapters", "0",
+    "-c", "copy",
+    "-start_at_zero",
+    "-max_interleave_delta", "0",
+)
+
+
+def _build_ffmpeg_command(
+    repair: str,
+    input_args: list[str],
+    output_path: Path,
+    start: float | None = None,
+    duration: float | None = None,
+) -> list[str]:
+    """Assemble a stream-copy ffmpeg command around the shared flag tuples.
+
+    start/duration become -ss (before the input, for a fast seek) and -t.
+    """
+    command = ["ffmpeg", "-hide_banner", "-y"]
+    if start is not None:
+        command += ["-ss", f"{start:.3f}"]
+    command += [
+        *_FFMPEG_INPUT_FLAGS[repair],
+        "-avoid_negative_ts",
+        "make_zero",
+        *input_args,
     ]
+    if duration is not None:
+        command += ["-t", f"{duration:.3f}"]
+    command += [*_FFMPEG_OUTPUT_FLAGS, str(output_path)]
+    return command
+
+
+def _extract_segment(
+    segment: SegmentEntryModel,
+    source: EntrySource,
+    sector_ranges: list[tuple[int, int]] | None,
+    vob_sector_map: list[tuple[Path, int, int]] | None,
+    output_path: Path,
+    log_path: Path,
+    logs_dir: Path,
+    repair: str,
+) -> None:
+    """Run ffmpeg for one segment; safe to call from a worker thread."""
+    # Unbuffered so our lines and ffmpeg's stderr land in order.
+    with log_path.open("wb", buffering=0) as log_handle:
+        if sector_ranges and vob_sector_map:
+            span = _single_vob_span(vob_sector_map, sector_ranges)
+            if span is not None:
+                # One contiguous run inside one VOB: ffmpeg reads that byte
+                # range of the file itself through its subfile protocol.
+                path, byte_start, byte_end = span
+                command = _build_ffmpeg_command(
+                    repair,
+                    [
+                        "-f",
+                        "mpeg",
+                        "-i",
+                        f"subfile,,start,{byte_start},end,{byte_end},,:{path}",
+                    ],
+                    output_path,
+                )
+                completed = _run_ffmpeg_command(command, log_handle)
+            else:
+                # The sectors are streamed straight into ffmpeg rather than
+                # staged as a temporary .vob, written and read back whole.
+                command = _build_ffmpeg_command(
+                    repair, ["-f", "mpeg", "-i", "pipe:0"], output_path
+                )
+                completed = _run_ffmpeg_piped(
+                    command,
+                    log_handle,
+                    lambda stdin: _write_sector_ranges(
+                        stdin, vob_sector_map, sector_ranges
+                    ),
+                )
+            if completed.returncode != 0:
+                raise ValidationError(
+                    f"ffmpeg extraction failed for {segment.entry_id}; see {log_path}"
+                )
+            return
+        slices = _build_slices(segment, source)
+        concat_list_path: Path | None = None
+        try:
+            if len(slices) == 1:
+                source_path, rel_start, duration = slices[0]
+                command = _build_ffmpeg_command(
+                    repair,
+                    ["-i", str(source_path)],
+                    output_path,
+                    start=rel_start,
+                    duration=duration,
+                )
+                completed = _run_ffmpeg_command(command, log_handle)
+                if completed.returncode != 0:
+                    raise ValidationError(
+                        f"ffmpeg extraction failed for {segment.entry_id}; see {log_path}"
+                    )
+            else:
+                # The concat demuxer cuts each source itself (inpoint/outpoint), so
+                # one ffmpeg pass replaces cutting every slice to disk first.
+                concat_list_path = logs_dir / f"concat_{segment.entry_id}_parts.txt"
+                lines = "\n".join(
+                    f"file '{source_path.resolve().as_posix()}'\n"
+                    f"inpoint {rel_start:.3f}\n"
+                    f"outpoint {rel_start + duration:.3f}"
+                    for source_path, rel_start, duration in slices
+                )
+                concat_list_path.write_text(lines + "\n", encoding="utf-8")
+                command = _build_ffmpeg_command(
+                    repair,
+                    ["-f", "concat", "-safe", "0", "-i", str(concat_list_path)],
+                    output_path,
+                )
+                completed = _run_ffmpeg_command(command, log_handle)
+                if completed.returncode != 0:
+                    raise ValidationError(
+                        f"ffmpeg extraction failed for {segment.entry_id}; see {log_path}"
+                    )
+        finally:
+            if concat_list_path is not None:
+                concat_list_path.unlink(missing_ok=True)
+
+
+def _run_job_groups(groups: list[list[Callable[[], None]]]) -> None:
+    """Run each group's jobs in order, with up to _FFMPEG_WORKERS groups at once.
+
+    ffmpeg runs out of process, so worker threads are enough to keep several
+    going; each gets the caller's logging context.
+    """
+    with ThreadPoolExecutor(max_workers=min(len(groups), _FFMPEG_WORKERS)) as pool:
+        futures = [
+            pool.submit(copy_context().run, _run_in_order, group) for group in groups
+        ]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def _run_in_order(jobs: list[Callable[[], None]]) -> None:
+    for job in jobs:
+        job()
 
 
 def run(
@@ -288,10 +658,8 @@ def run(
 
     episodes_dir = out_dir / "episodes"
     logs_dir = out_dir / "logs"
-    temp_dir = episodes_dir / "_tmp"
     episodes_dir.mkdir(parents=True, exist_ok=True)
     logs_dir.mkdir(parents=True, exist_ok=True)
-    temp_dir.mkdir(parents=True, exist_ok=True)
 
     source_by_entry: dict[str, EntrySource] = {}
     if use_real_ffmpeg:
@@ -302,19 +670,74 @@ def run(
         menu_entries = menu_map.entries
         menu_entries_by_id = {entry.entry_id: entry for entry in menu_entries}
         segments_by_entry = {segment.entry_id: segment for segment in segments.segments}
-        duration_cache: dict[Path, float] = {}
-        vobs_by_title: dict[int, list[Path]] = {}
+        # ffprobe is slow, so probed durations persist across runs.
+        duration_cache_path = logs_dir / _DURATION_CACHE_NAME
+        cached_durations = _load_duration_cache(duration_cache_path)
+        duration_cache: dict[str, float] = {}
+        # One walk over the nav cells yields each title's overall sector span
+        # and the per-PGC / per-cell ranges every entry looks up.
+        title_sector_ranges: dict[int, tuple[int, int]] = {}
+        pgc_sector_ranges: dict[tuple[int, int], list[tuple[int, int]]] = {}
+        cell_sector_ranges: dict[tuple[int, int, int], tuple[int, int]] = {}
+        if nav is not None and nav.dvd is not None:
+            for title in nav.dvd.titles:
+                sector_min: int | None = None
+                sector_max: int | None = None
+                for pgc in title.pgcs:
+                    pgc_ranges: list[tuple[int, int]] = []
+                    pgc_complete = True
+                    for cell in pgc.cells:
+                        if cell.first_sector is None or cell.last_sector is None:
+                            pgc_complete = False
+                            continue
+                        cell_range = (cell.first_sector, cell.last_sector)
+                        cell_sector_ranges[
+                            (title.title_id, pgc.pgc_id, cell.cell_id)
+                        ] = cell_range
+                        pgc_ranges.append(cell_range)
+                        sector_min = (
+                            cell.first_sector
+                            if sector_min is None
+                            else min(sector_min, cell.first_sector)
+                        )
+                        sector_max = (
+                            cell.last_sector
+                            if sector_max is None
+                            else max(sector_max, cell.last_sector)
+                        )
+                    if pgc_complete:
+                        pgc_sector_ranges[(title.title_id, pgc.pgc_id)] = pgc_ranges
+                if sector_min is not None and sector_max is not None:
+                    title_sector_ranges[title.title_id] = (sector_min, sector_max)
+
+        # One stat per title VOB, shared by the duration and sector mappings
+        # and by the source-file check below.
+        vob_sizes: dict[Path, int] = {}
+        regular_vobs: set[Path] = set()
+        vob_sector_maps: dict[int, list[tuple[Path, int, int]]] = {}
         if ingest.disc_report.disc_format == "DVD":
             vobs = [Path(path) for path in track_files if path.upper().endswith(".VOB")]
             by_title: dict[int, list[Path]] = {}
             for path in vobs:
-                parts = path.name.split("_")
-                if len(parts) >= 2 and parts[1].isdigit():
-                    title_id = int(parts[1])
+                match = _VOB_TITLE_RE.match(path.name)
+                if match:
+                    title_id = int(match.group(1))
                     by_title.setdefault(title_id, []).append(path)
             for title_id, paths in by_title.items():
                 by_title[title_id] = sorted(paths)
-                vobs_by_title[title_id] = by_title[title_id]
+                for path in paths:
+                    try:
+                        vob_stat = path.stat()
+                    except OSError:
+                        raise ValidationError(
+                            f"Missing source file for extraction: {path}"
+                        )
+                    vob_sizes[path] = vob_stat.st_size
+                    if stat.S_ISREG(vob_stat.st_mode):
+                        regular_vobs.add(path)
+                vob_sector_maps[title_id] = _build_vob_sector_map(
+                    by_title[title_id], vob_sizes
+                )
             title_sources: dict[int, EntrySource] = {}
             title_durations: dict[int, float] = {}
             for entry in menu_entries:
@@ -329,28 +752,6 @@ def run(
                     entry.target.title_id, 0.0
                 ) + (segment.end_time - segment.start_time)
 
-            title_sector_ranges: dict[int, tuple[int, int]] = {}
-            if nav is not None and nav.dvd is not None:
-                for title in nav.dvd.titles:
-                    sector_min: int | None = None
-                    sector_max: int | None = None
-                    for pgc in title.pgcs:
-                        for cell in pgc.cells:
-                            if cell.first_sector is None or cell.last_sector is None:
-                                continue
-                            sector_min = (
-                                cell.first_sector
-                                if sector_min is None
-                                else min(sector_min, cell.first_sector)
-                            )
-                            sector_max = (
-                                cell.last_sector
-                                if sector_max is None
-                                else max(sector_max, cell.last_sector)
-                            )
-                    if sector_min is not None and sector_max is not None:
-                        title_sector_ranges[title.title_id] = (sector_min, sector_max)
-
             for title_id, paths in by_title.items():
                 total_duration = title_durations.get(title_id, 0.0)
                 sector_range = title_sector_ranges.get(title_id)
@@ -360,13 +761,16 @@ def run(
                         total_duration,
                         sector_range[0],
                         sector_range[1],
+                        vob_sizes,
                     )
                 elif total_duration > 0:
                     title_sources[title_id] = _build_entry_source_by_size(
-                        paths, total_duration
+                        paths, total_duration, vob_sizes
                     )
                 else:
-                    title_sources[title_id] = _build_entry_source(paths, duration_cache)
+                    title_sources[title_id] = _build_entry_source(
+                        paths, duration_cache, cached_durations
+                    )
 
             for entry in menu_entries:
                 if entry.target.kind not in {"dvd_pgc", "dvd_cell"}:
@@ -382,14 +786,16 @@ def run(
         else:
             if len(track_files) == 1:
                 shared_source = _build_entry_source(
-                    [Path(track_files[0])], duration_cache
+                    [Path(track_files[0])], duration_cache, cached_durations
                 )
                 source_by_entry = {
                     entry.entry_id: shared_source for entry in menu_entries
                 }
             elif len(track_files) == len(menu_entries):
                 source_by_entry = {
-                    entry.entry_id: _build_entry_source([Path(path)], duration_cache)
+                    entry.entry_id: _build_entry_source(
+                        [Path(path)], duration_cache, cached_durations
+                    )
                     for entry, path in zip(menu_entries, track_files, strict=False)
                 }
             else:
@@ -397,8 +803,18 @@ def run(
                     "ffmpeg extraction requires either 1 source file or one per menu entry"
                 )
 
+        # Rewritten only when something was probed or a stale key dropped.
+        if duration_cache != cached_durations:
+            write_raw_json(duration_cache_path, duration_cache)
+
+        # Entries mostly share their title's VOBs; check each file once,
+        # and not at all when the stat above already did.
+        checked: set[Path] = set(regular_vobs)
         for source in source_by_entry.values():
             for path in source.paths:
+                if path in checked:
+                    continue
+                checked.add(path)
                 if not path.is_file():
                     raise ValidationError(f"Missing source file for extraction: {path}")
 
@@ -408,6 +824,10 @@ def run(
         key=lambda seg: (seg.playback_order or 0, seg.entry_id),
     )
     outputs: list[ExtractEntryModel] = []
+    jobs: list[tuple[SegmentEntryModel, Path, bool]] = []
+    # ffmpeg jobs grouped by the source files they read (one group per DVD
+    # title): groups run in parallel, a group's segments one after another.
+    source_jobs: dict[tuple[Path, ...], list[Callable[[], None]]] = {}
     for segment in ordered_segments:
         order_index = (segment.playback_order or 1) - 1
         filename = f"{output_prefix}_{order_index}.mkv"
@@ -416,163 +836,67 @@ def run(
 
         log_path = logs_dir / f"{segment.entry_id}.log"
         assert_in_out_dir(log_path, out_dir)
+        # finalize hard-links the named copy to this file; unlinking first
+        # means a rerun writes a new file instead of truncating that one.
+        output_path.unlink(missing_ok=True)
         logging.info("Starting %s", segment.entry_id)
-        if use_real_ffmpeg:
-            source = source_by_entry.get(segment.entry_id)
-            if source is None:
-                raise ValidationError(
-                    f"Missing source mapping for entry_id: {segment.entry_id}"
-                )
-            log_messages: list[str] = []
-            sector_ranges: list[tuple[int, int]] | None = None
-            if nav is not None and nav.dvd is not None:
-                sector_ranges = _collect_entry_sector_ranges(
-                    segment.entry_id, menu_entries_by_id, nav
-                )
-            if sector_ranges:
-                entry = menu_entries_by_id.get(segment.entry_id)
-                if entry is None or entry.target.title_id is None:
-                    raise ValidationError("DVD sector slicing missing title_id")
-                vob_paths = vobs_by_title.get(entry.target.title_id)
-                if not vob_paths:
-                    raise ValidationError(
-                        f"No VOBs found for title {entry.target.title_id}"
-                    )
-                temp_path = temp_dir / f"{segment.entry_id}_sectors.vob"
-                _write_sector_ranges(temp_path, vob_paths, sector_ranges)
-                command = [
-                    "ffmpeg",
-                    "-hide_banner",
-                    "-y",
-                    *_build_ffmpeg_input_flags(repair),
-                    "-avoid_negative_ts",
-                    "make_zero",
-                    "-i",
-                    str(temp_path),
-                    *_build_ffmpeg_output_flags(),
-                    str(output_path),
-                ]
-                completed = _run_ffmpeg_command(command, log_messages)
-                log_path.write_text("\n".join(log_messages), encoding="utf-8")
-                if temp_path.exists():
-                    temp_path.unlink()
-                if completed.returncode != 0:
-                    raise ValidationError(
-                        f"ffmpeg extraction failed for {segment.entry_id}; see {log_path}"
-                    )
-                size = output_path.stat().st_size
-                logging.info("Created file %s of size %s", output_path, size)
-                outputs.append(
-                    ExtractEntryModel(
-                        entry_id=segment.entry_id,
-                        output_path=str(output_path),
-                        status="ok",
-                    )
-                )
-                continue
-            slices = _build_slices(segment, source)
-            slice_paths: list[Path] = []
-            concat_list_path: Path | None = None
-            status = "ok"
-            try:
-                if len(slices) == 1:
-                    source_path, rel_start, duration = slices[0]
-                    command = [
-                        "ffmpeg",
-                        "-hide_banner",
-                        "-y",
-                        "-ss",
-                        f"{rel_start:.3f}",
-                        *_build_ffmpeg_input_flags(repair),
-                        "-avoid_negative_ts",
-                        "make_zero",
-                        "-i",
-                        str(source_path),
-                        "-t",
-                        f"{duration:.3f}",
-                        *_build_ffmpeg_output_flags(),
-                        str(output_path),
-                    ]
-                    completed = _run_ffmpeg_command(command, log_messages)
-                    if completed.returncode != 0:
-                        raise ValidationError(
-                            f"ffmpeg extraction failed for {segment.entry_id}; see {log_path}"
-                        )
-                else:
-                    for idx, (source_path, rel_start, duration) in enumerate(slices):
-                        slice_path = logs_dir / f"{segment.entry_id}_slice_{idx}.ts"
-                        command = [
-                            "ffmpeg",
-                            "-hide_banner",
-                            "-y",
-                            "-ss",
-                            f"{rel_start:.3f}",
-                            *_build_ffmpeg_input_flags(repair),
-                            "-avoid_negative_ts",
-                            "make_zero",
-                            "-i",
-                            str(source_path),
-                            "-t",
-                            f"{duration:.3f}",
-                            *_build_ffmpeg_output_flags(),
-                            str(slice_path),
-                        ]
-                        completed = _run_ffmpeg_command(command, log_messages)
-                        if completed.returncode != 0:
-                            raise ValidationError(
-                                f"ffmpeg extraction failed for {segment.entry_id}; see {log_path}"
-                            )
-                        slice_paths.append(slice_path)
-                    concat_list_path = logs_dir / f"concat_{segment.entry_id}_parts.txt"
-                    lines = "\n".join(
-                        f"file '{path.resolve().as_posix()}'" for path in slice_paths
-                    )
-                    concat_list_path.write_text(lines + "\n", encoding="utf-8")
-                    command = [
-                        "ffmpeg",
-                        "-hide_banner",
-                        "-y",
-                        *_build_ffmpeg_input_flags(repair),
-                        "-avoid_negative_ts",
-                        "make_zero",
-                        "-f",
-                        "concat",
-                        "-safe",
-                        "0",
-                        "-i",
-                        str(concat_list_path),
-                        *_build_ffmpeg_output_flags(),
-                        str(output_path),
-                    ]
-                    completed = _run_ffmpeg_command(command, log_messages)
-                    if completed.returncode != 0:
-                        raise ValidationError(
-                            f"ffmpeg extraction failed for {segment.entry_id}; see {log_path}"
-                        )
-            finally:
-                for part in slice_paths:
-                    if part.exists():
-                        part.unlink()
-                if concat_list_path and concat_list_path.exists():
-                    concat_list_path.unlink()
-                log_path.write_text(
-                    "\n".join(log_messages),
-                    encoding="utf-8",
-                )
-        else:
+        if not use_real_ffmpeg:
             output_path.write_bytes(b"")
             log_path.write_text(
                 f"stub extract entry={segment.entry_id} repair={repair}\n",
                 encoding="utf-8",
             )
-            status = "stub"
+            jobs.append((segment, output_path, False))
+            continue
+        source = source_by_entry.get(segment.entry_id)
+        if source is None:
+            raise ValidationError(
+                f"Missing source mapping for entry_id: {segment.entry_id}"
+            )
+        sector_ranges: list[tuple[int, int]] | None = None
+        vob_sector_map: list[tuple[Path, int, int]] | None = None
+        if nav is not None and nav.dvd is not None:
+            sector_ranges = _collect_entry_sector_ranges(
+                segment.entry_id,
+                menu_entries_by_id,
+                pgc_sector_ranges,
+                cell_sector_ranges,
+            )
+        if sector_ranges:
+            entry = menu_entries_by_id.get(segment.entry_id)
+            if entry is None or entry.target.title_id is None:
+                raise ValidationError("DVD sector slicing missing title_id")
+            vob_sector_map = vob_sector_maps.get(entry.target.title_id)
+            if not vob_sector_map:
+                raise ValidationError(
+                    f"No VOBs found for title {entry.target.title_id}"
+                )
+        source_jobs.setdefault(tuple(source.paths), []).append(
+            partial(
+                _extract_segment,
+                segment,
+                source,
+                sector_ranges,
+                vob_sector_map,
+                output_path,
+                log_path,
+                logs_dir,
+                repair,
+            )
+        )
+        jobs.append((segment, output_path, True))
+
+    if source_jobs:
+        _run_job_groups(list(source_jobs.values()))
+
+    for segment, output_path, extracted in jobs:
         size = output_path.stat().st_size
         logging.info("Created file %s of size %s", output_path, size)
         outputs.append(
             ExtractEntryModel(
                 entry_id=segment.entry_id,
                 output_path=str(output_path),
-                status=status,
+                status="ok" if extracted else "stub",
             )
         )
 
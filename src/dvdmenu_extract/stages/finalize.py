@@ -6,10 +6,13 @@ Merges all stage outputs into a single manifest and applies OCR-based naming
 to extracted files when possible.
 """
 
+from operator import attrgetter
 from pathlib import Path
 import logging
+import os
 import shutil
 
+from dvdmenu_extract.models.enums import StageOutcome
 from dvdmenu_extract.models.manifest import ExtractModel, ManifestModel
 from dvdmenu_extract.models.ingest import IngestModel
 from dvdmenu_extract.models.menu import MenuImagesModel, MenuMapModel
@@ -22,10 +25,25 @@ from dvdmenu_extract.models.verify import VerifyModel
 from dvdmenu_extract.util.assertx import ValidationError
 from dvdmenu_extract.util.io import read_json, write_json
 
+_ENTRY_ID = attrgetter("entry_id")
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    """Give source a second name without copying its (multi-GB) contents.
+
+    The original name stays valid, since extract.json still refers to it.
+    Falls back to a full copy where the filesystem cannot hard-link (e.g.
+    FAT/exFAT media, or a target on another device).
+    """
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
 
 def run(
     out_dir: Path,
-    stage_status: dict[str, str],
+    stage_status: dict[str, StageOutcome],
     overwrite_outputs: bool = False,
 ) -> ManifestModel:
     ingest = read_json(out_dir / "ingest.json", IngestModel)
@@ -41,66 +59,64 @@ def run(
     extract = read_json(out_dir / "extract.json", ExtractModel)
     verify = read_json(out_dir / "verify.json", VerifyModel)
 
-    menu_entry_ids = {entry.entry_id for entry in menu_map.entries}
-    ocr_ids = {entry.entry_id for entry in ocr.results}
-    segment_ids = {entry.entry_id for entry in segments.segments}
-    extract_ids = {entry.entry_id for entry in extract.outputs}
+    # The by-id maps are used below anyway; their key views compare as sets,
+    # so only the reference id set is built.
+    menu_entry_ids = set(map(_ENTRY_ID, menu_map.entries))
+    ocr_by_id = {entry.entry_id: entry for entry in ocr.results}
+    segments_by_id = {segment.entry_id: segment for segment in segments.segments}
+    extract_by_id = {entry.entry_id: entry for entry in extract.outputs}
 
-    if menu_entry_ids != ocr_ids:
+    if ocr_by_id.keys() != menu_entry_ids:
         raise ValidationError("Mismatch between menu_map and ocr entry ids")
-    if menu_entry_ids != segment_ids:
+    if segments_by_id.keys() != menu_entry_ids:
         raise ValidationError("Mismatch between menu_map and segments entry ids")
-    if menu_entry_ids != extract_ids:
+    if extract_by_id.keys() != menu_entry_ids:
         raise ValidationError("Mismatch between menu_map and extract entry ids")
 
-    ocr_by_id = {entry.entry_id: entry for entry in ocr.results}
-    ordered_segments = sorted(
-        segments.segments, key=lambda seg: (seg.playback_order or 0, seg.entry_id)
-    )
-    index_by_id = {seg.entry_id: idx + 1 for idx, seg in enumerate(ordered_segments)}
+    # Only the ids are needed in playback order, so sort plain key tuples
+    # rather than the segment models.
+    ordered_ids = [
+        entry_id
+        for _, entry_id in sorted(
+            (seg.playback_order or 0, seg.entry_id) for seg in segments.segments
+        )
+    ]
     logger = logging.getLogger(__name__)
-    for output in extract.outputs:
-        entry = ocr_by_id.get(output.entry_id)
-        if not entry:
-            continue
-        index = index_by_id.get(output.entry_id)
-        prefix = f"{index:02d}_" if index is not None else ""
-        desired_name = f"{prefix}{entry.cleaned_label}.mkv"
+    # The id sets were checked equal above, so every entry has both an OCR
+    # label and an extract output. Renaming in playback order lets the sync
+    # report come out of the same pass.
+    for index, entry_id in enumerate(ordered_ids, start=1):
+        entry = ocr_by_id[entry_id]
+        output = extract_by_id[entry_id]
+        desired_name = f"{index:02d}_{entry.cleaned_label}.mkv"
         current_path = Path(output.output_path)
         target_path = current_path.with_name(desired_name)
-        if current_path == target_path:
-            continue
-        if not current_path.is_file():
-            raise ValidationError(f"Missing extracted file: {current_path}")
-        if target_path.exists():
-            if overwrite_outputs:
-                if target_path.is_dir():
+        if current_path != target_path:
+            if not current_path.is_file():
+                raise ValidationError(f"Missing extracted file: {current_path}")
+            if target_path.exists():
+                if overwrite_outputs:
+                    if target_path.is_dir():
+                        raise ValidationError(
+                            f"Target path is a directory: {target_path}"
+                        )
+                    target_path.unlink()
+                else:
                     raise ValidationError(
-                        f"Target path is a directory: {target_path}"
+                        f"Target filename already exists: {target_path}"
                     )
-                target_path.unlink()
-            else:
-                raise ValidationError(f"Target filename already exists: {target_path}")
-        logger.info("copying %s to %s", current_path.name, target_path.name)
-        shutil.copy2(current_path, target_path)
-        output.output_path = str(target_path)
+            logger.info("linking %s to %s", current_path.name, target_path.name)
+            _link_or_copy(current_path, target_path)
+            output.output_path = str(target_path)
 
-    # Sync report: playback order -> output file -> OCR label
-    extract_by_id = {entry.entry_id: entry for entry in extract.outputs}
-    for seg in ordered_segments:
-        ocr_entry = ocr_by_id.get(seg.entry_id)
-        extract_entry = extract_by_id.get(seg.entry_id)
-        if not ocr_entry or not extract_entry:
-            continue
-        label = ocr_entry.cleaned_label or ocr_entry.raw_text
-        logger.info(
-            "sync: %s -> %s -> %s",
-            seg.entry_id,
-            Path(extract_entry.output_path).name,
-            label,
-        )
+        # Sync report: playback order -> output file -> OCR label
+        label = entry.cleaned_label or entry.raw_text
+        logger.info("sync: %s -> %s -> %s", entry_id, target_path.name, label)
 
-    manifest = ManifestModel(
+    # Every part was validated by read_json above, and the entry-id
+    # cross-checks ManifestModel would repeat were enforced (as strict
+    # set equality) at the top of this function, so skip revalidation.
+    manifest = ManifestModel.model_construct(
         inputs={"input_path": ingest.input_path, "out_dir": str(out_dir)},
         ingest=ingest,
         nav=nav,
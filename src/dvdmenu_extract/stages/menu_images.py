@@ -9,6 +9,10 @@ generates placeholders when no fixture images are available.
 import shutil
 import subprocess
 import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -32,44 +36,57 @@ from dvdmenu_extract.util.btn_it_analyzer import (
     MenuPageAnalysis,
 )
 from dvdmenu_extract.util.libdvdread_spu import (
-    iter_spu_packets,
     find_spu_button_rects,
 )
 from dvdmenu_extract.util.libdvdread_spu import SpuBitmap
 import base64
 
+# Maps SPU color indices to mask values: 0 stays background, anything else is 255.
+_SPU_MASK_TABLE = bytes([0]) + bytes([255]) * 255
+# 1x1 PNG written for stub entries that have no fixture image.
+_PLACEHOLDER_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAwMCAO+7VZkAAAAASUVORK5CYII="
+)
+
 
 def _rect_area(rect: RectModel) -> int:
     return max(0, rect.w) * max(0, rect.h)
 
 
-def _rect_intersection_area(a: RectModel, b: RectModel) -> int:
-    left = max(a.x, b.x)
-    top = max(a.y, b.y)
-    right = min(a.x + a.w, b.x + b.w)
-    bottom = min(a.y + a.h, b.y + b.h)
-    if right <= left or bottom <= top:
-        return 0
-    return (right - left) * (bottom - top)
+def _rect_bounds(rect: RectModel) -> tuple[int, int, int, int, int]:
+    """Return (left, top, right, bottom, area) as plain ints.
 
+    The pairwise overlap checks below compare every rect against every other
+    one, so each rect is flattened once instead of re-reading model fields
+    on every comparison.
+    """
+    return (rect.x, rect.y, rect.x + rect.w, rect.y + rect.h, _rect_area(rect))
 
-def _overlap_ratio(a: RectModel, b: RectModel) -> float:
-    inter = _rect_intersection_area(a, b)
-    if inter == 0:
+
+def _bounds_overlap_ratio(
+    a: tuple[int, int, int, int, int],
+    b: tuple[int, int, int, int, int],
+) -> float:
+    left = max(a[0], b[0])
+    top = max(a[1], b[1])
+    right = min(a[2], b[2])
+    bottom = min(a[3], b[3])
+    if right <= left or bottom <= top:
         return 0.0
-    min_area = min(_rect_area(a), _rect_area(b))
+    min_area = min(a[4], b[4])
     if min_area == 0:
         return 0.0
-    return inter / min_area
+    return (right - left) * (bottom - top) / min_area
 
 
 def _rects_overlap_too_much(
     rects: list[tuple[str, RectModel]],
     max_overlap_ratio: float,
 ) -> bool:
-    for idx, (_, rect) in enumerate(rects):
-        for _, other_rect in rects[idx + 1 :]:
-            if _overlap_ratio(rect, other_rect) > max_overlap_ratio:
+    bounds = [_rect_bounds(rect) for _, rect in rects]
+    for idx, rect_bounds in enumerate(bounds):
+        for other_bounds in bounds[idx + 1 :]:
+            if _bounds_overlap_ratio(rect_bounds, other_bounds) > max_overlap_ratio:
                 return True
     return False
 
@@ -79,9 +96,10 @@ def _assert_rects_have_low_overlap(
     max_overlap_ratio: float = 0.2,
 ) -> None:
     for menu_id, menu_entries in menus.items():
-        for idx, (entry_id, rect) in enumerate(menu_entries):
-            for other_id, other_rect in menu_entries[idx + 1 :]:
-                ratio = _overlap_ratio(rect, other_rect)
+        bounds = [(entry_id, _rect_bounds(rect)) for entry_id, rect in menu_entries]
+        for idx, (entry_id, rect_bounds) in enumerate(bounds):
+            for other_id, other_bounds in bounds[idx + 1 :]:
+                ratio = _bounds_overlap_ratio(rect_bounds, other_bounds)
                 if ratio > max_overlap_ratio:
                     raise ValidationError(
                         "menu_images: overlapping button rects detected "
@@ -130,26 +148,16 @@ def _extract_frame_at(vob_path: Path, output_png: Path, timestamp: float) -> Non
 
 
 def _probe_image_size(input_png: Path) -> Tuple[int, int]:
-    """Returns (width, height) using ffprobe."""
-    cmd = [
-        "ffprobe",
-        "-v", "error",
-        "-select_streams", "v:0",
-        "-show_entries", "stream=width,height",
-        "-of", "csv=p=0:s=x",
-        str(input_png),
-    ]
+    """Returns (width, height) from the image header.
+
+    PIL only parses the header here, which is far cheaper than an ffprobe
+    process per frame.
+    """
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-    except subprocess.CalledProcessError as e:
-        raise ValidationError(
-            f"ffprobe failed to read image size for {input_png}: {e.stderr}"
-        )
-    output = result.stdout.strip()
-    if "x" not in output:
-        raise ValidationError(f"ffprobe returned invalid size for {input_png}: {output}")
-    width_str, height_str = output.split("x", 1)
-    return int(width_str), int(height_str)
+        with Image.open(input_png) as image:
+            return image.size
+    except (OSError, ValueError) as e:
+        raise ValidationError(f"Failed to read image size for {input_png}: {e}")
 
 
 def _probe_video_duration(vob_path: Path) -> float | None:
@@ -780,11 +788,12 @@ def _extract_spu_button_rects(
         - DVD_MENU_HIGHLIGHT_DETECTION_RESEARCH.md: Research and validation
     """
     import logging
-    from dvdmenu_extract.util.libdvdread_compat import read_u16
     from dvdmenu_extract.util.libdvdread_spu import (
         decode_spu_bitmap,
         bitmap_connected_components,
+        count_non_zero_pixels,
         find_spu_text_band_rects,
+        reassemble_spu_packets,
     )
     logger = logging.getLogger(__name__)
     
@@ -800,99 +809,6 @@ def _extract_spu_button_rects(
         logger.error(f"  Failed to read VOB: {e}")
         return [], {}
     
-    # Reassemble fragmented SPU packets based on size headers
-    def reassemble_spu_packets(vob_data: bytes):
-        """
-        Reassemble fragmented SPU packets from MPEG-PS stream data.
-        
-        SPU packets are often split across multiple PES (Packetized Elementary Stream)
-        packets. This function buffers the fragments and reassembles them into
-        complete SPU packets based on the size header at the start of each packet.
-        
-        SPU Packet Structure:
-        - Bytes 0-1: Total packet size (16-bit big-endian)
-        - Bytes 2-3: Control sequence offset
-        - Bytes 4+: RLE bitmap data
-        - Control sequence: Display commands, coordinates, etc.
-        
-        Reassembly Algorithm:
-        1. Iterate through all SPU PES payloads from the VOB
-        2. Buffer payloads for each substream ID (0x20-0x3F)
-        3. Read size header (first 2 bytes) to determine expected packet size
-        4. When buffer contains a complete packet:
-           a. Extract the packet (buffer[:size])
-           b. Yield it for processing
-           c. Remove it from buffer
-           d. Check for next packet in remaining buffer
-        5. Repeat until all data processed
-        
-        CRITICAL: The while loop processes ALL complete packets in the buffer,
-        not just the first one. This ensures multi-page menus are handled correctly.
-        
-        Example:
-            VOB contains 2 SPU packets (2 menu pages):
-            - Packet 1: 3990 bytes (split into 2 PES payloads: 2016 + 1974)
-            - Packet 2: 3000 bytes (split into 2 PES payloads: 2016 + 984)
-            
-            Without proper reassembly: Only first packet extracted
-            With proper reassembly: Both packets extracted correctly
-        
-        Args:
-            vob_data: Raw VOB file data (bytes)
-        
-        Yields:
-            Tuples of (substream_id, complete_packet_bytes) for each reassembled
-            SPU packet. Multiple packets may be yielded from a single substream.
-        
-        Implementation Notes:
-        - Uses iter_spu_packets() to parse MPEG-PS structure
-        - Maintains separate buffers for each substream ID
-        - Updates expected size when current packet is complete (size = 0)
-        - Critical fix: Loop continues processing buffer after yielding
-        """
-        buffers = {}  # substream_id -> bytearray of accumulated data
-        expected_sizes = {}  # substream_id -> expected packet size from header
-        
-        for substream_id, payload in iter_spu_packets(vob_data):
-            # Initialize buffer for new substreams
-            if substream_id not in buffers:
-                buffers[substream_id] = bytearray()
-            
-            # Append new payload to buffer
-            buffers[substream_id].extend(payload)
-            buffer = buffers[substream_id]
-            
-            # Read expected size from header if we don't have one (or it's 0)
-            # Size header is first 2 bytes of each SPU packet
-            if (substream_id not in expected_sizes or expected_sizes[substream_id] == 0) and len(buffer) >= 2:
-                from dvdmenu_extract.util.libdvdread_compat import read_u16
-                size = read_u16(buffer, 0)  # Read 16-bit big-endian size
-                expected_sizes[substream_id] = size if size > 0 else 0
-            
-            expected = expected_sizes.get(substream_id, 0)
-            
-            # Process ALL complete packets in the buffer (critical for multi-page menus)
-            while expected > 0 and len(buffer) >= expected:
-                # Extract complete packet
-                packet = bytes(buffer[:expected])
-                
-                # Remove processed packet from buffer
-                buffers[substream_id] = bytearray(buffer[expected:])
-                buffer = buffers[substream_id]
-                
-                # Yield complete packet for processing
-                yield (substream_id, packet)
-                
-                # Check if there's another packet in the remaining buffer
-                if len(buffer) >= 2:
-                    from dvdmenu_extract.util.libdvdread_compat import read_u16
-                    expected_sizes[substream_id] = read_u16(buffer, 0)
-                else:
-                    expected_sizes[substream_id] = 0
-                
-                # Update expected size for while loop condition
-                expected = expected_sizes.get(substream_id, 0)
-    
     # ============================================================================
     # Extract SPU packets and find button rectangles per page
     # ============================================================================
@@ -938,7 +854,7 @@ def _extract_spu_button_rects(
         page_bitmaps[page_index] = bitmap
         
         # Count non-zero pixels (for diagnostic purposes)
-        non_zero = sum(1 for row in bitmap.pixels for px in row if px != 0)
+        non_zero = count_non_zero_pixels(bitmap)
         logger.info(f"    Bitmap: {bitmap.width}x{bitmap.height}, {non_zero} non-zero pixels")
         
         # ------------------------------------------------------------------------
@@ -2455,23 +2371,31 @@ def _detect_menu_rects_from_static_frame(
     return rects
 
 
-def _crop_image(input_png: Path, output_png: Path, rect: RectModel) -> None:
-    """Crops an image using ffmpeg."""
-    # ffmpeg crop filter: crop=w:h:x:y
-    filter_str = f"crop={rect.w}:{rect.h}:{rect.x}:{rect.y}"
-    cmd = [
-        "ffmpeg",
-        "-y",
-        "-i", str(input_png),
-        "-vf", filter_str,
-        str(output_png)
-    ]
+def _decode_image(input_png: Path) -> Image.Image:
+    """Decodes an image fully so many crops can share its pixel buffer."""
     try:
-        subprocess.run(cmd, check=True, capture_output=True)
-    except subprocess.CalledProcessError as e:
-        raise ValidationError(
-            f"ffmpeg failed to crop image {input_png}: {e.stderr.decode()}"
-        )
+        with Image.open(input_png) as image:
+            image.load()
+            return image.copy()
+    except (OSError, ValueError) as e:
+        raise ValidationError(f"Failed to decode image {input_png}: {e}")
+
+
+def _crop_image(image: Image.Image, output_png: Path, rect: RectModel) -> None:
+    """Crops an already decoded image and writes it as PNG."""
+    cropped = image.crop((rect.x, rect.y, rect.x + rect.w, rect.y + rect.h))
+    try:
+        cropped.save(output_png, format="PNG", compress_level=1)
+    except OSError as e:
+        raise ValidationError(f"Failed to write cropped image {output_png}: {e}")
+
+
+def _crop_menu_image(
+    image: Image.Image, output_png: Path, rect: RectModel, refine: bool
+) -> None:
+    _crop_image(image, output_png, rect)
+    if refine:
+        _refine_cropped_image(output_png)
 
 
 def _refine_cropped_image(path: Path) -> None:
@@ -2759,19 +2683,20 @@ def _save_spu_mask(
 
     mask_bytes = bytearray(w * h)
     count = 0
-    for row in range(h):
-        by = y1 + row - bitmap.y
-        if by < 0 or by >= bitmap.height:
-            continue
-        bmp_row = bitmap.pixels[by]
-        base = row * w
-        for col in range(w):
-            bx = x1 + col - bitmap.x
-            if bx < 0 or bx >= bitmap.width:
+    # Clip the rect's columns to the bitmap once, then binarize each row
+    # slice with a translate table instead of testing pixels one by one.
+    bx_start = max(0, x1 - bitmap.x)
+    bx_end = min(bitmap.width, x2 - bitmap.x + 1)
+    if bx_end > bx_start:
+        col_start = bx_start - (x1 - bitmap.x)
+        for row in range(h):
+            by = y1 + row - bitmap.y
+            if by < 0 or by >= bitmap.height:
                 continue
-            if bmp_row[bx] != 0:
-                mask_bytes[base + col] = 255
-                count += 1
+            segment = bitmap.pixels[by][bx_start:bx_end].translate(_SPU_MASK_TABLE)
+            base = row * w + col_start
+            mask_bytes[base : base + len(segment)] = segment
+            count += len(segment) - segment.count(0)
 
     if count == 0:
         return None
@@ -3003,6 +2928,12 @@ def run(
     # menu_id -> background_png_path
     menu_backgrounds: dict[str, Path] = {}
     menu_sizes: dict[str, Tuple[int, int]] = {}
+    # Menus that resolve to the same VOB share one ffmpeg frame extraction.
+    # vob_path -> first background_png_path extracted from it
+    vob_backgrounds: dict[Path, Path] = {}
+    # Each background is decoded once and every button is cropped from it.
+    # background_png_path -> decoded image
+    decoded_backgrounds: dict[Path, Image.Image] = {}
     pgc_vob_map: dict[tuple[int, int], int] = {}
 
     nav_path = out_dir / "nav.json"
@@ -3016,11 +2947,11 @@ def run(
                         pgc_vob_map[(title.title_id, pgc.pgc_id)] = int(vob_id)
 
     entries: list[MenuImageEntry] = []
+    # Crops are deferred until every rect is settled, then run in parallel.
+    crop_jobs: list[Callable[[], None]] = []
     menu_ocr_rects: dict[str, list[RectModel]] = {}
     used_rects: dict[str, list[tuple[str, RectModel]]] = {}
-    placeholder_png = base64.b64decode(
-        "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAwMCAO+7VZkAAAAASUVORK5CYII="
-    )
+    buttons_dir = menu_buttons_dir()
     if use_real_ffmpeg and video_ts_path is None and reference_dir is None:
         raise ValidationError("menu_images requires VIDEO_TS path or reference images")
 
@@ -3298,11 +3229,11 @@ def run(
 
         if src_reference is None and not use_real_ffmpeg:
             # 2. Fixtures for tests/stubs
-            src_fixture = menu_buttons_dir() / f"{entry.entry_id}.png"
+            src_fixture = buttons_dir / f"{entry.entry_id}.png"
             if src_fixture.is_file():
                 shutil.copyfile(src_fixture, dst)
             else:
-                dst.write_bytes(placeholder_png)
+                dst.write_bytes(_PLACEHOLDER_PNG)
         elif use_real_ffmpeg and video_ts_path:
             # 3. Try real extraction from DVD VOBs
             # IMPORTANT: Extract from MENU VOB (where button image is), NOT target VOB (where button leads)
@@ -3351,8 +3282,13 @@ def run(
                     # Use default menu background frame
                     bg_cache_path = output_dir / f"bg_{entry.menu_id}.png"
                     if entry.menu_id not in menu_backgrounds:
-                        # Always extract frame (overwrite if exists to avoid stale cache)
-                        _extract_frame(vob_path, bg_cache_path)
+                        extracted = vob_backgrounds.get(vob_path)
+                        if extracted is None:
+                            # Always extract frame (overwrite if exists to avoid stale cache)
+                            _extract_frame(vob_path, bg_cache_path)
+                            vob_backgrounds[vob_path] = bg_cache_path
+                        elif extracted != bg_cache_path:
+                            shutil.copyfile(extracted, bg_cache_path)
                         menu_backgrounds[entry.menu_id] = bg_cache_path
                         menu_sizes[entry.menu_id] = _probe_image_size(bg_cache_path)
                     bg_path = menu_backgrounds[entry.menu_id]
@@ -3434,9 +3370,19 @@ def run(
                         f"Invalid crop rect for entry_id {entry.entry_id}: "
                         f"{crop_rect} exceeds {bg_size[0]}x{bg_size[1]}"
                     )
-                _crop_image(bg_path, dst, crop_rect)
-                if use_reference_guidance and used_guidance:
-                    _refine_cropped_image(dst)
+                background = decoded_backgrounds.get(bg_path)
+                if background is None:
+                    background = _decode_image(bg_path)
+                    decoded_backgrounds[bg_path] = background
+                crop_jobs.append(
+                    partial(
+                        _crop_menu_image,
+                        background,
+                        dst,
+                        crop_rect,
+                        use_reference_guidance and used_guidance,
+                    )
+                )
             else:
                 raise ValidationError(
                     f"Missing menu VOB for entry_id {entry.entry_id}"
@@ -3467,6 +3413,14 @@ def run(
             )
         )
 
+    if crop_jobs:
+        # Each job writes its own file; PNG encoding and the tesseract
+        # refine step both run outside the GIL.
+        workers = min(len(crop_jobs), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for future in [pool.submit(job) for job in crop_jobs]:
+                future.result()
+
     # Skip overlap check for menus with multi-page detection
     # (buttons on different pages can have overlapping coordinates)
     menus_to_check = {
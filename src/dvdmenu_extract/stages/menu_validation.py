@@ -6,6 +6,7 @@ Validates alignment between navigation-derived menu buttons and menu_map
 entries, producing a diagnostic JSON artifact and failing fast on mismatch.
 """
 
+from operator import attrgetter
 from pathlib import Path
 
 from dvdmenu_extract.models.enums import DiscFormat
@@ -20,13 +21,17 @@ from dvdmenu_extract.models.nav import NavigationModel
 from dvdmenu_extract.util.assertx import ValidationError
 from dvdmenu_extract.util.io import read_json, write_json
 
+_ENTRY_ID = attrgetter("entry_id")
+
 
 def run(nav_path: Path, menu_map_path: Path, out_dir: Path) -> MenuValidationModel:
     nav = read_json(nav_path, NavigationModel)
     menu_map = read_json(menu_map_path, MenuMapModel)
 
+    # The report models have no validators and are filled from validated
+    # inputs, so they are built with model_construct (no revalidation).
     issues: list[MenuValidationIssue] = []
-    menu_entry_ids = {entry.entry_id for entry in menu_map.entries}
+    menu_entry_ids = set(map(_ENTRY_ID, menu_map.entries))
     nav_button_ids: set[str] = set()
     menu_id_counts: dict[str, int] = {}
     nav_menu_id_counts: dict[str, int] = {}
@@ -50,14 +55,14 @@ def run(nav_path: Path, menu_map_path: Path, out_dir: Path) -> MenuValidationMod
         missing_in_nav = sorted(menu_entry_ids - nav_button_ids)
         if missing_in_menu_map:
             issues.append(
-                MenuValidationIssue(
+                MenuValidationIssue.model_construct(
                     code="buttons_missing_in_menu_map",
                     message=f"Buttons missing in menu_map: {missing_in_menu_map}",
                 )
             )
         if missing_in_nav:
             issues.append(
-                MenuValidationIssue(
+                MenuValidationIssue.model_construct(
                     code="menu_map_missing_in_buttons",
                     message=f"menu_map entries missing in nav buttons: {missing_in_nav}",
                 )
@@ -66,7 +71,7 @@ def run(nav_path: Path, menu_map_path: Path, out_dir: Path) -> MenuValidationMod
         unexpected = sorted(set(target_kind_counts) - allowed_kinds)
         if unexpected:
             issues.append(
-                MenuValidationIssue(
+                MenuValidationIssue.model_construct(
                     code="unexpected_target_kind",
                     message=f"Unexpected target kinds for DVD: {unexpected}",
                 )
@@ -79,7 +84,7 @@ def run(nav_path: Path, menu_map_path: Path, out_dir: Path) -> MenuValidationMod
             unexpected = sorted(set(target_kind_counts) - allowed_kinds)
             if unexpected:
                 issues.append(
-                    MenuValidationIssue(
+                    MenuValidationIssue.model_construct(
                         code="unexpected_target_kind",
                         message=(
                             f"Unexpected target kinds for {nav.disc_format}: {unexpected}"
@@ -89,7 +94,7 @@ def run(nav_path: Path, menu_map_path: Path, out_dir: Path) -> MenuValidationMod
 
     menu_ids = sorted(set(menu_id_counts) | set(nav_menu_id_counts))
     menu_counts = [
-        MenuValidationMenuCount(
+        MenuValidationMenuCount.model_construct(
             menu_id=menu_id,
             menu_entry_count=menu_id_counts.get(menu_id, 0),
             nav_button_count=nav_menu_id_counts.get(menu_id, 0),
@@ -100,7 +105,7 @@ def run(nav_path: Path, menu_map_path: Path, out_dir: Path) -> MenuValidationMod
         for menu in menu_counts:
             if menu.menu_entry_count != menu.nav_button_count:
                 issues.append(
-                    MenuValidationIssue(
+                    MenuValidationIssue.model_construct(
                         code="menu_count_mismatch",
                         message=(
                             f"Menu {menu.menu_id} entry/button mismatch: "
@@ -110,11 +115,11 @@ def run(nav_path: Path, menu_map_path: Path, out_dir: Path) -> MenuValidationMod
                 )
 
     target_kinds = [
-        MenuValidationTargetKindCount(kind=kind, count=count)
+        MenuValidationTargetKindCount.model_construct(kind=kind, count=count)
         for kind, count in sorted(target_kind_counts.items())
     ]
     ok = len(issues) == 0
-    model = MenuValidationModel(
+    model = MenuValidationModel.model_construct(
         ok=ok,
         disc_format=nav.disc_format,
         menu_entry_count=len(menu_entry_ids),
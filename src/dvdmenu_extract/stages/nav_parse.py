@@ -565,12 +565,14 @@ def _build_dvd_nav(
 
 
 def _build_nav_summary(nav: NavigationModel) -> NavSummaryModel:
+    # Counts come from an already-validated NavigationModel and the summary
+    # has no validators, so it is constructed without revalidation.
     if nav.disc_format == DiscFormat.DVD and nav.dvd is not None:
         titles = len(nav.dvd.titles)
         pgcs = sum(len(title.pgcs) for title in nav.dvd.titles)
         cells = sum(len(pgc.cells) for title in nav.dvd.titles for pgc in title.pgcs)
         menu_domains = len(nav.dvd.menu_domains)
-        return NavSummaryModel(
+        return NavSummaryModel.model_construct(
             disc_format=nav.disc_format,
             tracks=cells,
             entry_points=0,
@@ -581,7 +583,7 @@ def _build_nav_summary(nav: NavigationModel) -> NavSummaryModel:
             control_files=None,
         )
     if nav.disc_format == DiscFormat.SVCD and nav.svcd is not None:
-        return NavSummaryModel(
+        return NavSummaryModel.model_construct(
             disc_format=nav.disc_format,
             tracks=len(nav.svcd.tracks),
             entry_points=len(nav.svcd.entry_points),
@@ -589,10 +591,10 @@ def _build_nav_summary(nav: NavigationModel) -> NavSummaryModel:
             pgcs=None,
             cells=None,
             menu_domains=None,
-            control_files=nav.svcd.control_files,
+            control_files=nav.svcd.control_files.as_dict(),
         )
     if nav.disc_format == DiscFormat.VCD and nav.vcd is not None:
-        return NavSummaryModel(
+        return NavSummaryModel.model_construct(
             disc_format=nav.disc_format,
             tracks=len(nav.vcd.tracks),
             entry_points=len(nav.vcd.entry_points),
@@ -600,9 +602,9 @@ def _build_nav_summary(nav: NavigationModel) -> NavSummaryModel:
             pgcs=None,
             cells=None,
             menu_domains=None,
-            control_files=nav.vcd.control_files,
+            control_files=nav.vcd.control_files.as_dict(),
         )
-    return NavSummaryModel(
+    return NavSummaryModel.model_construct(
         disc_format=nav.disc_format,
         tracks=0,
         entry_points=0,
@@ -628,7 +630,9 @@ def run(
     if disc_format == DiscFormat.SVCD:
         svcd_nav = parse_svcd_directory(Path(ingest.input_path))
         write_json(out_dir / "svcd_nav.json", svcd_nav)
-        payload = {"disc_format": "SVCD", "dvd": None, "svcd": svcd_nav.model_dump(), "vcd": None}
+        # Pass the parsed model itself; pydantic accepts an already-validated
+        # instance as-is instead of re-validating a model_dump() of it.
+        payload = {"disc_format": "SVCD", "dvd": None, "svcd": svcd_nav, "vcd": None}
         model = NavigationModel.model_validate(payload)
         write_json(out_dir / "nav.json", model)
         write_json(out_dir / "nav_summary.json", _build_nav_summary(model))
@@ -636,7 +640,7 @@ def run(
     if disc_format == DiscFormat.VCD:
         vcd_nav = parse_vcd_directory(Path(ingest.input_path))
         write_json(out_dir / "vcd_nav.json", vcd_nav)
-        payload = {"disc_format": "VCD", "dvd": None, "svcd": None, "vcd": vcd_nav.model_dump()}
+        payload = {"disc_format": "VCD", "dvd": None, "svcd": None, "vcd": vcd_nav}
         model = NavigationModel.model_validate(payload)
         write_json(out_dir / "nav.json", model)
         write_json(out_dir / "nav_summary.json", _build_nav_summary(model))
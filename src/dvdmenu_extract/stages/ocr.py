@@ -87,9 +87,10 @@ def _run_stub(
     ordered_images = sorted(
         menu_images.images, key=lambda img: _entry_sort_key(img.entry_id)
     )
+    buttons_dir = menu_buttons_dir()
     for image in ordered_images:
         logging.info("performing OCR on %s.png", image.entry_id)
-        txt_path = menu_buttons_dir() / f"{image.entry_id}.txt"
+        txt_path = buttons_dir / f"{image.entry_id}.txt"
         reference_used = False
         if txt_path.is_file():
             raw_text = txt_path.read_text(encoding="utf-8-sig").strip()
@@ -103,14 +104,10 @@ def _run_stub(
                 raw_text = ""
             else:
                 raw_text = ""
-        if reference_used:
-            spu_text_nonempty = False
-            background_attempted = True
+        if reference_used or raw_text == "":
             source = "background"
         else:
-            spu_text_nonempty = raw_text != ""
-            background_attempted = not spu_text_nonempty
-            source = "spu" if spu_text_nonempty else "background"
+            source = "spu"
         raw_text = _cleanup_ocr_text(raw_text)
         logging.info("OCR Result: %s", raw_text)
         cleaned = (
@@ -125,8 +122,6 @@ def _run_stub(
                 cleaned_label=cleaned,
                 confidence=0.9,
                 source=source,
-                background_attempted=background_attempted,
-                spu_text_nonempty=spu_text_nonempty,
             )
         )
     return OcrModel(results=entries)
@@ -526,12 +521,7 @@ def _run_real(menu_images: MenuImagesModel, ocr_lang: str) -> OcrModel:
         logging.info("OCR choice for %s: %s", image.entry_id, chosen_name)
         logging.info("OCR Result: %s", raw_text)
 
-        # Set source flags consistently with chosen candidate
-        is_spu = chosen_name.startswith("spu")
-        source = "spu" if is_spu else "background"
-        # Model requires exactly one of these to be true.
-        spu_text_nonempty = is_spu
-        background_attempted = not is_spu
+        source = "spu" if chosen_name.startswith("spu") else "background"
         cleaned = (
             sanitize_filename(raw_text)
             if raw_text
@@ -544,8 +534,6 @@ def _run_real(menu_images: MenuImagesModel, ocr_lang: str) -> OcrModel:
                 cleaned_label=cleaned,
                 confidence=0.0,
                 source=source,
-                background_attempted=background_attempted,
-                spu_text_nonempty=spu_text_nonempty,
             )
         )
     return OcrModel(results=entries)
@@ -6,6 +6,7 @@ Builds segment boundaries from the navigation and menu map. This stage is
 format-neutral and must not rely on DVD-specific structures.
 """
 
+from operator import attrgetter
 from pathlib import Path
 import logging
 import shutil
@@ -15,12 +16,14 @@ from dvdmenu_extract.models.segments import SegmentsModel
 from dvdmenu_extract.util.assertx import ValidationError
 from dvdmenu_extract.util.io import read_json, write_json
 
+_ENTRY_ID = attrgetter("entry_id")
+
 
 def run(menu_map_path: Path, timing_path: Path, out_dir: Path) -> SegmentsModel:
     menu_map = read_json(menu_map_path, MenuMapModel)
     timing = read_json(timing_path, SegmentsModel)
 
-    menu_entry_ids = {entry.entry_id for entry in menu_map.entries}
+    menu_entry_ids = set(map(_ENTRY_ID, menu_map.entries))
     for entry in timing.segments:
         if entry.entry_id not in menu_entry_ids:
             raise ValidationError("segments include unknown entry_id")
@@ -38,17 +41,16 @@ def run(menu_map_path: Path, timing_path: Path, out_dir: Path) -> SegmentsModel:
         if new_id != entry.entry_id:
             changed = True
             entry.entry_id = new_id
+    remapped_segments = []
     for segment in timing.segments:
         new_id = id_map.get(segment.entry_id, segment.entry_id)
         if new_id != segment.entry_id:
             changed = True
-            segment.entry_id = new_id
-    timing.segments = [
-        segment
-        for segment in sorted(
-            timing.segments, key=lambda seg: (seg.start_time, seg.entry_id)
-        )
-    ]
+            segment = segment.model_copy(update={"entry_id": new_id})
+        remapped_segments.append(segment)
+    timing.segments = sorted(
+        remapped_segments, key=lambda seg: (seg.start_time, seg.entry_id)
+    )
     def _entry_sort_key(entry_id: str) -> int:
         digits = "".join(ch for ch in entry_id if ch.isdigit())
         return int(digits) if digits else 0
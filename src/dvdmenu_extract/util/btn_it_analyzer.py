@@ -12,7 +12,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-from dvdmenu_extract.util.libdvdread_compat import parse_nav_pack_buttons
+from dvdmenu_extract.util.libdvdread_compat import BTN_IT_ENTRY, parse_nav_pack_buttons
 
 
 @dataclass
@@ -166,14 +166,12 @@ def parse_button_info_from_nav_pack(nav_pack: bytes, nav_pack_idx: int) -> Butto
         if marker >= 0:
             pci_start = marker + 4 + 2 + 1
             btn_it_start = pci_start + 0x0bb
-            entry_start = btn_it_start + (i * 18)
+            entry_start = btn_it_start + (i * BTN_IT_ENTRY.size)
             
-            if entry_start + 18 <= len(nav_pack):
-                entry = nav_pack[entry_start : entry_start + 18]
-                vm_cmd_up = (entry[10] << 8) | entry[11]
-                vm_cmd_down = (entry[12] << 8) | entry[13]
-                vm_cmd_left = (entry[14] << 8) | entry[15]
-                vm_cmd_right = (entry[16] << 8) | entry[17]
+            if entry_start + BTN_IT_ENTRY.size <= len(nav_pack):
+                vm_cmd_up, vm_cmd_down, vm_cmd_left, vm_cmd_right = (
+                    BTN_IT_ENTRY.unpack_from(nav_pack, entry_start)[10:]
+                )
             else:
                 vm_cmd_up = vm_cmd_down = vm_cmd_left = vm_cmd_right = 0
         else:
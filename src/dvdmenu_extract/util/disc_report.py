@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from dvdmenu_extract.models.enums import DiscFormat
-from dvdmenu_extract.models.ingest import DiscFileEntry, DiscReport, VideoTsReport
+from dvdmenu_extract.models.ingest import DiscReport, VideoTsReport
 from dvdmenu_extract.util.assertx import assert_dir_exists
 from dvdmenu_extract.util.video_ts import build_video_ts_report
 from dvdmenu_extract.util.video_tracks import list_video_tracks
@@ -15,16 +15,21 @@ def build_disc_report(input_path: Path) -> DiscReport:
     video_ts_dir = input_path / "VIDEO_TS"
     mpeg2_dir = input_path / "MPEG2"
 
-    files: list[DiscFileEntry] = []
+    # File paths and sizes are collected column-wise; DiscReport validates
+    # the whole file list in one pass at the end instead of one model per file.
+    file_paths: list[str] = []
+    file_sizes: list[int] = []
     seen_paths: set[str] = set()
     directories: list[str] = []
     total_bytes = 0
 
-    def add_files(directory: Path, patterns: list[str]) -> int:
+    def add_files(directory: Path, patterns: list[str]) -> tuple[int, int]:
+        """Add matching files; return (file count, byte total) for this call."""
         nonlocal total_bytes
         count = 0
+        added_bytes = 0
         if not directory.is_dir():
-            return 0
+            return 0, 0
         directories.append(str(directory))
         for pattern in patterns:
             for path in sorted(directory.glob(pattern)):
@@ -35,10 +40,12 @@ def build_disc_report(input_path: Path) -> DiscReport:
                     continue
                 seen_paths.add(key)
                 size = path.stat().st_size
-                total_bytes += size
-                files.append(DiscFileEntry(path=str(path), size_bytes=size))
+                added_bytes += size
+                file_paths.append(str(path))
+                file_sizes.append(size)
                 count += 1
-        return count
+        total_bytes += added_bytes
+        return count, added_bytes
 
     video_ts_report: VideoTsReport | None = None
     mpeg2_count = None
@@ -66,12 +73,7 @@ def build_disc_report(input_path: Path) -> DiscReport:
         add_files(svcd_dir, ["*.SVD", "*.DAT"])
         add_files(segment_dir, ["*.MPG", "*.mpg"])
         add_files(ext_dir, ["*.DAT"])
-        mpeg2_count = add_files(mpeg2_dir, ["*.MPG", "*.mpg"])
-        mpeg2_total = sum(
-            entry.size_bytes
-            for entry in files
-            if Path(entry.path).parent.name.upper() == "MPEG2"
-        )
+        mpeg2_count, mpeg2_total = add_files(mpeg2_dir, ["*.MPG", "*.mpg"])
         disc_format = DiscFormat.SVCD
     elif (
         vcd_dir.is_dir()
@@ -80,12 +82,7 @@ def build_disc_report(input_path: Path) -> DiscReport:
         and mpegav_dir.is_dir()
     ):
         add_files(vcd_dir, ["*.VCD", "*.DAT"])
-        mpegav_count = add_files(mpegav_dir, ["*.DAT", "*.dat"])
-        mpegav_total = sum(
-            entry.size_bytes
-            for entry in files
-            if Path(entry.path).parent.name.upper() == "MPEGAV"
-        )
+        mpegav_count, mpegav_total = add_files(mpegav_dir, ["*.DAT", "*.dat"])
         disc_format = DiscFormat.VCD
     else:
         disc_format = DiscFormat.UNKNOWN
@@ -93,10 +90,13 @@ def build_disc_report(input_path: Path) -> DiscReport:
     video_tracks = list_video_tracks(input_path, disc_format)
     return DiscReport(
         disc_format=disc_format,
-        file_count=len(files),
+        file_count=len(file_paths),
         total_bytes=total_bytes,
         directories=directories,
-        files=files,
+        files=[
+            {"path": path, "size_bytes": size}
+            for path, size in zip(file_paths, file_sizes)
+        ],
         video_ts_report=video_ts_report,
         mpeg2_file_count=mpeg2_count,
         mpeg2_total_bytes=mpeg2_total,
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import hashlib
 import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, TypeVar
 
@@ -21,6 +23,8 @@ class StageMeta:
     duration_ms: int
     inputs: list[str]
     outputs: list[str]
+    # artifact_stamp() of the stage's cached artifact once it was known valid.
+    cache_stamp: list[int] | None = None
 
 
 def utc_now_iso() -> str:
@@ -29,15 +33,18 @@ def utc_now_iso() -> str:
 
 def read_json(path: Path, model_type: type[T]) -> T:
     assert_file_exists(path)
-    with path.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
-    return model_type.model_validate(payload)
+    # Validate straight from the raw bytes: pydantic-core parses and builds
+    # the model in one pass, without an intermediate dict tree. The validator
+    # is built once per class, so there is nothing to cache here.
+    return model_type.model_validate_json(path.read_bytes())
 
 
 def write_json(path: Path, model: BaseModel) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(model.model_dump(mode="json"), handle, ensure_ascii=False, indent=2)
+    # Serialized by the model class's own pydantic-core serializer straight
+    # to UTF-8 bytes: no model_dump() dict tree, no stdlib encoder pass, and
+    # no str round-trip before the write.
+    path.write_bytes(type(model).__pydantic_serializer__.to_json(model, indent=2))
 
 
 def write_raw_json(path: Path, payload: Any) -> None:
@@ -50,3 +57,37 @@ def write_stage_meta(out_dir: Path, meta: StageMeta) -> None:
     meta_path = out_dir / "stage_meta" / f"{meta.stage}.json"
     assert_in_out_dir(meta_path, out_dir)
     write_raw_json(meta_path, meta.__dict__)
+
+
+def file_stamp(path: Path) -> list[int]:
+    """Return [mtime_ns, size] for path; it changes whenever the file is rewritten."""
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+@lru_cache(maxsize=None)
+def schema_fingerprint(model_type: type[BaseModel]) -> int:
+    """Return a 64-bit hash of model_type's JSON schema.
+
+    It changes whenever the model's fields or constraints do, so artifacts
+    written by an older version of the code are revalidated.
+    """
+    schema = json.dumps(model_type.model_json_schema(), sort_keys=True)
+    digest = hashlib.blake2b(schema.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def artifact_stamp(path: Path, model_type: type[BaseModel]) -> list[int]:
+    """Return file_stamp(path) plus the schema fingerprint of model_type."""
+    return [*file_stamp(path), schema_fingerprint(model_type)]
+
+
+def read_stage_cache_stamp(out_dir: Path, stage: str) -> list[int] | None:
+    meta_path = out_dir / "stage_meta" / f"{stage}.json"
+    try:
+        payload = json.loads(meta_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    return payload.get("cache_stamp")
@@ -8,10 +8,13 @@ Reference:
 https://raw.githubusercontent.com/mirror/libdvdread/master/src/dvdread/ifo_types.h
 """
 
+import struct
 from dataclasses import dataclass
 
 
 DVD_BLOCK_LEN = 2048
+# One BTN_IT entry: 6 rect bytes, 4 nav link bytes, 4 VM commands (u16 BE)
+BTN_IT_ENTRY = struct.Struct(">6B4B4H")
 
 
 def read_u16(data: bytes, offset: int) -> int:
@@ -98,22 +101,17 @@ def parse_nav_pack_buttons(nav_pack: bytes) -> NavPackButtons | None:
         range(start_index, min(start_index + btn_ns, 37))
     )
     for i in range(36):
-        entry = nav_pack[btn_it_start + (i * 18) : btn_it_start + ((i + 1) * 18)]
-        if len(entry) < 6:
-            continue
-        rect = decode_btn_it_rect(entry)
-        up = entry[6] & 0x3F
-        down = entry[7] & 0x3F
-        left = entry[8] & 0x3F
-        right = entry[9] & 0x3F
-        rects.append(rect)
+        b0, b1, b2, b3, b4, b5, up, down, left, right, *_ = BTN_IT_ENTRY.unpack_from(
+            nav_pack, btn_it_start + i * BTN_IT_ENTRY.size
+        )
+        rects.append(_decode_rect_bytes(b0, b1, b2, b3, b4, b5))
         links.append(
             {
                 "index": i + 1,
-                "up": up,
-                "down": down,
-                "left": left,
-                "right": right,
+                "up": up & 0x3F,
+                "down": down & 0x3F,
+                "left": left & 0x3F,
+                "right": right & 0x3F,
             }
         )
     return NavPackButtons(
@@ -128,7 +126,12 @@ def parse_nav_pack_buttons(nav_pack: bytes) -> NavPackButtons | None:
 
 
 def decode_btn_it_rect(entry: bytes) -> tuple[int, int, int, int] | None:
-    b0, b1, b2, b3, b4, b5 = entry[0], entry[1], entry[2], entry[3], entry[4], entry[5]
+    return _decode_rect_bytes(*entry[:6])
+
+
+def _decode_rect_bytes(
+    b0: int, b1: int, b2: int, b3: int, b4: int, b5: int
+) -> tuple[int, int, int, int] | None:
     x1 = ((b0 & 0x3F) << 4) | (b1 >> 4)
     x2 = ((b1 & 0x03) << 8) | b2
     y1 = ((b3 & 0x3F) << 4) | (b4 >> 4)
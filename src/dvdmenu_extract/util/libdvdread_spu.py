@@ -26,20 +26,21 @@ Module Structure:
         - parse_spu_control(): Parse control structure from SPU packet
         - decode_spu_bitmap(): Decode RLE bitmap using control data
         - bitmap_connected_components(): Find bounding boxes of regions
+        - count_non_zero_pixels(): Count non-transparent bitmap pixels
         - find_spu_button_rects(): High-level API for button extraction
         - iter_spu_packets(): Iterate SPU packets from MPEG-PS data
+        - reassemble_spu_packets(): Join fragmented SPU packets per substream
     
     Helper Functions:
         - _decode_field(): Decode one interlaced field
         - _decode_run(): Decode one RLE run
-        - _read_bits(): Read bits from packed data
-        - _align_to_byte(): Align bit position to byte boundary
+        - _align_to_byte(): Align nibble position to byte boundary
 
 Algorithm Overview:
     1. Parse MPEG-PS structure to find SPU packets (private stream 1, 0xBD)
     2. Parse control sequence to get display area and bitmap offsets
     3. Decode RLE-compressed bitmap (two interlaced fields)
-    4. Find connected components (flood-fill on non-zero pixels)
+    4. Find connected components (run-based union-find on non-zero pixels)
     5. Return bounding boxes for each component
 
 SPU Packet Format:
@@ -105,11 +106,15 @@ See Also:
     - DVD_MENU_HIGHLIGHT_DETECTION_RESEARCH.md: Algorithm validation
 """
 
+import re
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, Iterator
 
 from dvdmenu_extract.util.libdvdread_compat import read_u16
 
+_NON_ZERO_RUN_RE = re.compile(rb"[^\x00]+")
+_SPU_BUFFER_COMPACT_BYTES = 1 << 20
+
 
 @dataclass(frozen=True)
 class SpuControl:
@@ -128,7 +133,7 @@ class SpuBitmap:
     y: int
     width: int
     height: int
-    pixels: list[list[int]]
+    pixels: list[bytearray]  # one byte (2-bit color index) per pixel
     # alpha / color info is not needed for mask; presence of non-zero pixels is enough.
 
 
@@ -196,13 +201,32 @@ def parse_spu_control(packet: bytes) -> SpuControl | None:
     return None
 
 
-def decode_spu_bitmap(packet: bytes, control: SpuControl) -> SpuBitmap | None:
+def decode_spu_bitmap(
+    packet: bytes,
+    control: SpuControl,
+    out: list[bytearray] | None = None,
+) -> SpuBitmap | None:
+    """Decode the packet's RLE bitmap.
+
+    If ``out`` is given, its rows are cleared and reused as pixel storage
+    (grown or trimmed to the bitmap size), so a loop over many packets does
+    not allocate a fresh bitmap each time. The returned bitmap then shares
+    that storage and is only valid until ``out`` is reused.
+    """
     width = control.x2 - control.x1 + 1
     height = control.y2 - control.y1 + 1
     if width <= 0 or height <= 0:
         return None
 
-    pixels = [[0 for _ in range(width)] for _ in range(height)]
+    if out is None:
+        pixels = [bytearray(width) for _ in range(height)]
+    else:
+        pixels = out
+        del pixels[height:]
+        blank = bytes(width)
+        for row in pixels:
+            row[:] = blank
+        pixels.extend(bytearray(width) for _ in range(height - len(pixels)))
     _decode_field(
         packet=packet,
         start_offset=control.offset1,
@@ -229,44 +253,68 @@ def decode_spu_bitmap(packet: bytes, control: SpuControl) -> SpuBitmap | None:
 
 
 def bitmap_connected_components(bitmap: SpuBitmap) -> list[tuple[int, int, int, int]]:
-    width = bitmap.width
-    height = bitmap.height
-    visited = [[False for _ in range(width)] for _ in range(height)]
-    rects: list[tuple[int, int, int, int]] = []
+    """Return bounding boxes of 4-connected non-zero regions.
+
+    Labels horizontal runs instead of single pixels: runs are located per row
+    with a compiled regex and merged with the runs they touch in the row above
+    via union-find. Boxes are ordered by each region's first pixel in raster
+    order.
+    """
+    parent: list[int] = []
+    boxes: list[list[int]] = []  # per run label: [min_x, min_y, max_x, max_y]
+
+    def find(label: int) -> int:
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    prev_runs: list[tuple[int, int, int]] = []  # (start_x, end_x, label)
+    for y, row in enumerate(bitmap.pixels):
+        runs: list[tuple[int, int, int]] = []
+        j = 0
+        for match in _NON_ZERO_RUN_RE.finditer(row):
+            start = match.start()
+            end = match.end() - 1
+            label = len(parent)
+            parent.append(label)
+            boxes.append([start, y, end, y])
+            while j < len(prev_runs) and prev_runs[j][1] < start:
+                j += 1
+            k = j
+            while k < len(prev_runs) and prev_runs[k][0] <= end:
+                root_a = find(label)
+                root_b = find(prev_runs[k][2])
+                if root_a != root_b:
+                    # Keep the earlier (raster order) label as the root.
+                    if root_a > root_b:
+                        root_a, root_b = root_b, root_a
+                    parent[root_b] = root_a
+                    box_a = boxes[root_a]
+                    box_b = boxes[root_b]
+                    box_a[0] = min(box_a[0], box_b[0])
+                    box_a[1] = min(box_a[1], box_b[1])
+                    box_a[2] = max(box_a[2], box_b[2])
+                    box_a[3] = max(box_a[3], box_b[3])
+                k += 1
+            runs.append((start, end, label))
+        prev_runs = runs
+
+    return [
+        (
+            bitmap.x + box[0],
+            bitmap.y + box[1],
+            bitmap.x + box[2],
+            bitmap.y + box[3],
+        )
+        for label, box in enumerate(boxes)
+        if parent[label] == label
+    ]
 
-    for y in range(height):
-        for x in range(width):
-            if visited[y][x] or bitmap.pixels[y][x] == 0:
-                continue
-            stack = [(x, y)]
-            visited[y][x] = True
-            min_x = max_x = x
-            min_y = max_y = y
-            while stack:
-                cx, cy = stack.pop()
-                min_x = min(min_x, cx)
-                max_x = max(max_x, cx)
-                min_y = min(min_y, cy)
-                max_y = max(max_y, cy)
-                for nx, ny in (
-                    (cx - 1, cy),
-                    (cx + 1, cy),
-                    (cx, cy - 1),
-                    (cx, cy + 1),
-                ):
-                    if 0 <= nx < width and 0 <= ny < height:
-                        if not visited[ny][nx] and bitmap.pixels[ny][nx] != 0:
-                            visited[ny][nx] = True
-                            stack.append((nx, ny))
-            rects.append(
-                (
-                    bitmap.x + min_x,
-                    bitmap.y + min_y,
-                    bitmap.x + max_x,
-                    bitmap.y + max_y,
-                )
-            )
-    return rects
+
+def count_non_zero_pixels(bitmap: SpuBitmap) -> int:
+    """Count non-transparent pixels using bytearray.count on each row."""
+    return sum(len(row) - row.count(0) for row in bitmap.pixels)
 
 
 def find_spu_button_rects(packet: bytes) -> list[tuple[int, int, int, int]]:
@@ -289,7 +337,7 @@ def find_spu_text_band_rects(bitmap: SpuBitmap) -> list[tuple[int, int, int, int
         if not row:
             row_ratios.append(0.0)
             continue
-        non_zero = sum(1 for px in row if px != 0)
+        non_zero = len(row) - row.count(0)
         row_ratios.append(non_zero / len(row))
     mean_ratio = sum(row_ratios) / len(row_ratios)
     variance = sum((r - mean_ratio) ** 2 for r in row_ratios) / len(row_ratios)
@@ -494,63 +542,98 @@ def iter_spu_packets(ps_data: bytes) -> Iterable[tuple[int, bytes]]:
         offset = payload_end
 
 
+def reassemble_spu_packets(ps_data: bytes) -> Iterator[tuple[int, bytes]]:
+    """Reassemble complete SPU packets from fragmented PES payloads.
+
+    SPU packets are often split across several PES packets. Payloads are
+    buffered per substream and a packet is yielded as soon as the buffer holds
+    the number of bytes given by its 16-bit size header. Every complete packet
+    in the buffer is yielded, which matters for multi-page menus where one
+    payload can finish one page and start the next.
+
+    Consumed bytes are tracked with a read offset instead of re-slicing the
+    buffer after every packet; the buffer is only compacted once the consumed
+    prefix is large.
+    """
+    buffers: dict[int, bytearray] = {}
+    read_offsets: dict[int, int] = {}
+    expected_sizes: dict[int, int] = {}
+
+    for substream_id, payload in iter_spu_packets(ps_data):
+        buffer = buffers.get(substream_id)
+        if buffer is None:
+            buffer = buffers[substream_id] = bytearray()
+        buffer.extend(payload)
+        offset = read_offsets.get(substream_id, 0)
+
+        # Read the size header if we don't have one (or it's 0)
+        expected = expected_sizes.get(substream_id, 0)
+        if expected == 0 and len(buffer) - offset >= 2:
+            expected = read_u16(buffer, offset)
+
+        while expected > 0 and len(buffer) - offset >= expected:
+            packet = bytes(buffer[offset : offset + expected])
+            offset += expected
+            yield (substream_id, packet)
+            if len(buffer) - offset >= 2:
+                expected = read_u16(buffer, offset)
+            else:
+                expected = 0
+
+        if offset > _SPU_BUFFER_COMPACT_BYTES and offset * 2 > len(buffer):
+            del buffer[:offset]
+            offset = 0
+        read_offsets[substream_id] = offset
+        expected_sizes[substream_id] = expected
+
+
 def _decode_field(
     packet: bytes,
     start_offset: int,
     width: int,
     height: int,
     row_start: int,
-    pixels: list[list[int]],
+    pixels: list[bytearray],
 ) -> None:
     if start_offset < 0 or start_offset >= len(packet):
         return
-    bit_pos = start_offset * 8
+    # RLE codes are nibble-aligned, so track the position in nibbles rather
+    # than bits and index the packet bytes directly.
+    nibble_pos = start_offset * 2
     for row in range(height):
+        target_row = row_start + (row * 2)
+        line = pixels[target_row] if 0 <= target_row < len(pixels) else None
         x = 0
         while x < width:
-            run_len, color, bit_pos = _decode_run(packet, bit_pos)
+            run_len, color, nibble_pos = _decode_run(packet, nibble_pos)
             if run_len is None:
                 run_len = width - x
             if run_len <= 0:
                 run_len = width - x
             run_len = min(run_len, width - x)
-            target_row = row_start + (row * 2)
-            if 0 <= target_row < len(pixels):
-                for ix in range(x, x + run_len):
-                    pixels[target_row][ix] = color
+            # Rows start zeroed, so only non-transparent runs need writing.
+            if line is not None and color:
+                line[x : x + run_len] = bytes((color,)) * run_len
             x += run_len
-        bit_pos = _align_to_byte(bit_pos)
+        nibble_pos = _align_to_byte(nibble_pos)
 
 
-def _decode_run(packet: bytes, bit_pos: int) -> tuple[int | None, int, int]:
+def _decode_run(packet: bytes, nibble_pos: int) -> tuple[int | None, int, int]:
+    length = len(packet)
     v = 0
     t = 1
     while v < t and t <= 0x40:
-        nibble, bit_pos = _read_bits(packet, bit_pos, 4)
+        byte_index = nibble_pos >> 1
+        byte = packet[byte_index] if byte_index < length else 0
+        nibble = (byte & 0x0F) if nibble_pos & 1 else (byte >> 4)
         v = (v << 4) | nibble
+        nibble_pos += 1
         t <<= 2
     color = v & 0x03
     if v < 4:
-        return None, color, bit_pos
-    return v >> 2, color, bit_pos
-
-
-def _read_bits(packet: bytes, bit_pos: int, count: int) -> tuple[int, int]:
-    value = 0
-    for _ in range(count):
-        byte_index = bit_pos // 8
-        if byte_index >= len(packet):
-            value <<= 1
-            bit_pos += 1
-            continue
-        bit_index = 7 - (bit_pos % 8)
-        value = (value << 1) | ((packet[byte_index] >> bit_index) & 0x01)
-        bit_pos += 1
-    return value, bit_pos
+        return None, color, nibble_pos
+    return v >> 2, color, nibble_pos
 
 
-def _align_to_byte(bit_pos: int) -> int:
-    remainder = bit_pos % 8
-    if remainder == 0:
-        return bit_pos
-    return bit_pos + (8 - remainder)
+def _align_to_byte(nibble_pos: int) -> int:
+    return nibble_pos + (nibble_pos & 1)
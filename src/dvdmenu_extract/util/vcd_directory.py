@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from dvdmenu_extract.models.enums import DiscFormat
+from dvdmenu_extract.models.enums import ControlFile, DiscFormat
 from dvdmenu_extract.models.svcd_nav import SvcdEntryPoint, SvcdNavModel, SvcdTrack
 from dvdmenu_extract.models.vcd_nav import VcdNavModel
 from dvdmenu_extract.util.assertx import ValidationError
@@ -35,12 +35,11 @@ def parse_svcd_directory(input_path: Path) -> SvcdNavModel:
     if not tracks:
         raise ValidationError("SVCD has no AVSEQ*.MPG tracks")
 
-    control_files = {
-        "info": True,
-        "entries": True,
-        "psd": (svcd_dir / "PSD.SVD").is_file(),
-        "lot": (svcd_dir / "LOT.SVD").is_file(),
-    }
+    control_files = ControlFile.INFO | ControlFile.ENTRIES
+    if (svcd_dir / "PSD.SVD").is_file():
+        control_files |= ControlFile.PSD
+    if (svcd_dir / "LOT.SVD").is_file():
+        control_files |= ControlFile.LOT
     return SvcdNavModel(
         source="directory",
         control_files=control_files,
@@ -69,12 +68,11 @@ def parse_vcd_directory(input_path: Path) -> VcdNavModel:
     if not tracks:
         raise ValidationError("VCD has no AVSEQ*.DAT tracks")
 
-    control_files = {
-        "info": True,
-        "entries": True,
-        "psd": (vcd_dir / "PSD.VCD").is_file(),
-        "lot": (vcd_dir / "LOT.VCD").is_file(),
-    }
+    control_files = ControlFile.INFO | ControlFile.ENTRIES
+    if (vcd_dir / "PSD.VCD").is_file():
+        control_files |= ControlFile.PSD
+    if (vcd_dir / "LOT.VCD").is_file():
+        control_files |= ControlFile.LOT
     return VcdNavModel(
         source="directory",
         control_files=control_files,
@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 import re
 
-from dvdmenu_extract.models.ingest import VideoTsFileEntry, VideoTsReport
+from dvdmenu_extract.models.ingest import VideoTsReport
 from dvdmenu_extract.util.assertx import ValidationError, assert_dir_exists
 
 _VTS_TITLE_RE = re.compile(r"^VTS_(\d{2})_0\.IFO$", re.IGNORECASE)
@@ -18,7 +18,8 @@ def build_video_ts_report(video_ts_dir: Path) -> VideoTsReport:
     if missing:
         raise ValidationError(f"Missing required VIDEO_TS files: {missing}")
 
-    files: list[VideoTsFileEntry] = []
+    # Plain dicts; VideoTsReport validates the list in one pass.
+    files: list[dict[str, str | int]] = []
     total_bytes = 0
     ifo_total = 0
     bup_total = 0
@@ -40,7 +41,7 @@ def build_video_ts_report(video_ts_dir: Path) -> VideoTsReport:
         match = _VTS_TITLE_RE.match(path.name)
         if match:
             titles.add(match.group(1))
-        files.append(VideoTsFileEntry(name=path.name, size_bytes=size))
+        files.append({"name": path.name, "size_bytes": size})
 
     return VideoTsReport(
         file_count=len(files),
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 import pytest
 from pydantic import ValidationError as PydanticValidationError
 
 from dvdmenu_extract.models.menu import MenuMapModel
+from dvdmenu_extract.models.ocr import OcrEntryModel
 from dvdmenu_extract.models.segments import SegmentsModel
 from dvdmenu_extract.pipeline import PipelineOptions, run_pipeline
+from dvdmenu_extract.util import io as io_util
 from dvdmenu_extract.util.assertx import ValidationError
+from dvdmenu_extract.stages.finalize import run as finalize_run
 from dvdmenu_extract.stages.ingest import run as ingest_run
 from tests.helpers import fixtures_dir
 
@@ -95,6 +99,32 @@ def test_until_does_not_require_finalize(tmp_path: Path) -> None:
     )
 
 
+def test_finalize_rejects_entry_id_mismatch(tmp_path: Path) -> None:
+    options = PipelineOptions(
+        ocr_lang="eng+heb",
+        use_real_ocr=False,
+        use_real_ffmpeg=False,
+        repair="off",
+        force=True,
+        json_out_root=False,
+        json_root_dir=False,
+        use_real_timing=False,
+        allow_dvd_ifo_fallback=True,
+    )
+    run_pipeline(
+        input_path=fixtures_dir() / "disc_minimal",
+        out_dir=tmp_path,
+        options=options,
+        until="verify_extract",
+    )
+    extract_path = tmp_path / "extract.json"
+    payload = json.loads(extract_path.read_text(encoding="utf-8"))
+    payload["outputs"] = payload["outputs"][1:]
+    extract_path.write_text(json.dumps(payload), encoding="utf-8")
+    with pytest.raises(ValidationError, match="menu_map and extract"):
+        finalize_run(tmp_path, stage_status={})
+
+
 def test_duplicate_button_ids_rejected(tmp_path: Path) -> None:
     payload = {
         "entries": [
@@ -144,3 +174,55 @@ def test_negative_timestamps_rejected(tmp_path: Path) -> None:
     payload = {"segments": [{"entry_id": "btn1", "start_time": -1.0, "end_time": 1.0}]}
     with pytest.raises(PydanticValidationError):
         SegmentsModel.model_validate(payload)
+
+
+def test_ocr_source_flags_must_match_source(tmp_path: Path) -> None:
+    payload = {
+        "entry_id": "btn1",
+        "raw_text": "Episode 1",
+        "cleaned_label": "Episode 1",
+        "confidence": 0.9,
+        "source": "spu",
+        "background_attempted": True,
+        "spu_text_nonempty": True,
+    }
+    with pytest.raises(PydanticValidationError, match="background_attempted"):
+        OcrEntryModel.model_validate(payload)
+
+
+def test_cached_artifact_revalidated_after_schema_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    options = PipelineOptions(
+        ocr_lang="eng+heb",
+        use_real_ocr=False,
+        use_real_ffmpeg=False,
+        repair="off",
+        force=False,
+        json_out_root=False,
+        json_root_dir=False,
+        use_real_timing=False,
+        allow_dvd_ifo_fallback=True,
+    )
+    input_path = fixtures_dir() / "disc_minimal"
+    run_pipeline(
+        input_path=input_path, out_dir=tmp_path, options=options, until="menu_map"
+    )
+
+    # Make menu_map.json invalid without changing its size or mtime.
+    menu_map_path = tmp_path / "menu_map.json"
+    stat = menu_map_path.stat()
+    text = menu_map_path.read_text(encoding="utf-8")
+    text = text.replace('"entry_id"', '"entry_iX"', 1)
+    menu_map_path.write_text(text, encoding="utf-8")
+    os.utime(menu_map_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    run_pipeline(
+        input_path=input_path, out_dir=tmp_path, options=options, stage="menu_map"
+    )
+
+    # A different schema fingerprint invalidates the stamp, so it is read again.
+    monkeypatch.setattr(io_util, "schema_fingerprint", lambda model_type: 0)
+    with pytest.raises(PydanticValidationError):
+        run_pipeline(
+            input_path=input_path, out_dir=tmp_path, options=options, stage="menu_map"
+        )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 from dvdmenu_extract.models.menu import MenuMapModel
@@ -36,3 +37,18 @@ def test_schema_roundtrip_ocr(tmp_path: Path) -> None:
     write_json(tmp_path / "ocr.json", model)
     roundtrip = read_json(tmp_path / "ocr.json", OcrModel)
     assert roundtrip.model_dump(mode="json") == model.model_dump(mode="json")
+
+
+def test_schema_roundtrip_ocr_source_flags(tmp_path: Path) -> None:
+    model = OcrModel.model_validate(load_expected_json("ocr.json"))
+    write_json(tmp_path / "ocr.json", model)
+    payload = json.loads((tmp_path / "ocr.json").read_text(encoding="utf-8"))
+    for entry in payload["results"]:
+        assert entry["spu_text_nonempty"] == (entry["source"] == "spu")
+        assert entry["background_attempted"] == (entry["source"] == "background")
+    # The exported (validation) schema must accept the flags ocr.json carries.
+    properties = OcrModel.model_json_schema()["$defs"]["OcrEntryModel"]["properties"]
+    assert properties["spu_text_nonempty"]["type"] == "boolean"
+    assert properties["background_attempted"]["type"] == "boolean"
+    roundtrip = read_json(tmp_path / "ocr.json", OcrModel)
+    assert roundtrip == model
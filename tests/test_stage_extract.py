@@ -2,12 +2,16 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
+from dvdmenu_extract.stages import extract as extract_stage
 from dvdmenu_extract.stages.extract import run as extract_run
 from dvdmenu_extract.stages.ingest import run as ingest_run
 from dvdmenu_extract.stages.menu_map import run as menu_map_run
 from dvdmenu_extract.stages.nav_parse import run as nav_parse_run
 from dvdmenu_extract.stages.segments import run as segments_run
 from dvdmenu_extract.stages.timing import run as timing_run
+from dvdmenu_extract.util.assertx import ValidationError
 from tests.helpers import fixtures_dir
 
 
@@ -40,3 +44,108 @@ def test_stage_extract_stub(tmp_path: Path) -> None:
     assert len(extract.outputs) == 3
     for entry in extract.outputs:
         assert Path(entry.output_path).is_file()
+
+
+def test_build_entry_source_missing_file_raises(tmp_path: Path) -> None:
+    with pytest.raises(ValidationError, match="Missing source file"):
+        extract_stage._build_entry_source([tmp_path / "AVSEQ01.MPG"], {}, {})
+
+
+def test_build_entry_source_keeps_only_current_durations(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    track = tmp_path / "AVSEQ01.MPG"
+    track.write_bytes(b"\x00" * 16)
+    key = extract_stage._duration_cache_key(track)
+
+    def _no_probe(path: Path) -> float:
+        raise AssertionError(f"unexpected probe of {path}")
+
+    monkeypatch.setattr(extract_stage, "get_duration_seconds", _no_probe)
+    duration_cache: dict[str, float] = {}
+    source = extract_stage._build_entry_source(
+        [track], duration_cache, {key: 12.5, "/gone.MPG:1:2": 3.0}
+    )
+
+    assert source.durations == [12.5]
+    assert duration_cache == {key: 12.5}
+
+
+def test_coalesce_sector_ranges_joins_only_back_to_back_ranges() -> None:
+    ranges = [(0, 9), (10, 19), (5, 4), (30, 39), (30, 39), (20, 25), (26, 26)]
+    # Empty ranges are dropped; repeated and out-of-order cells stay as they
+    # are, since playback order must be kept.
+    assert extract_stage._coalesce_sector_ranges(ranges) == [
+        (0, 19),
+        (30, 39),
+        (30, 39),
+        (20, 26),
+    ]
+    assert extract_stage._coalesce_sector_ranges([]) == []
+
+
+def _write_vobs(tmp_path: Path, sector_counts: list[int]) -> list[Path]:
+    """Write VOBs whose sectors are filled with their global sector index."""
+    paths: list[Path] = []
+    sector = 0
+    for index, count in enumerate(sector_counts, start=1):
+        path = tmp_path / f"VTS_01_{index}.VOB"
+        payload = b"".join(bytes([(sector + i) % 256]) * 2048 for i in range(count))
+        # A trailing partial sector is not part of the sector map.
+        path.write_bytes(payload + b"\xff" * 100)
+        paths.append(path)
+        sector += count
+    return paths
+
+
+def _expected_sectors(ranges: list[tuple[int, int]]) -> bytes:
+    return b"".join(
+        bytes([sector % 256]) * 2048
+        for start, end in ranges
+        for sector in range(start, end + 1)
+    )
+
+
+def test_write_sector_ranges_finds_first_vob_across_boundaries(
+    tmp_path: Path,
+) -> None:
+    # Sectors: VOB1 0-2, VOB2 empty, VOB3 3-6, VOB4 7-8.
+    paths = _write_vobs(tmp_path, [3, 0, 4, 2])
+    sizes = {path: path.stat().st_size for path in paths}
+    mappings = extract_stage._build_vob_sector_map(paths, sizes)
+    cases = [
+        [(0, 8)],
+        [(3, 3)],
+        [(2, 3)],
+        [(6, 7), (0, 0)],
+        [(8, 8), (8, 8)],
+        [(4, 5), (6, 8)],
+        [(9, 12)],
+    ]
+    for ranges in cases:
+        out_path = tmp_path / "out.bin"
+        with out_path.open("wb") as out_handle:
+            extract_stage._write_sector_ranges(out_handle, mappings, ranges)
+        clipped = [(start, min(end, 8)) for start, end in ranges]
+        assert out_path.read_bytes() == _expected_sectors(clipped), ranges
+
+
+def test_single_vob_span_returns_exclusive_byte_span(tmp_path: Path) -> None:
+    paths = _write_vobs(tmp_path, [3, 0, 4, 2])
+    sizes = {path: path.stat().st_size for path in paths}
+    mappings = extract_stage._build_vob_sector_map(paths, sizes)
+    span = extract_stage._single_vob_span
+
+    assert span(mappings, [(0, 2)]) == (paths[0], 0, 3 * 2048)
+    # The empty VOB shares its start sector with VOB3, which is the one used.
+    assert span(mappings, [(3, 4)]) == (paths[2], 0, 2 * 2048)
+    # Back-to-back cells count as one run.
+    assert span(mappings, [(4, 4), (5, 6)]) == (paths[2], 2048, 4 * 2048)
+    assert span(mappings, [(8, 8), (2, 1)]) == (paths[3], 2048, 2 * 2048)
+    # Crossing a VOB boundary, a gap, a repeated cell or the end of the
+    # last VOB needs the piped copy instead.
+    assert span(mappings, [(2, 3)]) is None
+    assert span(mappings, [(3, 3), (5, 5)]) is None
+    assert span(mappings, [(7, 7), (7, 7)]) is None
+    assert span(mappings, [(8, 9)]) is None
+    assert span(mappings, []) is None
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from dvdmenu_extract.backends.svcd_vcdimager import VcdImagerCliBackend
+from dvdmenu_extract.models.enums import ControlFile
 from dvdmenu_extract.models.svcd_nav import SvcdNavModel
+from dvdmenu_extract.models.vcd_nav import VcdNavModel
 from dvdmenu_extract.util.process import ProcessResult
 from tests.helpers import expected_dir
 
@@ -37,3 +41,35 @@ def test_svcd_backend_writes_artifacts(tmp_path: Path) -> None:
     assert (tmp_path / "raw" / "vcd-info.stdout.txt").is_file()
     assert (tmp_path / "raw" / "vcd-info.stderr.txt").is_file()
     assert len(nav.tracks) == 2
+
+
+@pytest.mark.parametrize("model_type", [SvcdNavModel, VcdNavModel])
+def test_control_files_roundtrip(model_type: type[SvcdNavModel | VcdNavModel]) -> None:
+    tracks = [{"track_no": 1, "file_name": "AVSEQ01.MPG"}]
+    # The shapes the directory and vcd-info backends write round-trip as is.
+    for control_files in (
+        {"info": True, "entries": True, "psd": False, "lot": True},
+        {},
+    ):
+        payload = {"control_files": control_files, "tracks": tracks}
+        nav = model_type.model_validate(payload)
+        dumped = nav.model_dump(mode="json")
+        assert dumped["control_files"] == control_files
+        assert model_type.model_validate(dumped) == nav
+    # Anything else is normalized: all four keys, or {} when nothing is set.
+    nav = model_type.model_validate(
+        {"control_files": {"info": True}, "tracks": tracks}
+    )
+    assert nav.control_files == ControlFile.INFO
+    assert nav.model_dump(mode="json")["control_files"] == {
+        "info": True,
+        "entries": False,
+        "psd": False,
+        "lot": False,
+    }
+    nav = model_type.model_validate(
+        {"control_files": {"info": False, "lot": False}, "tracks": tracks}
+    )
+    assert nav.model_dump(mode="json")["control_files"] == {}
+    with pytest.raises(ValueError, match="unknown control file"):
+        model_type.model_validate({"control_files": {"cdi": True}, "tracks": tracks})
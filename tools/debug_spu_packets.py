@@ -10,6 +10,7 @@ from dvdmenu_extract.util.libdvdread_spu import (
     parse_spu_control,
     decode_spu_bitmap,
     bitmap_connected_components,
+    count_non_zero_pixels,
 )
 from dvdmenu_extract.util.libdvdread_compat import read_u16
 
@@ -100,7 +101,7 @@ def main():
                 print(f"    Size: {bitmap.width}x{bitmap.height}")
                 
                 # Count non-zero pixels
-                non_zero = sum(1 for row in bitmap.pixels for px in row if px != 0)
+                non_zero = count_non_zero_pixels(bitmap)
                 print(f"    Non-zero pixels: {non_zero}/{bitmap.width*bitmap.height}")
                 
                 # Find connected components